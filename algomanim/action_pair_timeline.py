@@ -0,0 +1,206 @@
+from algomanim.fenwick_tree import FenwickTree
+
+
+# Appends fill chunks up to this size, inserts split chunks that grow past twice this size
+DEFAULT_CHUNK_SIZE = 256
+
+
+class TimelineChunk:
+
+    '''
+    Contiguous run of action pairs stored in an ActionPairTimeline
+
+    Args:
+        action_pairs (AlgoSceneActionPair[])
+        position (int): Position of this chunk in the timeline's list of chunks
+    '''
+
+    __slots__ = ('action_pairs', 'position')
+
+    def __init__(self, action_pairs, position):
+        self.action_pairs = action_pairs
+        self.position = position
+
+
+class ActionPairTimeline:
+
+    '''
+    Chronological sequence of AlgoSceneActionPairs, stored as a chunked rope so that
+    positional inserts and index lookups take logarithmic time
+    Supports the list operations used on AlgoScene.action_pairs (len, iteration, indexing,
+    slicing, insert, append, index)
+
+    Args:
+        action_pairs (AlgoSceneActionPair[]): Initial contents of the timeline
+        chunk_size (int): Number of action pairs per chunk when appending
+
+    Attributes:
+        chunks (TimelineChunk[]): Chunks of action pairs in chronological order
+        chunk_of (dict): Maps each action pair to the chunk containing it
+        chunk_lengths (FenwickTree): Length of every chunk, None if it needs to be rebuilt
+    '''
+
+    def __init__(self, action_pairs=(), chunk_size=DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.chunks = []
+        self.chunk_of = {}
+        self.chunk_lengths = None
+        self.length = 0
+        self.extend(action_pairs)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk.action_pairs
+
+    def __reversed__(self):
+        for chunk in reversed(self.chunks):
+            yield from reversed(chunk.action_pairs)
+
+    def __contains__(self, action_pair):
+        return action_pair in self.chunk_of
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.length)
+            if step != 1:
+                return list(self)[key]
+            return self.get_range(start, stop)
+
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError('timeline index out of range')
+        chunk, offset = self.locate(key)
+        return chunk.action_pairs[offset]
+
+    def get_range(self, start, stop):
+        ''' Returns the action pairs from index start up to (excluding) index stop '''
+        result = []
+        if start >= stop:
+            return result
+        chunk, offset = self.locate(start)
+        remaining = stop - start
+        for position in range(chunk.position, len(self.chunks)):
+            pairs = self.chunks[position].action_pairs
+            taken = pairs[offset:offset + remaining]
+            result += taken
+            remaining -= len(taken)
+            offset = 0
+            if remaining == 0:
+                break
+        return result
+
+    def index(self, action_pair):
+        ''' Returns the current index of action_pair, derived from its chunk's offset '''
+        chunk = self.chunk_of.get(action_pair)
+        if chunk is None:
+            raise ValueError('action pair is not in timeline')
+        return self.get_chunk_lengths().prefix_sum(chunk.position) + \
+            chunk.action_pairs.index(action_pair)
+
+    def append(self, action_pair):
+        if not self.chunks or len(self.chunks[-1].action_pairs) >= self.chunk_size:
+            chunk = TimelineChunk([], len(self.chunks))
+            self.chunks.append(chunk)
+            if self.chunk_lengths is not None:
+                self.chunk_lengths.append(0)
+
+        chunk = self.chunks[-1]
+        chunk.action_pairs.append(action_pair)
+        self.chunk_of[action_pair] = chunk
+        self.length += 1
+        if self.chunk_lengths is not None:
+            self.chunk_lengths.add(chunk.position, 1)
+
+    def extend(self, action_pairs):
+        for action_pair in action_pairs:
+            self.append(action_pair)
+
+    def insert(self, index, action_pair):
+        ''' Inserts action_pair before index, following list.insert semantics '''
+        index = self.clamp_index(index)
+        if index == self.length:
+            self.append(action_pair)
+            return
+
+        chunk, offset = self.locate(index)
+        chunk.action_pairs.insert(offset, action_pair)
+        self.chunk_of[action_pair] = chunk
+        self.length += 1
+
+        if len(chunk.action_pairs) > 2 * self.chunk_size:
+            self.split(chunk)
+        else:
+            self.chunk_lengths.add(chunk.position, 1)
+
+    def insert_many(self, insertions):
+        '''
+        Inserts (index, action_pair) tuples, where every index refers to the timeline before
+        any of them are inserted and action pairs sharing an index keep their given order
+        A few insertions are made one at a time, otherwise all insertions are merged into
+        the timeline in a single pass
+        '''
+        insertions = sorted(((self.clamp_index(index), action_pair)
+                             for index, action_pair in insertions),
+                            key=lambda insertion: insertion[0])
+
+        if len(insertions) < len(self.chunks):
+            # inserting from the back keeps the indexes of earlier insertions valid
+            for index, action_pair in reversed(insertions):
+                self.insert(index, action_pair)
+            return
+
+        merged = []
+        next_insertion = 0
+        for index, action_pair in enumerate(self):
+            while next_insertion < len(insertions) and insertions[next_insertion][0] == index:
+                merged.append(insertions[next_insertion][1])
+                next_insertion += 1
+            merged.append(action_pair)
+        merged += [action_pair for _, action_pair in insertions[next_insertion:]]
+
+        self.rebuild(merged)
+
+    def rebuild(self, action_pairs):
+        ''' Replaces the contents of the timeline with action_pairs '''
+        self.chunks = []
+        self.chunk_of = {}
+        self.chunk_lengths = None
+        self.length = 0
+        self.extend(action_pairs)
+
+    def clamp_index(self, index):
+        ''' Converts an insertion index to the position it inserts at, as list.insert does '''
+        if index is None or index > self.length:
+            return self.length
+        if index < 0:
+            return max(index + self.length, 0)
+        return index
+
+    def locate(self, index):
+        ''' Returns the chunk containing the given index and the offset within that chunk '''
+        position, offset = self.get_chunk_lengths().search(index)
+        return self.chunks[position], offset
+
+    def split(self, chunk):
+        ''' Moves the second half of an oversized chunk into a new chunk after it '''
+        half = len(chunk.action_pairs) // 2
+        new_chunk = TimelineChunk(chunk.action_pairs[half:], chunk.position + 1)
+        del chunk.action_pairs[half:]
+        for action_pair in new_chunk.action_pairs:
+            self.chunk_of[action_pair] = new_chunk
+
+        self.chunks.insert(new_chunk.position, new_chunk)
+        for position in range(new_chunk.position + 1, len(self.chunks)):
+            self.chunks[position].position = position
+
+        # chunk positions have shifted, rebuild the lengths on next lookup
+        self.chunk_lengths = None
+
+    def get_chunk_lengths(self):
+        if self.chunk_lengths is None:
+            self.chunk_lengths = FenwickTree(len(chunk.action_pairs) for chunk in self.chunks)
+        return self.chunk_lengths
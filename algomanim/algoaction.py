@@ -28,6 +28,8 @@ class AlgoTransform:
             if color_index is None, this transform does not have a color property
     '''
 
+    __slots__ = ('transform', 'args', 'color_index')
+
     def __init__(self, args, transform=None, color_index=None):
         self.transform = transform
         self.args = args
@@ -70,6 +72,8 @@ class AlgoSceneAction:
         is_wait (bool): If this action is a pause, and has a waiting time
     '''
 
+    __slots__ = ('act', 'transform', 'w_prev', 'can_set_runtime', 'is_wait')
+
     # pylint: disable=R0913
     def __init__(self, act, transform=None, w_prev=False, can_set_runtime=False, is_wait=False):
         self.act = act
@@ -90,13 +94,18 @@ class AlgoSceneAction:
 
     @staticmethod
     def create_empty_action(args=None):
-        ''' An empty filler action '''
-        args = args or []
+        ''' An empty filler action, shared by all callers if it has no args '''
+        if not args:
+            return EMPTY_ACTION
         return AlgoSceneAction.create_static_action(do_nothing, args)
 
     def get_args(self):
         return self.transform.args
 
+    def is_static(self):
+        ''' Static actions change the scene at once, without writing any frames '''
+        return self.act is do_nothing
+
     def can_set_color(self):
         if self.transform is not None:
             return self.transform.can_set_color()
@@ -119,6 +128,11 @@ class AlgoSceneAction:
         return []
 
 
+# Empty action without args, it is never modified so a single instance is shared
+EMPTY_ACTION = AlgoSceneAction(do_nothing, transform=AlgoTransform((), transform=do_nothing),
+                               w_prev=True, can_set_runtime=False)
+
+
 class AlgoSceneActionPair:
 
     '''
@@ -134,15 +148,18 @@ class AlgoSceneActionPair:
 
     Attributes:
         anim_block (AnimationBlock): Reference to the anim_block this action_pair belongs to
-        index (int): To store the index of action pair in a list of action_pairs
+        timeline (ActionPairTimeline): Timeline storing this action pair, its index is
+            derived from its position in the timeline
     '''
 
+    __slots__ = ('anim_action', 'static_action', 'run_time', 'anim_block', 'timeline')
+
     def __init__(self, anim_action, static_action=None, run_time=None):
         self.anim_action = anim_action
         self.static_action = static_action if static_action is not None else anim_action
         self.run_time = run_time
         self.anim_block = None
-        self.index = None
+        self.timeline = None
 
     def get_args(self):
         return self.curr_action().get_args()
@@ -150,11 +167,14 @@ class AlgoSceneActionPair:
     def attach_block(self, anim_block):
         self.anim_block = anim_block
 
-    def attach_index(self, index):
-        self.index = index
+    def attach_timeline(self, timeline):
+        self.timeline = timeline
 
     def get_index(self):
-        return self.index
+        if self.timeline is None:
+            return None
+
+        return self.timeline.index(self)
 
     def get_block(self):
         return self.anim_block
@@ -172,6 +192,7 @@ class AlgoSceneActionPair:
         return 1 if self.run_time is None else self.run_time
 
     def set_runtime(self, run_time):
+        ''' Sets the runtime of the animation, None for the runtime it is played with by default '''
         if not self.can_set_runtime() and run_time != 0:
             # action pair does not have runtime property
             return
@@ -180,11 +201,16 @@ class AlgoSceneActionPair:
             # action pair cannot be skipped
             return
 
-        if not isinstance(run_time, float) or not isinstance(run_time, int):
+        if run_time is not None and \
+                (not isinstance(run_time, float) or not isinstance(run_time, int)):
             run_time = float(run_time)
 
         self.run_time = run_time
 
+        if self.anim_block is not None:
+            # update the start times of later blocks
+            self.anim_block.update_runtime()
+
     def can_set_color(self):
         return self.anim_action.can_set_color() or \
             self.static_action.can_set_color()
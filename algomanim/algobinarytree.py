@@ -12,12 +12,11 @@ class AlgoBinaryTreeNode(AlgoNode):
         self.recursive_update_depth()
 
         super().__init__(scene, val)
-        if parent:
-            self.lines[parent] = Line(ORIGIN, ORIGIN, stroke_width=5, color=WHITE), None
 
     def set_parent(self, parent):
+        # the line to the parent is made when this node is shown
         self.parent = parent
-        self.lines[parent] = Line(ORIGIN, ORIGIN, stroke_width=5, color=WHITE), None
+        self.lines.pop(parent, None)
 
     def set_left(self, left):
         self.left = left
@@ -115,8 +114,10 @@ class AlgoBinaryTreeNode(AlgoNode):
                     self.get_x_pos(rightmost_id, max_depth)) / 2
         pos_y = (self.depth - 1) * ((float(self.scene.settings['node_size']) + 0.5) * DOWN)
 
-        self.grp.move_to(pos_x + pos_y)
+        self.place(pos_x + pos_y)
         if self.parent is not None:
+            if self.parent not in self.lines:
+                self.lines[self.parent] = Line(ORIGIN, ORIGIN, stroke_width=5, color=WHITE), None
             self.add_line(self.parent, metadata=metadata,
                                              animated=animated, w_prev=w_prev)
 
@@ -47,7 +47,7 @@ class AlgoGraph:
             for key in self.graph:
                 node = self.graph[key]
                 new_angle = angle*node.n_id
-                node.grp.move_to(3*np.array([np.cos(new_angle), np.sin(new_angle), 0]))
+                node.place(3*np.array([np.cos(new_angle), np.sin(new_angle), 0]))
 
     def show_nodes(self, metadata=None, animated=True, w_prev=False):
         for node_key in self.graph:
@@ -20,7 +20,8 @@ class AlgoList(AlgoObject):
 
     Attributes:
         nodes (AlgoNode[]): List of AlgoNodes created from the input values
-        grp (VGroup): A Manim VGroup of the Manim objects corresponding to the nodes
+        grp (VGroup): A Manim VGroup of the Manim objects corresponding to the nodes,
+            made when first used
     '''
 
     def __init__(self, scene, arr, show=True, displacement=None):
@@ -29,15 +30,16 @@ class AlgoList(AlgoObject):
         # Make and arrange nodes
         self.nodes = [AlgoNode(scene, val) for val in arr]
         self.displacement = ORIGIN if displacement is None else displacement
-        if displacement is not None and len(self.nodes) > 0:
-            self.nodes[0].grp.move_to(displacement)
-
-        for i in range(1, len(self.nodes)):
-            self.nodes[i].grp.next_to(self.nodes[i - 1].grp, RIGHT)
-
-        # Group nodes together
+        if len(self.nodes) > 0:
+            # positions of the mobjects made while planning, as if every label fitted in its
+            # node, the row is laid out from the real sizes of the nodes when the list is made
+            widths = [node.node_length for node in self.nodes]
+            for node, center in zip(self.nodes, AlgoList.row_centers(widths, self.displacement)):
+                node.place(center)
+
+        # Nodes are grouped together when grp is first used
         self.grp = None
-        self.group(immediate_effect=True)
+        AlgoList.align_nodes(self, 0, None)
 
         # Subscribe to the scene for scene transformations like Shifts
         scene.track_algoitem(self)
@@ -58,12 +60,19 @@ class AlgoList(AlgoObject):
 
     @attach_metadata
     def compare(self, i, j, metadata=None, animated=True, w_prev=False,
-                highlights=True, text=False):
-        ''' Compare two nodes at indexes i and j '''
+                highlights=True, text=False, untracked_fills=False):
+        '''
+        Compare two nodes at indexes i and j
+        Only the nodes highlighted by this list are dehighlighted, with untracked_fills every
+        node filled when the comparison runs is, for scenes whose customize() fills nodes
+        '''
         if highlights:
             # Add highlight animations
-            self.dehighlight(*list(range(len(self.nodes))),
-                             metadata=metadata, animated=animated, w_prev=w_prev)
+            if untracked_fills:
+                self.dehighlight_all(metadata=metadata, animated=animated, w_prev=w_prev)
+            else:
+                self.dehighlight(*self.highlighted_indexes(), metadata=metadata,
+                                 animated=animated, w_prev=w_prev)
             self.highlight(i, j, metadata=metadata, animated=animated, w_prev=w_prev)
         # Get nodes' values
         val1 = self.get_val(i)
@@ -78,24 +87,37 @@ class AlgoList(AlgoObject):
         return val1 < val2
 
 
+    @property
+    def grp(self):
+        if self._grp is None:
+            self.regroup()
+        return self._grp
+
+    @grp.setter
+    def grp(self, grp):
+        self._grp = grp
+
+    def regroup(self):
+        ''' Sets grp to a VGroup of the current nodes, repeated calls have no further effect '''
+        self.grp = VGroup(*[n.grp for n in self.nodes])
+
     def group(self, metadata=None, immediate_effect=False):
         ''' Restores the internal VGroup of list nodes, especially if the list has been edited '''
-        def group():
-            self.grp = VGroup(*[n.grp for n in self.nodes])
-
         # Update the VGroup of the list
         if immediate_effect:
-            group()
+            self.regroup()
         else:
 
-            dummy_action = AlgoSceneAction.create_static_action(group, [])
+            dummy_action = AlgoSceneAction.create_static_action(self.regroup, [])
             dummy_action_pair = self.scene.add_action_pair(dummy_action,
                                                            dummy_action, animated=False)
 
             # Not designed to be a Higher level func
             if metadata:
-                lower_meta = LowerMetadata.create(dummy_action_pair,
-                                                  [n.val for n in self.nodes], show_in_panel=False)
+                # values as planned, later changes to the list must not show in them
+                lower_meta = LowerMetadata('group', dummy_action_pair,
+                                           tuple(n.val for n in self.nodes),
+                                           show_in_panel=False)
                 metadata.add_lower(lower_meta)
 
     @attach_metadata
@@ -105,9 +127,11 @@ class AlgoList(AlgoObject):
             # empty list, nothing to do
             return
 
-        # Show all nodes in the list
-        for node in self.nodes:
-            node.show(metadata=metadata, animated=animated, w_prev=w_prev)
+        # Show all nodes in a single animation
+        grps = [node.grp for node in self.nodes]
+        AlgoObject.bulk_fn_w_prev(self.nodes, AlgoObject.fade_in_all, self.scene.add, grps,
+                                  'show', metadata=metadata, animated=animated, w_prev=w_prev,
+                                  show_in_panel=animated)
 
     @attach_metadata
     def hide_list(self, metadata=None, animated=True, w_prev=False):
@@ -116,9 +140,11 @@ class AlgoList(AlgoObject):
             # empty list, nothing to do
             return
 
-        # Hide all nodes in list at the same time
-        AlgoObject.loop_fn_w_prev(self.nodes, AlgoNode.hide,
-                                  animated=animated, metadata=metadata, init_w_prev=w_prev)
+        # Hide all nodes in a single animation
+        grps = [node.grp for node in self.nodes]
+        AlgoObject.bulk_fn_w_prev(self.nodes, AlgoObject.fade_out_all, self.scene.remove, grps,
+                                  'hide', metadata=metadata, animated=animated, w_prev=w_prev,
+                                  show_in_panel=animated)
 
         # Unsubscribe from the scene
         self.scene.untrack_algoitem(self)
@@ -126,20 +152,64 @@ class AlgoList(AlgoObject):
     @attach_metadata
     def highlight(self, *indexes, metadata=None, animated=True, w_prev=False):
         ''' Highlight nodes at the specified indexes '''
-        nodes_to_highlight = [self.nodes[i] for i in indexes]
-
-        # Highlight all nodes at the same time
-        AlgoObject.loop_fn_w_prev(nodes_to_highlight, AlgoNode.highlight,
-                                  animated=animated, metadata=metadata, init_w_prev=w_prev)
+        self.fill_nodes(indexes, 'highlight', metadata, animated, w_prev)
 
     @attach_metadata
     def dehighlight(self, *indexes, metadata=None, animated=True, w_prev=False):
         ''' Dehighlight nodes at the specified indexes '''
-        nodes_to_dehighlight = [self.nodes[i] for i in indexes]
+        self.fill_nodes(indexes, 'dehighlight', metadata, animated, w_prev)
 
-        # Dehighlight all nodes at the same time
-        AlgoObject.loop_fn_w_prev(nodes_to_dehighlight, AlgoNode.dehighlight,
-                                  animated=animated, metadata=metadata, init_w_prev=w_prev)
+    def fill_nodes(self, indexes, meta_name, metadata, animated, w_prev):
+        ''' Highlights or dehighlights nodes at the same time in a single animation '''
+        nodes = [self.nodes[i] for i in indexes]
+        if not nodes:
+            return
+
+        for node in nodes:
+            node.fill_color = node.highlight_color if meta_name == 'highlight' \
+                else node.node_color
+        color = nodes[0].fill_color
+        AlgoObject.bulk_fn_w_prev(nodes, AlgoObject.fill_all, AlgoObject.static_fill_all,
+                                  [color] + [node.node for node in nodes], meta_name,
+                                  metadata=metadata, animated=animated, w_prev=w_prev,
+                                  color_index=0)
+
+    @attach_metadata
+    def dehighlight_all(self, metadata=None, animated=True, w_prev=False):
+        '''
+        Dehighlight every node in a single animation, which only animates the nodes not in
+        their node color when it runs, as customize() can fill nodes after the list is
+        planned. Its action has every node, so dehighlight is used when the fills are known
+        The metadata only lists the nodes highlighted_indexes knows of
+        '''
+        if self.empty():
+            return
+
+        highlighted = [self.nodes[i] for i in self.highlighted_indexes()]
+        for node in self.nodes:
+            node.fill_color = node.node_color
+        args = [self.nodes[0].node_color] + [node.node for node in self.nodes]
+        anim_action = self.scene.create_play_action(
+            AlgoTransform(list(args), transform=AlgoObject.fill_changed, color_index=0),
+            w_prev=w_prev
+        )
+        static_action = AlgoSceneAction.create_static_action(AlgoObject.static_fill_all,
+                                                             list(args), color_index=0)
+        action_pair = self.scene.add_action_pair(anim_action, static_action, animated=animated)
+
+        for node in highlighted:
+            metadata.add_lower(LowerMetadata('dehighlight', action_pair, [node.val]))
+        if not highlighted:
+            metadata.add_lower(LowerMetadata('dehighlight', action_pair, [],
+                                             show_in_panel=False))
+
+    def highlighted_indexes(self):
+        '''
+        Returns the indexes of the nodes highlighted by the highlight and dehighlight actions
+        of this list and its nodes planned so far, fills added by other actions, like those of
+        chain_pin_highlight or add_transform in customize(), are not known (see dehighlight_all)
+        '''
+        return [i for i, node in enumerate(self.nodes) if node.is_highlighted()]
 
     def get_val(self, index):
         ''' Returns the value of the node at the given index '''
@@ -163,7 +233,7 @@ class AlgoList(AlgoObject):
         node = AlgoNode(self.scene, val)
 
         if self.empty():
-            node.grp.move_to(self.displacement)
+            node.place(self.displacement)
         else:
             node.set_next_to(self.nodes[-1], RIGHT, metadata=metadata)
 
@@ -217,26 +287,101 @@ class AlgoList(AlgoObject):
             metadata.add_lower(lower_meta)
 
     @staticmethod
-    def align_nodes_from_first_node(algolist, metadata, w_prev=False):
+    def row_centers(widths, anchor, anchor_index=0):
+        '''
+        Centres of a row of mobjects of widths, each placed next_to the one before it, the
+        mobject at anchor_index being centred on anchor
+        '''
+        widths = np.asarray(widths, dtype=float)
+        steps = (widths[:-1] + widths[1:]) / 2 + DEFAULT_MOBJECT_TO_MOBJECT_BUFFER
+        offsets = np.concatenate([[0], np.cumsum(steps)])
+        return anchor + np.outer(offsets - offsets[anchor_index], RIGHT)
+
+    @staticmethod
+    def row_middle(centers, widths):
+        ''' Centre of the bounding box of a row of mobjects of widths centred on centers '''
+        middle = (centers[0] + centers[-1]) / 2
+        middle[0] += (widths[-1] - widths[0]) / 4
+        return middle
+
+    # Static function of the align_nodes functions to be executed later
+    @staticmethod
+    def place_in_row(grps, anchor_index):
+        if len(grps) < 2:
+            return
+        widths = [grp.get_width() for grp in grps]
+        centers = AlgoList.row_centers(widths, grps[anchor_index].get_center(), anchor_index)
+        for grp, center in zip(grps, centers):
+            grp.move_to(center)
+
+    @staticmethod
+    def align_nodes(algolist, anchor_index, metadata):
+        '''
+        Lays the nodes out in a row around the node at anchor_index in a single static action,
+        the node positions are computed together from the node sizes when it runs
+        '''
+        if algolist.empty():
+            return
+
+        grps = [node.grp for node in algolist.nodes]
+        static_action = AlgoSceneAction.create_static_action(
+            AlgoList.place_in_row, [grps, anchor_index]
+        )
+        action_pair = algolist.scene.add_action_pair(static_action, static_action,
+                                                     animated=False)
+
+        if metadata:
+            lower_meta = LowerMetadata('align_nodes', action_pair, show_in_panel=False)
+            metadata.add_lower(lower_meta)
+
+    @staticmethod
+    def align_nodes_from_first_node(algolist, metadata, w_prev=False):  # pylint: disable=W0613
         '''
         Re-aligns nodes starting from the node at the start of the list
         No need for w_prev as it is currently non-animated
         '''
-        for i in range(1, algolist.len()):
-            algolist.nodes[i].set_next_to(algolist.nodes[i - 1], RIGHT,
-                                          metadata=metadata, animated=False,
-                                          w_prev=w_prev)
+        AlgoList.align_nodes(algolist, 0, metadata)
 
     @staticmethod
-    def align_nodes_from_last_node(algolist, metadata, w_prev=False):
+    def align_nodes_from_last_node(algolist, metadata, w_prev=False):  # pylint: disable=W0613
         '''
         Re-aligns nodes starting from the node at the end of the list
         No need for w_prev as it is currently non-animated
         '''
-        for i in reversed(range(0, algolist.len() - 1)):
-            algolist.nodes[i].set_next_to(algolist.nodes[i + 1], LEFT,
-                                          metadata=metadata, animated=False,
-                                          w_prev=w_prev)
+        AlgoList.align_nodes(algolist, algolist.len() - 1, metadata)
+
+    @staticmethod
+    def row_center_pt(grps, anchor_index, direction):
+        '''
+        Returns a pt_fn for move_to_calculated_pt giving the centre of a row of grps, whose grp
+        at anchor_index is placed next_to the first relative object at direction
+        '''
+        def pt_fn(_, relative_objs):
+            widths = [grp.get_width() for grp in grps]
+            anchor_grp = grps[anchor_index]
+            half_size = np.array([widths[anchor_index], anchor_grp.get_height(), 0]) / 2
+            anchor = relative_objs[0].grp.get_critical_point(direction) + \
+                direction * (DEFAULT_MOBJECT_TO_MOBJECT_BUFFER + half_size)
+            return AlgoList.row_middle(AlgoList.row_centers(widths, anchor, anchor_index),
+                                       widths)
+        return pt_fn
+
+    # Static function of merge placing the merged nodes' destinations to be executed later
+    @staticmethod
+    def place_merge_slots(slots, grps, left_list, right_list):
+        '''
+        Places slots where the row of grps is placed below the first node of left_list, centred
+        between left_list and right_list
+        '''
+        widths = [grp.get_width() for grp in grps]
+        first_grp = left_list.nodes[0].grp
+        anchor = first_grp.get_critical_point(DOWN) + \
+            (DEFAULT_MOBJECT_TO_MOBJECT_BUFFER + grps[0].get_height() / 2) * DOWN
+        centers = AlgoList.row_centers(widths, anchor)
+        centers[:, 0] += (left_list.grp.get_x() + right_list.grp.get_x()) / 2 - \
+            AlgoList.row_middle(centers, widths)[0]
+        for slot, slot_center in zip(slots, centers):
+            slot.move_to(slot_center)
 
     @attach_metadata
     def slice(self, start, stop, move=LEFT, metadata=None,
@@ -261,9 +406,8 @@ class AlgoList(AlgoObject):
 
         '''
         The sliced list is first aligned to its original position in the list.
-        The hidden list is positioned where the sliced list will end up,
-        and its center is used to define the movement of the sliced list.
-        Both slices are hidden from the screen during this process.
+        It is then moved to where a list placed next to the end of the slice would be,
+        that position is computed from the node size when the move is played.
         '''
 
         # Shift the scene up so that that we make space for the new list
@@ -278,20 +422,13 @@ class AlgoList(AlgoObject):
         sublist.nodes[0].set_next_to(self.nodes[start], 0, metadata=metadata)
         AlgoList.align_nodes_from_first_node(sublist, metadata=metadata)
 
-        hidden_sublist = AlgoList(self.scene,
-                                  [0 for _ in self.nodes][start:stop], show=False)
-
-        # Position hidden sliced list by taking reference from last element
-        hidden_sublist.nodes[-1].set_next_to(self.nodes[stop - 1], DOWN + move,
-                                             metadata=metadata)
-        AlgoList.align_nodes_from_last_node(hidden_sublist, metadata=metadata)
-
-        sublist.set_next_to(hidden_sublist, vector=0,
-                            panel_name="move_slice", specific_val=[n.val for n in sublist.nodes],
-                            metadata=metadata, animated=True)
-
-        # Get rid of hidden_sublist
-        hidden_sublist.hide_list(metadata=metadata, animated=False)
+        # Move it below the last element of the slice, towards move
+        pt_fn = AlgoList.row_center_pt([node.grp for node in sublist.nodes], sublist.len() - 1,
+                                       DOWN + move)
+        sublist.move_to_calculated_pt([self.nodes[stop - 1]], pt_fn=pt_fn,
+                                      panel_name="move_slice",
+                                      specific_val=[n.val for n in sublist.nodes],
+                                      metadata=metadata, animated=True)
 
         return sublist
 
@@ -332,19 +469,20 @@ class AlgoList(AlgoObject):
         left_list_copy.show(animated=False)
         right_list_copy.show(animated=False)
 
-        # create a hidden dummy list of the final length
+        # place the destination of every merged node between and below the two lists,
+        # only their positions are needed so they are not nodes
         left_len = left_list.len()
         right_len = right_list.len()
 
         final_len = left_len + right_len
-        hidden_merged_list = AlgoList(self.scene, [0 for _ in range(0, final_len)], show=False)
-
-        # arrange the hidden list between and below the two lists
-        hidden_merged_list.nodes[0].set_next_to(left_list_copy.nodes[0], DOWN,
-                                                metadata=metadata, animated=False)
-        AlgoList.align_nodes_from_first_node(hidden_merged_list, metadata=metadata)
-        hidden_merged_list.center_x([left_list_copy, right_list_copy],
-                                    metadata=metadata, animated=False)
+        slots = [VectorizedPoint() for _ in range(0, final_len)]
+        # the nodes in merged order, filled in below before any action runs
+        slot_grps = []
+        static_action = AlgoSceneAction.create_static_action(
+            AlgoList.place_merge_slots, [slots, slot_grps, left_list_copy, right_list_copy]
+        )
+        action_pair = self.scene.add_action_pair(static_action, static_action, animated=False)
+        metadata.add_lower(LowerMetadata('place_merge_slots', action_pair, show_in_panel=False))
 
         # show the merge by moving the copied nodes to the respective places
         left_index = 0
@@ -375,12 +513,14 @@ class AlgoList(AlgoObject):
 
             # highlight and move the node
             node_to_move.highlight(metadata=metadata, animated=animated)
-            node_to_move.set_next_to(hidden_merged_list.nodes[curr_index],
-                                     panel_name="merge_item", specific_val=[node_to_move.val],
-                                     vector=0, animated=animated, metadata=metadata)
+            AlgoObject.move_group_to_group(self.scene, node_to_move.grp, slots[curr_index],
+                                           panel_name="merge_item",
+                                           specific_val=[node_to_move.val],
+                                           animated=animated, metadata=metadata)
 
             # track the added value
             merged_list_vals.append(node_to_move.val)
+            slot_grps.append(node_to_move.grp)
 
             # increment curr_index
             curr_index += 1
@@ -388,7 +528,7 @@ class AlgoList(AlgoObject):
         if left_index == left_len and right_index != right_len:
             # left list was exhausted
             rem_right = VGroup(*[n.grp for n in right_list_copy.nodes[right_index:]])
-            rem_hidden = VGroup(*[n.grp for n in hidden_merged_list.nodes[curr_index:]])
+            rem_slots = VGroup(*slots[curr_index:])
 
             # highlight right slice
             right_list_copy.highlight(*range(right_index, right_len),
@@ -396,15 +536,16 @@ class AlgoList(AlgoObject):
 
             vals_to_move = [n.val for n in right_list_copy.nodes[right_index:]]
             merged_list_vals += vals_to_move
+            slot_grps += [n.grp for n in right_list_copy.nodes[right_index:]]
 
             # move it accordingly
-            AlgoObject.move_group_to_group(self.scene, rem_right, rem_hidden,
+            AlgoObject.move_group_to_group(self.scene, rem_right, rem_slots,
                                            panel_name="merge_rest", specific_val=vals_to_move,
                                            animated=animated, metadata=metadata)
         elif right_index == right_len and left_index != left_len:
             # right list was exhausted
             rem_left = VGroup(*[n.grp for n in left_list_copy.nodes[left_index:]])
-            rem_hidden = VGroup(*[n.grp for n in hidden_merged_list.nodes[curr_index:]])
+            rem_slots = VGroup(*slots[curr_index:])
 
             # highlight left slice
             left_list_copy.highlight(*range(left_index, left_len),
@@ -412,23 +553,23 @@ class AlgoList(AlgoObject):
 
             vals_to_move = [n.val for n in left_list_copy.nodes[left_index:]]
             merged_list_vals += vals_to_move
+            slot_grps += [n.grp for n in left_list_copy.nodes[left_index:]]
 
             # move it accordingly
-            AlgoObject.move_group_to_group(self.scene, rem_left, rem_hidden,
+            AlgoObject.move_group_to_group(self.scene, rem_left, rem_slots,
                                            panel_name="merge_rest", specific_val=vals_to_move,
                                            animated=animated, metadata=metadata)
 
         # silently create the final merged list and arrange it
         merged_list = AlgoList(self.scene, merged_list_vals, show=False)
-        merged_list.set_next_to(hidden_merged_list, vector=0,
-                                metadata=metadata)
+        AlgoObject.move_group_to_group(self.scene, merged_list.grp, VGroup(*slots),
+                                       metadata=metadata, animated=False)
 
         # show the final merged list and hide the list copies
         merged_list.show(metadata=metadata, animated=False)
 
         left_list_copy.hide_list(metadata=metadata, animated=False)
         right_list_copy.hide_list(metadata=metadata, animated=False)
-        hidden_merged_list.hide_list(metadata=metadata, animated=False)
 
         if replace:
             merged_list.replace(left_list, right_list,
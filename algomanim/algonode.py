@@ -16,8 +16,11 @@ class AlgoNode(AlgoObject):
     Attributes:
         node_color (string): Color text describing the fill color of this node
         highlight_color (string): Color text describing how this node is highlighted
+        fill_color (string): Fill color this node has after its highlight and dehighlight
+            actions planned so far, fills of other actions are not tracked
         node_length (float): Length used to size this node's shape
-        node: Manim Shape containing this node's value
+        position (np.array): Point the node is placed at once its mobjects are made
+        node: Manim Shape containing this node's value, made when node, txt or grp is first used
     '''
 
     def __init__(self, scene, val):
@@ -27,42 +30,89 @@ class AlgoNode(AlgoObject):
         # Use preconfig settings to determine node configuration
         self.node_color = scene.settings['node_color']
         self.highlight_color = scene.settings['highlight_color']
+        self.fill_color = self.node_color
         node_size = float(scene.settings['node_size'])
         self.node_length = node_size
-        nodes = {
-            'circle': Circle(
+
+        # Set attributes
+        self.lines = {}
+        self.val = val
+        scene.request_text(str(val), for_node=True, scale=self.text_scale())
+        # Mobjects are only made when first used, at the position last given to place
+        self.position = None
+        self._node = None
+        self._txt = None
+
+    @property
+    def node(self):
+        if self._node is None:
+            self.build_mobjects()
+        return self._node
+
+    @property
+    def txt(self):
+        if self._txt is None:
+            self.build_mobjects()
+        return self._txt
+
+    @txt.setter
+    def txt(self, txt):
+        self._txt = txt
+
+    @property
+    def grp(self):
+        if self._grp is None:
+            self.build_mobjects()
+        return self._grp
+
+    @grp.setter
+    def grp(self, grp):
+        self._grp = grp
+
+    def build_mobjects(self):
+        ''' Makes the shape, text and VGroup of this node '''
+        self._node = self.create_shape()
+        self._txt = self.generate_text(self.val)
+        self._grp = VGroup(self._node, self._txt)
+        if self.position is not None:
+            self._grp.move_to(self.position)
+
+    def create_shape(self):
+        ''' Makes the Manim shape configured by the node_shape setting '''
+        node_shape = self.scene.settings['node_shape'].lower()
+        if node_shape == 'circle':
+            return Circle(
                 color=self.node_color,
                 fill_opacity=1,
                 radius=self.node_length / 2,
-            ),
-            'square': Square(
-                fill_color=self.node_color,
-                fill_opacity=1,
-                side_length=self.node_length
-            ),
-            'squircle': RoundedRectangle(
+            )
+        if node_shape == 'squircle':
+            return RoundedRectangle(
                 height=self.node_length,
                 width=self.node_length,
                 fill_color=self.node_color,
                 fill_opacity=1
             )
-        }
-        try:
-            self.node = nodes[scene.settings['node_shape'].lower()]
-        except KeyError:
+        if node_shape != 'square':
             print("Unrecognized node shape, defaulting to Square")
-            self.node = nodes['square']
+        return Square(
+            fill_color=self.node_color,
+            fill_opacity=1,
+            side_length=self.node_length
+        )
 
-        # Set attributes
-        self.lines = {}
-        self.val = val
-        self.txt = self.generate_text(val)
-        self.grp = VGroup(self.node, self.txt)
+    def place(self, point):
+        ''' Moves this node to point, without making its mobjects if they are not used yet '''
+        if self._grp is None:
+            self.position = point
+        else:
+            self._grp.move_to(point)
 
     def generate_text(self, val):
-        text = self.scene.create_text(str(val), for_node=True)
-        text.scale(self.node_length * 1.5)
-        return text
+        return self.scene.create_text(str(val), for_node=True, scale=self.text_scale())
+
+    def text_scale(self):
+        return self.node_length * 1.5
 
     def static_replace_text(self, old_text, new_text):
         new_text.move_to(old_text.get_center())
@@ -99,8 +149,12 @@ class AlgoNode(AlgoObject):
         lower_meta = LowerMetadata.create(action_pair, [self.val])
         metadata.add_lower(lower_meta)
 
+    def is_highlighted(self):
+        return self.fill_color != self.node_color
+
     @attach_metadata
     def highlight(self, metadata=None, animated=True, w_prev=False):
+        self.fill_color = self.highlight_color
         # Create action pair
         anim_action = self.scene.create_play_action(
             AlgoTransform([self.node.set_fill, self.highlight_color], transform=ApplyMethod,
@@ -116,6 +170,7 @@ class AlgoNode(AlgoObject):
 
     @attach_metadata
     def dehighlight(self, metadata=None, animated=True, w_prev=False):
+        self.fill_color = self.node_color
         # Create action pair
         anim_action = self.scene.create_play_action(
             AlgoTransform([self.node.set_fill, self.node_color], transform=ApplyMethod,
@@ -5,6 +5,15 @@ from algomanim.algoaction import AlgoTransform, AlgoSceneAction
 from algomanim.metadata import LowerMetadata, attach_metadata
 
 
+class MemberGroup(VGroup):
+
+    '''
+    VGroup of mobjects already in the scene, letting them be animated as one
+    AlgoScene animates its members where they are drawn instead of adding the group on top,
+    and removes its members when an animation removes the group
+    '''
+
+
 class AlgoObject(ABC):
 
     '''
@@ -23,11 +32,21 @@ class AlgoObject(ABC):
         self.scene = scene
         # Every object has a grp
         self.grp = None
-        # Custom texts associated with this obj
-        self.text = {' ': TexMobject(' ')}
+        # Custom texts associated with this obj, made when first used
+        self._text = None
         # Optional to have a val
         self.val = None
 
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = {' ': TexMobject(' ')}
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        self._text = text
+
     ''' Set obj position next to the given obj at vector side '''
     @attach_metadata
     def set_next_to(self, obj, vector, panel_name=None, specific_val=None,
@@ -217,7 +236,7 @@ class AlgoObject(ABC):
                 metadata.add_lower(lower_meta)
                 del self.text[k]
             # Reset text attribute
-            self.text = {" ": TexMobject(" ")}
+            self.text = None
         # Else if key exists
         elif key in self.text:
             # Create hide action pair
@@ -246,7 +265,7 @@ class AlgoObject(ABC):
             )
         )
         static_action = AlgoSceneAction.create_static_action(
-            function=lambda grp: AlgoTransform(grp.move_to, move_pt()),
+            function=lambda grp: grp.move_to(move_pt()),
             args=[grp_start]
         )
         action_pair = scene.add_action_pair(anim_action, static_action, animated=animated)
@@ -306,6 +325,49 @@ class AlgoObject(ABC):
 
         metadata.add_lower(lower_meta)
 
+    ''' Applies an animation to a list of objects as a single action pair, anim_fn and static_fn
+    are called with args, and each object gets a LowerMetadata entry named meta_name '''
+    @staticmethod
+    def bulk_fn_w_prev(objs, anim_fn, static_fn, args, meta_name, metadata, animated, w_prev,
+                       color_index=None, show_in_panel=True):
+        scene = objs[0].scene
+        anim_action = scene.create_play_action(
+            AlgoTransform(list(args), transform=anim_fn, color_index=color_index), w_prev=w_prev
+        )
+        static_action = AlgoSceneAction.create_static_action(static_fn, list(args),
+                                                             color_index=color_index)
+        action_pair = scene.add_action_pair(anim_action, static_action, animated=animated)
+
+        # every object is still listed, customising one of them customises all
+        for obj in objs:
+            lower_meta = LowerMetadata(meta_name, action_pair, [obj.val],
+                                       show_in_panel=show_in_panel)
+            metadata.add_lower(lower_meta)
+
+    # Animations and static functions of bulk_fn_w_prev, groups are only made when they run
+    @staticmethod
+    def fade_in_all(*mobjects):
+        return FadeIn(VGroup(*mobjects))
+
+    @staticmethod
+    def fade_out_all(*mobjects):
+        return FadeOut(MemberGroup(*mobjects))
+
+    @staticmethod
+    def fill_all(color, *mobjects):
+        return ApplyMethod(MemberGroup(*mobjects).set_fill, color)
+
+    @staticmethod
+    def fill_changed(color, *mobjects):
+        ''' fill_all of the mobjects whose fill is not color when the animation is made '''
+        return AlgoObject.fill_all(color, *[mobject for mobject in mobjects
+                                            if mobject.get_fill_color() != Color(color)])
+
+    @staticmethod
+    def static_fill_all(color, *mobjects):
+        for mobject in mobjects:
+            mobject.set_fill(color)
+
     ''' Applies a function to a list of objects such that the animation takes place at the same time
     for all objects '''
     @staticmethod
@@ -1,15 +1,26 @@
-# pylint: disable=R0914, W0122, W0105, R0904
+# pylint: disable=R0914, W0122, W0105, R0904, R0902
 import ast
 import inspect
 import re
+from bisect import bisect_left
 from collections import namedtuple
+from contextlib import contextmanager
 from manimlib.imports import *
 from algomanim.settings import DEFAULT_SETTINGS
 from algomanim.algoaction import AlgoTransform, AlgoSceneAction, AlgoSceneActionPair, \
     fade_in_transform, fade_out_transform
+from .action_pair_timeline import ActionPairTimeline
 from .animation_block import AnimationBlock
+from .block_timings import BlockTimings
 from .metadata_block import MetadataBlock
-from .metadata import Metadata, LowerMetadata
+from .metadata_block_index import MetadataBlockIndex
+from .metadata import Metadata, LowerMetadata, MetadataIndex
+from .algoobject import MemberGroup
+from .peephole import optimize_action_pairs
+from .label_cache import LabelCache
+from .glyph_atlas import GlyphAtlas, ATLAS_PREFIX
+from .frame_regions import pixel_transform, pixel_bounds, intersecting
+from .dirty_rect_camera import DirtyRectCamera
 
 
 # ----- Utility funnctions used for show_code ----- #
@@ -46,7 +57,15 @@ class AlgoScene(MovingCameraScene):
 
     Args:
         **kwargs: Variable arguments passed to the Manim Scene superclass
-            Receives post_customize_fns and post_config_settings which are set from the GUI
+            Receives post_customize_fns and post_config_settings which are set from the GUI,
+            block_cache to reuse the videos of unchanged blocks from an earlier render and
+            checkpoints to start rendering at the first changed block.
+            render_chunk (index, count) renders only the index-th of count parts of the video.
+            plan_only creates the blocks and metadata of the scene without rendering it.
+            on_plan is called with the scene once its blocks and metadata exist, before they
+            are rendered.
+            label_cache is a LabelCache shared between scenes, each scene has its own otherwise.
+            tex_batch is a TexBatch compiling the LaTeX of requested texts together
 
     Attributes:
         settings (dict): General scene settings to be configured in preconfig()
@@ -54,10 +73,37 @@ class AlgoScene(MovingCameraScene):
         algo_objs (AlgoObject[]): Tracker for all items in the scene
         post_customize_fns (function[]): GUI-generated animation customizations
         post_config_settings (dict): GUI-generated configuration settings
-        action_pairs (AlgoSceneActionPair[]): Chronological list of scene actions
+        action_pairs (ActionPairTimeline): Chronological sequence of scene actions
         anim_blocks (AnimationBlock[]): action_pairs organized into AnimationBlocks
+        block_timings (BlockTimings): Runtimes of anim_blocks, giving their start times
         meta_trees (Metadata[]): Information corresponding to each action_pair
+        meta_index (MetadataIndex): Lookup tables over meta_trees used to find action_pairs
         metadata_block (MetadataBlock[]): meta_trees organized into MetadataBlocks
+        metadata_block_index (MetadataBlockIndex): Finds the metadata_blocks active at a
+            position in the video
+        batch_insertions ([]): (index, action_pair) insertions collected by an open batch(),
+            None if no batch is open
+        batch_metadata (Metadata[]): Metadata collected by an open batch()
+        block_cache (BlockVideoCache): Cache of rendered anim_blocks, None to render all
+        checkpoints (SceneCheckpoints): States of the scene during the last render, only
+            used with a block_cache
+        render_chunk ((int, int)): Part of the video rendered by this scene, None for all
+        chunk_plays (range): Numbers of the plays rendered by this scene, set once
+            anim_blocks are created
+        plan_only (bool): If anim_blocks are never run, so no frames or movies are written
+        on_plan (function): Called with the scene before its anim_blocks are run, None if
+            nothing waits for the timeline
+        optimization_report (PeepholeReport): What the optimization pass enabled by the
+            optimize_actions setting eliminated, None if it did not run
+        label_cache (LabelCache): Memoized texts returned by create_text
+        tex_batch (TexBatch): Compiles the LaTeX of the texts requested with request_text,
+            None to leave every text to manim
+        glyph_atlases (dict): GlyphAtlas of every atlas font used by create_text, by
+            (font, font_color)
+        background_layer (BackgroundLayer): Keeps the raster of the mobjects still during a
+            play for the next plays, None to draw it whole for every play
+        frame_pool (FramePool): Draws the frames of long plays in parallel, None to draw every
+            frame in this process
     '''
 
     def __init__(self, **kwargs):
@@ -67,11 +113,33 @@ class AlgoScene(MovingCameraScene):
         self.kwargs = kwargs
         self.post_customize_fns = kwargs.get('post_customize_fns', [])
         self.post_config_settings = kwargs.get('post_config_settings', {})
-        self.action_pairs = []
+        self.action_pairs = ActionPairTimeline()
         self.anim_blocks = []
+        self.block_timings = BlockTimings()
         self.meta_trees = []
+        self.meta_index = MetadataIndex()
         self.metadata_blocks = []
-
+        self.metadata_block_index = None
+        self.batch_insertions = None
+        self.batch_metadata = []
+        self.block_cache = kwargs.get('block_cache')
+        self.checkpoints = kwargs.get('checkpoints')
+        self.render_chunk = kwargs.get('render_chunk')
+        self.chunk_plays = None
+        self.plan_only = kwargs.get('plan_only', False)
+        self.on_plan = kwargs.get('on_plan')
+        self.optimization_report = None
+        self.label_cache = kwargs.get('label_cache')
+        if self.label_cache is None:
+            self.label_cache = LabelCache()
+        self.tex_batch = kwargs.get('tex_batch')
+        self.glyph_atlases = {}
+        self.background_layer = kwargs.get('background_layer')
+        self.frame_pool = kwargs.get('frame_pool')
+
+        if self.plan_only:
+            kwargs['file_writer_config'] = {**kwargs.get('file_writer_config', {}),
+                                            'write_to_movie': False, 'save_last_frame': False}
         MovingCameraScene.__init__(self, **kwargs)
 
     # ---------- Algorithm default creation ----------- #
@@ -123,20 +191,16 @@ class AlgoScene(MovingCameraScene):
     def find_action_pairs(self, metadata_name, occurence=None, lower_level=None,
                           w_children=True):
         action_pairs = []
-        for meta_tree in self.meta_trees:
-            if metadata_name == meta_tree.meta_name and\
-                    (occurence is None or occurence == meta_tree.fid):
-                if lower_level:
-                    for lower in meta_tree.children:
-                        if lower_level == lower.meta_name:
-                            action_pairs.append(lower.action_pair)
-                elif w_children:
-                    # if w_children is True, add all action_pairs of this metadata
-                    for action_pair in meta_tree.get_all_action_pairs():
-                        action_pairs.append(action_pair)
-                else:
-                    # else, add only the first action_pair of this metadata
-                    action_pairs.append(meta_tree.get_all_action_pairs()[0])
+        for meta_tree in self.meta_index.find(metadata_name, occurence):
+            if lower_level:
+                for lower in meta_tree.find_lower(lower_level):
+                    action_pairs.append(lower.action_pair)
+            elif w_children:
+                # if w_children is True, add all action_pairs of this metadata
+                action_pairs += meta_tree.get_all_action_pairs()
+            else:
+                # else, add only the first action_pair of this metadata
+                action_pairs.append(meta_tree.children[0].action_pair)
         return action_pairs
 
     # ----------- AlgoObject customisability ---------
@@ -157,13 +221,14 @@ class AlgoScene(MovingCameraScene):
             ApplyMethod(node.node.set_fill, highlight_color)
         node_dehighlight = lambda node: \
             ApplyMethod(node.node.set_fill, self.settings['node_color'])
-        for pin in pins:
-            if len(pin.get_args()) > 0:
-                node = pin.get_args()[0]
-                self.add_transform(pin.get_index(), node_highlight, [node])
-                if dehighlight and prev_node is not None:
-                    self.add_transform(pin.get_index() + 1, node_dehighlight, [prev_node])
-                prev_node = node
+        with self.batch():
+            for pin in pins:
+                if len(pin.get_args()) > 0:
+                    node = pin.get_args()[0]
+                    self.add_transform(pin.get_index(), node_highlight, [node])
+                    if dehighlight and prev_node is not None:
+                        self.add_transform(pin.get_index(), node_dehighlight, [prev_node])
+                    prev_node = node
 
     def chain_pin_highlight_line(self, pin_str, highlight_color=None, dehighlight=True):
         ''' chain_pin_highlight of lines between nodes (graphs/trees) '''
@@ -177,24 +242,26 @@ class AlgoScene(MovingCameraScene):
             ApplyMethod(node.lines[edge][0].set_stroke, highlight_color)
         line_dehighlight = lambda node, edge: \
             ApplyMethod(node.lines[edge][0].set_stroke, self.settings['line_color'])
-        for pin in pins:
-            node = pin.get_args()[0]
-            edge = pin.get_args()[1]
-            self.add_transform(pin.get_index(), line_highlight, [node, edge])
-            if dehighlight and prev_node is not None:
-                self.add_transform(pin.get_index() + 1, line_dehighlight, [prev_node, prev_edge])
-                prev_node = node
-                prev_edge = edge
+        with self.batch():
+            for pin in pins:
+                node = pin.get_args()[0]
+                edge = pin.get_args()[1]
+                self.add_transform(pin.get_index(), line_highlight, [node, edge])
+                if dehighlight and prev_node is not None:
+                    self.add_transform(pin.get_index(), line_dehighlight, [prev_node, prev_edge])
+                    prev_node = node
+                    prev_edge = edge
 
     def chain_pin_dehighlight_line(self, pin_str):
         pins = self.find_pin(pin_str)
 
         line_dehighlight = lambda node, edge: \
             ApplyMethod(node.lines[edge][0].set_stroke, self.settings['line_color'])
-        for pin in pins:
-            node = pin.get_args()[0]
-            edge = pin.get_args()[1]
-            self.add_transform(pin.get_index(), line_dehighlight, [node, edge])
+        with self.batch():
+            for pin in pins:
+                node = pin.get_args()[0]
+                edge = pin.get_args()[1]
+                self.add_transform(pin.get_index(), line_dehighlight, [node, edge])
 
 
     # ------------ Text customizability --------------
@@ -212,24 +279,68 @@ class AlgoScene(MovingCameraScene):
         self.add_transform(index, transform)
         return text
 
-    def create_text(self, text_string, for_node=False):
+    def text_key(self, text_string, for_node=False, scale=1):
+        ''' Key of a text in the label_cache, its font is latex for TextMobjects '''
+        font_key = 'node_font' if for_node else 'text_font'
+        color_key = 'node_font_color' if for_node else 'text_font_color'
+        return (text_string, self.settings[font_key].lower(), self.settings[color_key], scale)
+
+    def request_text(self, text_string, for_node=False, scale=1):
+        '''
+        Announces a text that create_text will be asked for, so that with a tex_batch the LaTeX
+        of every text requested is compiled together when the first of them is created
+        '''
+        key = self.text_key(text_string, for_node, scale)
+        if self.tex_batch is not None and key[1] == 'latex' and not self.label_cache.has(key):
+            self.tex_batch.request_text(text_string)
+
+    def create_text(self, text_string, for_node=False, scale=1):
         '''
         Factory method to return a Text-kind object depending on the current configuration.
         Defaults to the manim-configured default font if configuration does not describe
         a valid installed font.
+        Fonts starting with 'atlas:' lay the text out from the glyphs of the font after it,
+        which are only made once (see GlyphAtlas).
+        Other texts are copied from the label_cache when the same text was created before.
 
         Args:
             text_string (str): The text to create
             for_node (bool): To use the node font configuration
+            scale (float): Factor the text is scaled by
         '''
-        font_key = 'node_font' if for_node else 'text_font'
-        color_key = 'node_font_color' if for_node else 'text_font_color'
-        font = self.settings[font_key].lower()
-        font_color = self.settings[color_key]
+        key = self.text_key(text_string, for_node, scale)
+        _, font, font_color, _ = key
+        if font.startswith(ATLAS_PREFIX):
+            # laying a label out from its glyphs costs about as much as copying it
+            return self.glyph_atlas(font, font_color).make_label(text_string, scale)
+
+        def make_text():
+            text = self.make_text_mobject(text_string, font, font_color)
+            if scale != 1:
+                text.scale(scale)
+            return text
+
+        return self.label_cache.get(key, make_text)
+
+    def make_text_mobject(self, text_string, font, font_color):
+        ''' Makes the TextMobject of text_string if font is latex, its Text otherwise '''
         if font == 'latex':
+            if self.tex_batch is not None:
+                self.tex_batch.request_text(text_string)
+                self.tex_batch.compile_pending()
             return TextMobject(text_string, color=font_color)
         return Text(text_string, color=font_color, font=font)
 
+    def glyph_atlas(self, font, font_color):
+        ''' Returns the GlyphAtlas of an atlas font and colour, made when first used '''
+        atlas = self.glyph_atlases.get((font, font_color))
+        if atlas is None:
+            glyph_font = font[len(ATLAS_PREFIX):]
+            atlas = GlyphAtlas(lambda text_string: self.make_text_mobject(
+                text_string, glyph_font, font_color))
+            self.glyph_atlases[(font, font_color)] = atlas
+        return atlas
+
     def change_text(self, new_text_string, old_text_object=None, index=0, position=ORIGIN):
         '''
         Edit existing text objects via Manim's ReplacementTransform
@@ -266,12 +377,13 @@ class AlgoScene(MovingCameraScene):
         codeindex_pins = self.find_pin('__codeindex__')
         relevant_pins = list(filter(lambda pin: pin.get_args()[0] == linenum, codeindex_pins))
         old_text = None
-        for i, pin in enumerate(relevant_pins):
-            index = pin.get_index()
-            new_text = (custom_text + f'{i+1}') \
-                if custom_text \
-                   else f'Line {linenum} called: {i + 1} times'
-            old_text = self.change_text(new_text, old_text, index=index, position=position)
+        with self.batch():
+            for i, pin in enumerate(relevant_pins):
+                index = pin.get_index()
+                new_text = (custom_text + f'{i+1}') \
+                    if custom_text \
+                       else f'Line {linenum} called: {i + 1} times'
+                old_text = self.change_text(new_text, old_text, index=index, position=position)
 
     def add_complexity_analysis_fn(self, fn_method, position=2 * DOWN, custom_text=None):
         '''
@@ -279,12 +391,13 @@ class AlgoScene(MovingCameraScene):
         '''
         action_pairs = self.find_action_pairs(metadata_name=fn_method, w_children=False)
         old_text = None
-        for i, pin in enumerate(action_pairs):
-            index = pin.get_index()
-            new_text = (custom_text+f'{i+1}') \
-                if custom_text \
-                else f'{fn_method} called: {i + 1} times'
-            old_text = self.change_text(new_text, old_text, index=index, position=position)
+        with self.batch():
+            for i, pin in enumerate(action_pairs):
+                index = pin.get_index()
+                new_text = (custom_text+f'{i+1}') \
+                    if custom_text \
+                    else f'{fn_method} called: {i + 1} times'
+                old_text = self.change_text(new_text, old_text, index=index, position=position)
 
     def shift_scene(self, vector, metadata=None, w_prev=False):
         ''' Shifts all TRACKED objects in the scene by some vector '''
@@ -314,11 +427,12 @@ class AlgoScene(MovingCameraScene):
             action_pair.fast_forward(speed_up)
 
     def add_slide(self, text, index, text_position=ORIGIN, duration=1):
-        self.add_fade_out_all(index)
-        text_anim = self.add_text(text, index + 1, position=text_position)
-        self.add_wait(index + 2, wait_time=duration)
-        self.remove_text(text_anim, index + 3)
-        self.add_fade_in_all(index + 4)
+        with self.batch():
+            self.add_fade_out_all(index)
+            text_anim = self.add_text(text, index, position=text_position)
+            self.add_wait(index, wait_time=duration)
+            self.remove_text(text_anim, index)
+            self.add_fade_in_all(index)
 
     def add_fade_out_all(self, index):
         anim_action = self.create_play_action(AlgoTransform([self], transform=fade_out_transform))
@@ -389,17 +503,18 @@ class AlgoScene(MovingCameraScene):
         return pair
 
     def insert_action_pair(self, action_pair, index=None):
-        if index is not None:
-            self.push_back_action_pair_indices(index)
+        if self.batch_insertions is not None:
+            # index refers to action_pairs as they were when the batch was opened
+            self.batch_insertions.append((index, action_pair))
+            return
+
+        # indexes of later action pairs are derived from the timeline, so they need no update
+        if index is None:
+            self.action_pairs.append(action_pair)
         else:
-            index = len(self.action_pairs)
+            self.action_pairs.insert(index, action_pair)
 
-        action_pair.attach_index(index)
-        self.action_pairs.insert(index, action_pair)
-
-    def push_back_action_pair_indices(self, index):
-        for action_pair in self.action_pairs[index:]:
-            action_pair.attach_index(action_pair.get_index() + 1)
+        action_pair.attach_timeline(self.action_pairs)
 
     def add_static(self, index, static_fn, args=[], metadata=None):  # pylint: disable=W0102
         static_action = AlgoSceneAction.create_static_action(static_fn, args)
@@ -415,7 +530,61 @@ class AlgoScene(MovingCameraScene):
             self.add_metadata(metadata)
 
     def add_metadata(self, metadata):
+        if self.batch_insertions is not None:
+            self.batch_metadata.append(metadata)
+            return
+
         self.meta_trees.append(metadata)
+        self.meta_index.add(metadata)
+
+    @contextmanager
+    def batch(self):
+        '''
+        Collects the action pairs and metadata added inside the context and inserts them
+        together on exit, merging them into action_pairs in a single pass
+        Indexes passed inside the context refer to action_pairs as they were when the batch
+        was opened, action pairs inserted at the same index keep the order they were added in
+        Nothing is inserted if the context raises, nested batches are committed by the
+        outermost one
+        '''
+        if self.batch_insertions is not None:
+            insertions_start = len(self.batch_insertions)
+            metadata_start = len(self.batch_metadata)
+            try:
+                yield self
+            except BaseException:
+                del self.batch_insertions[insertions_start:]
+                del self.batch_metadata[metadata_start:]
+                raise
+            return
+
+        self.batch_insertions = []
+        try:
+            yield self
+            insertions, metadata = self.batch_insertions, self.batch_metadata
+        finally:
+            self.batch_insertions = None
+            self.batch_metadata = []
+
+        self.action_pairs.insert_many(insertions)
+        for _, action_pair in insertions:
+            action_pair.attach_timeline(self.action_pairs)
+        for meta_tree in metadata:
+            self.add_metadata(meta_tree)
+
+    def insert_many(self, insertions):
+        '''
+        Inserts (index, action_pair, metadata) tuples in a single batch(), every index
+        refers to action_pairs before any of the insertions
+        Action pairs without metadata are given 'custom' metadata
+        '''
+        with self.batch():
+            for index, action_pair, metadata in insertions:
+                self.insert_action_pair(action_pair, index)
+                if metadata is None:
+                    metadata = Metadata('custom')
+                    metadata.add_lower(LowerMetadata('custom', action_pair))
+                self.add_metadata(metadata)
 
     # ------------ AlgoScene Internal Wiring --------------
     def is_show_code(self):
@@ -519,28 +688,29 @@ class AlgoScene(MovingCameraScene):
             self.add(arrow)
         # ----------------------------- #
 
-        # zoom camera out
-        self.add_static(0, zoom_out)
-
-        # show source code text
-        sourcecode_pin = self.find_pin('__sourcecode__')[0]
-        index = sourcecode_pin.get_index()
-        sourcecode = sourcecode_pin.get_args()[0]
-        num_spaces = [len(line) - len(line.lstrip(' ')) for line in sourcecode]
-        min_spaces = min([n for n in num_spaces if n != 0])
-        num_spaces = [(n / min_spaces - 1) for n in num_spaces]
-        textobjs = [Text(line.lstrip(), font='Inconsolata') for line in sourcecode]
-        self.add_static(index, show_sourcecode, [textobjs, num_spaces])
-
-        # move arrow to which code line is executed
-        arrow = Arrow(ORIGIN, RIGHT)
-        self.add_static(index+1, add_arrow_beside, [arrow, textobjs[0]])
-        codeindex_pins = self.find_pin('__codeindex__')
-        for pin in codeindex_pins:
-            index = pin.get_index()
-            codeindex = pin.get_args()[0]
-            self.add_transform(index, ApplyMethod, args=[arrow.next_to,
-                                                         textobjs[codeindex], LEFT])
+        with self.batch():
+            # zoom camera out
+            self.add_static(0, zoom_out)
+
+            # show source code text
+            sourcecode_pin = self.find_pin('__sourcecode__')[0]
+            index = sourcecode_pin.get_index()
+            sourcecode = sourcecode_pin.get_args()[0]
+            num_spaces = [len(line) - len(line.lstrip(' ')) for line in sourcecode]
+            min_spaces = min([n for n in num_spaces if n != 0])
+            num_spaces = [(n / min_spaces - 1) for n in num_spaces]
+            textobjs = [Text(line.lstrip(), font='Inconsolata') for line in sourcecode]
+            self.add_static(index, show_sourcecode, [textobjs, num_spaces])
+
+            # move arrow to which code line is executed
+            arrow = Arrow(ORIGIN, RIGHT)
+            self.add_static(index, add_arrow_beside, [arrow, textobjs[0]])
+            codeindex_pins = self.find_pin('__codeindex__')
+            for pin in codeindex_pins:
+                index = pin.get_index()
+                codeindex = pin.get_args()[0]
+                self.add_transform(index, ApplyMethod, args=[arrow.next_to,
+                                                             textobjs[codeindex], LEFT])
 
     def customize_construct(self):
         # Add customisation needed for parallel code anim
@@ -552,21 +722,17 @@ class AlgoScene(MovingCameraScene):
     def post_config(self, settings):
         settings.update(self.post_config_settings)
 
-    def create_animation_blocks(self, action_pairs, anim_blocks): # pylint: disable=R0201
+    def create_animation_blocks(self, action_pairs, anim_blocks):
         ''' Convert action_pairs into anim_blocks '''
-        start_time = 0
         for action_pair in action_pairs:
             action = action_pair.curr_action()
-            if action.w_prev and anim_blocks and anim_blocks[-1].act() == action.act:
-                # anim_blocks should have at least 1 element
-                # if action is supposed to be executed with previous action and
-                # act function is the same as that of current block, bundle actions
-                # together
+            if anim_blocks and \
+                    AnimationBlock.joins(anim_blocks[-1].first_pair().curr_action(), action):
                 anim_blocks[-1].add_action_pair(action_pair)
             else:
-                # else, create new Animation Block
-                anim_blocks.append(AnimationBlock([action_pair], start_time))
-                start_time += anim_blocks[-1].runtime_val()
+                # else, create new Animation Block, its start time is derived from
+                # the runtimes of the blocks before it
+                anim_blocks.append(AnimationBlock([action_pair], self.block_timings))
 
             # attach block to action pair so that time data can be
             # extracted later to be used in GUI
@@ -583,18 +749,19 @@ class AlgoScene(MovingCameraScene):
                 # metadata has no action pairs attached to it
                 continue
 
-            start_time = min(map(lambda block: block.start_time, blocks))
-            end_time = max(map(lambda block: block.start_time + block.runtime_val(), blocks))
-
-            runtime = end_time - start_time
+            # start and end times never decrease with block position
+            first_block = min(blocks, key=lambda block: block.position)
+            last_block = max(blocks, key=lambda block: block.position)
 
             self.metadata_blocks.append(
-                MetadataBlock(tree, action_pairs, start_time, runtime)
+                MetadataBlock(tree, action_pairs, first_block, last_block)
             )
 
         # some metadata might be added out of order, sort the blocks by start_time
         self.metadata_blocks.sort(key=lambda meta_block: meta_block.start_time)
 
+        self.metadata_block_index = MetadataBlockIndex(self.metadata_blocks, self.block_timings)
+
     def execute_action_pairs(self, action_pairs, anim_blocks):
         # wait action is required at the end if last animation is not
         # a play/wait, else the last animation will not be rendered
@@ -608,21 +775,203 @@ class AlgoScene(MovingCameraScene):
                 # a play/wait, else the last animation will not be rendered
                 self.add_wait(len(self.action_pairs))
 
-        # attach indexes to action_pair to be used in GUI
-        # customizations
-        for (i, action_pair) in enumerate(action_pairs):
-            action_pair.attach_index(i)
-
         # run post customize functions from the GUI
         for post_customize in self.post_customize_fns:
             post_customize(self)
 
+        if self.settings['optimize_actions']:
+            # drop animations showing nothing new and static actions overwritten unseen
+            self.optimization_report = optimize_action_pairs(action_pairs,
+                                                             self.camera.frame_rate)
+
         # bundle animations together according to time
         self.create_animation_blocks(action_pairs, anim_blocks)
 
+        if self.on_plan is not None:
+            # the timeline is known long before the video
+            self.create_metadata_blocks()
+            self.on_plan(self)
+
         # and run them
+        if not self.plan_only:
+            self.run_anim_blocks()
+
+    def is_play_like(self, anim_block):
+        ''' If anim_block is a play or wait, which writes a partial movie '''
+        return anim_block.act() in (self.play, self.wait)
+
+    def select_render_chunk(self):
+        '''
+        Splits the video into render_chunk[1] parts of equal length, and skips the plays
+        starting outside of part render_chunk[0]
+        '''
+        index, count = self.render_chunk
+        total_time = self.block_timings.total_time()
+        play_times = [anim_block.start_time for anim_block in self.anim_blocks
+                      if self.is_play_like(anim_block)]
+
+        start = bisect_left(play_times, total_time * index / count)
+        end = len(play_times)
+        if index + 1 < count:
+            end = bisect_left(play_times, total_time * (index + 1) / count)
+        self.chunk_plays = range(start, end)
+
+        if start > 0:
+            # earlier blocks are run without writing frames to reach the state at start
+            self.start_at_animation_number = start
+            self.skip_animations = True
+
+    def run_anim_blocks(self):
+        if self.render_chunk is not None:
+            self.select_render_chunk()
+        elif self.block_cache is not None and self.checkpoints is not None:
+            self.checkpoints.run_blocks(self)
+            return
+
         for anim_block in self.anim_blocks:
-            anim_block.run()
+            if self.chunk_plays is not None and self.num_plays >= self.chunk_plays.stop:
+                break
+            if self.block_cache is None:
+                anim_block.run()
+            else:
+                self.block_cache.run_block(self, anim_block)
+
+    # ------------ Manim Scene overrides --------------
+    def begin_animations(self, animations):
+        ''' MemberGroups are not added to the scene, their members are already in it '''
+        for animation in animations:
+            if isinstance(animation.mobject, MemberGroup):
+                animation.begin()
+        super().begin_animations([animation for animation in animations
+                                  if not isinstance(animation.mobject, MemberGroup)])
+
+    def get_moving_mobjects(self, *animations):
+        ''' Members of MemberGroups move where they are drawn '''
+        moving_mobjects = super().get_moving_mobjects(*animations)
+        members = set()
+        for animation in animations:
+            if isinstance(animation.mobject, MemberGroup):
+                members.update(animation.mobject.get_family())
+        if not members:
+            return moving_mobjects
+
+        mobjects = self.get_mobject_family_members()
+        for i, mobject in enumerate(mobjects):
+            if mobject in members:
+                return list_update(mobjects[i:], moving_mobjects)
+        return moving_mobjects
+
+    def update_frame(self, mobjects=None, background=None, include_submobjects=True,
+                     ignore_skipping=True, **kwargs):
+        ''' Frames of the whole scene or of its still mobjects are kept by the background_layer '''
+        if self.background_layer is None or mobjects is not None or background is not None \
+                or not include_submobjects:
+            super().update_frame(mobjects, background, include_submobjects, ignore_skipping,
+                                 **kwargs)
+            return
+        if self.skip_animations and not ignore_skipping:
+            return
+
+        mobjects = self.camera.get_mobjects_to_display(
+            list_update(self.mobjects, self.foreground_mobjects), **kwargs)
+        self.set_camera_pixel_array(self.background_layer.render(self.camera, mobjects))
+
+    def get_animated_mobjects(self, animations):
+        '''
+        Returns the family members of the mobjects animations and updaters move, and of the
+        foreground mobjects, in drawing order. None if the camera frame moves
+        '''
+        mobjects = self.get_mobject_family_members()
+        moved = [animation.mobject for animation in animations] + self.foreground_mobjects
+        moved += [mobject for mobject in mobjects if mobject.updaters]
+        moving = set(map(id, self.camera.extract_mobject_family_members(moved)))
+        if any(id(indicator) in moving
+               for indicator in self.camera.get_mobjects_indicating_movement()):
+            return None
+        return [mobject for mobject in mobjects if id(mobject) in moving]
+
+    def progress_through_animations(self, animations):
+        '''
+        With a background_layer, only the mobjects the animations move, and those drawn over
+        them, are drawn over the raster of the others every frame, instead of every mobject
+        drawn after the first moving one. Frames where they reach another mobject drawn over
+        them are drawn whole. With a DirtyRectCamera, frames are drawn over the previous one
+        where the animated mobjects are. With a frame_pool, the frames of long plays are drawn
+        by its workers
+        '''
+        if self.frame_pool is not None and self.frame_pool.can_render(self, animations):
+            moving_mobjects = self.get_moving_mobjects(*animations)
+            self.update_frame(excluded_mobjects=moving_mobjects)
+            time_progression = self.get_animation_time_progression(animations)
+            self.frame_pool.render(self, animations, time_progression, moving_mobjects,
+                                   self.get_frame())
+            return
+        moving_mobjects = None
+        if self.background_layer is not None or isinstance(self.camera, DirtyRectCamera):
+            moving_mobjects = self.get_animated_mobjects(animations)
+        if not moving_mobjects:
+            super().progress_through_animations(animations)
+        elif isinstance(self.camera, DirtyRectCamera):
+            self.progress_through_dirty_rects(animations, moving_mobjects)
+        else:
+            self.progress_through_background_layer(animations, moving_mobjects)
+
+    def progress_through_background_layer(self, animations, moving_mobjects):
+        moving = set(map(id, moving_mobjects))
+        mobjects = self.get_mobject_family_members()
+        first_moving = next(i for i, mobject in enumerate(mobjects) if id(mobject) in moving)
+        above = [mobject for mobject in mobjects[first_moving:]
+                 if mobject.has_points() and id(mobject) not in moving]
+        if not all(isinstance(mobject, VMobject) for mobject in above + moving_mobjects):
+            # only the bounds of paths are known
+            super().progress_through_animations(animations)
+            return
+        transform = pixel_transform(self.camera)
+        above_bounds = pixel_bounds(above, transform)
+        covered = np.zeros(len(above), dtype=bool)
+        for rect in pixel_bounds(moving_mobjects, transform):
+            covered |= intersecting(above_bounds, rect)
+        moving.update(id(mobject) for mobject, is_covered in zip(above, covered) if is_covered)
+        moving_mobjects = [mobject for mobject in mobjects if id(mobject) in moving]
+        above_bounds = above_bounds[~covered]
+
+        self.update_frame(excluded_mobjects=moving_mobjects)
+        static_image = self.get_frame()
+
+        for _ in self.interpolate_animations(animations):
+            if self.background_layer.covers(self.camera, moving_mobjects, above_bounds):
+                Scene.update_frame(self)
+            else:
+                self.update_frame(moving_mobjects, static_image)
+            self.add_frames(self.get_frame())
+
+    def progress_through_dirty_rects(self, animations, moving_mobjects):
+        moving = set(map(id, moving_mobjects))
+        for _ in self.interpolate_animations(animations):
+            mobjects = self.camera.get_mobjects_to_display(
+                list_update(self.mobjects, self.foreground_mobjects))
+            self.camera.capture_frame(
+                mobjects, [mobject for mobject in mobjects if id(mobject) in moving])
+            self.add_frames(self.get_frame())
+
+    def interpolate_animations(self, animations):
+        ''' Moves the mobjects of animations, and those with updaters, to each frame in turn '''
+        last_t = 0
+        for t in self.get_animation_time_progression(animations):
+            dt = t - last_t
+            last_t = t
+            for animation in animations:
+                animation.update_mobjects(dt)
+                alpha = t / animation.run_time
+                animation.interpolate(alpha)
+            self.update_mobjects(dt)
+            yield t
+
+    def finish_animations(self, animations):
+        super().finish_animations(animations)
+        for animation in animations:
+            if isinstance(animation.mobject, MemberGroup) and animation.is_remover():
+                self.remove(*animation.mobject.submobjects)
 
     def construct(self):
         ''' Run the pipeline needed for the animations '''
@@ -634,4 +983,5 @@ class AlgoScene(MovingCameraScene):
         self.customize_construct()
 
         self.execute_action_pairs(self.action_pairs, self.anim_blocks)
-        self.create_metadata_blocks()
+        if self.on_plan is None:
+            self.create_metadata_blocks()
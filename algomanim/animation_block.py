@@ -5,12 +5,35 @@ class AnimationBlock:
 
     Args:
         action_pairs (AlgoSceneActionPairs[])
+        timings (BlockTimings): Runtimes of the scene's blocks, this block is added after
+            all blocks already in it
+
+    Attributes:
+        position (int): Position of this block in timings
         start_time (float): Point of time in the AlgoScene at which this block runs
+        end_time (float): Point of time in the AlgoScene at which this block ends
     '''
 
-    def __init__(self, action_pairs, start_time):
+    __slots__ = ('action_pairs', 'timings', 'position')
+
+    def __init__(self, action_pairs, timings):
         self.action_pairs = action_pairs
-        self.start_time = start_time
+        self.timings = timings
+        self.position = timings.add_block(self)
+
+    @property
+    def start_time(self):
+        return self.timings.start_time(self.position)
+
+    @property
+    def end_time(self):
+        return self.timings.end_time(self.position)
+
+    def start_position(self):
+        return self.start_time * 1000
+
+    def end_position(self):
+        return self.end_time * 1000
 
     def first_pair(self):
         return self.action_pairs[0]
@@ -24,10 +47,34 @@ class AnimationBlock:
     def add_action_pair(self, action_pair):
         self.action_pairs.append(action_pair)
 
+    def update_runtime(self):
+        ''' Moves the blocks after this one when the runtime of its first pair changes '''
+        self.timings.update_block(self)
+
     def is_action_pair_in(self, action_pair):
         return action_pair in self.action_pairs
 
+    def is_static(self):
+        return self.first_pair().curr_action().is_static()
+
+    @staticmethod
+    def joins(first_action, action):
+        ''' If action is bundled into the block whose first action is first_action '''
+        if action.is_static() and first_action.is_static():
+            # runs of static actions write no frames, so they are fused into a single
+            # block applying them in order whether or not they are run with the previous
+            return True
+        # if action is supposed to be executed with previous action and act function
+        # is the same as that of the block, bundle actions together
+        return action.w_prev and action.act == first_action.act
+
     def run(self):
+        if self.is_static():
+            # jump straight to the state after all the static actions
+            for action_pair in self.action_pairs:
+                action_pair.run()
+            return
+
         # extract act and runtime from first pair
         first_pair = self.first_pair()
         act = first_pair.act()
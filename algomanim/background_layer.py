@@ -0,0 +1,134 @@
+from collections import namedtuple
+from manimlib.imports import *
+from .frame_regions import frame_state, pixel_transform, pixel_bounds, intersecting, \
+    clip_bounds
+
+
+# Share of the frame above which changed regions are not worth drawing on their own
+DEFAULT_MAX_DIRTY_FRACTION = 0.5
+
+# State of the drawn mobjects: their ids and fingerprints in drawing order, and pixel bounds
+DrawnState = namedtuple('DrawnState', ['ids', 'fingerprints', 'bounds'])
+
+
+def fingerprint(vmobject):
+    ''' Returns a hash of everything camera draws vmobject with but where it is in the frame '''
+    return hash((type(vmobject), vmobject.points.tobytes(), vmobject.fill_rgbas.tobytes(),
+                 vmobject.stroke_rgbas.tobytes(), vmobject.background_stroke_rgbas.tobytes(),
+                 vmobject.stroke_width, vmobject.background_stroke_width,
+                 vmobject.sheen_factor, tuple(vmobject.sheen_direction)))
+
+
+class BackgroundLayer:
+
+    '''
+    Raster of the mobjects that stay still during a play, kept from one play to the next
+    Only the regions where mobjects were added, removed or changed since the last raster are
+    drawn again, with the mobjects drawn on them, so a block moving a few nodes of a large
+    data structure does not draw the rest of it again
+
+    Args:
+        max_dirty_fraction (float): Share of the frame changed regions may cover before the
+            whole raster is drawn again
+
+    Attributes:
+        image (np.ndarray): Last raster, None before the first
+        frame (tuple): Position and size of the camera frame and background image was drawn on
+        drawn (DrawnState): Mobjects drawn on image
+        full_draws (int): Number of rasters drawn whole
+        partial_draws (int): Number of rasters updated by drawing their changed regions
+    '''
+
+    def __init__(self, max_dirty_fraction=DEFAULT_MAX_DIRTY_FRACTION):
+        self.max_dirty_fraction = max_dirty_fraction
+        self.image = None
+        self.frame = None
+        self.drawn = None
+        self.full_draws = 0
+        self.partial_draws = 0
+
+    def render(self, camera, mobjects):
+        '''
+        Returns the raster of mobjects, which are drawn in order and have points, on camera's
+        background. The raster is kept, it must not be changed
+        '''
+        frame = frame_state(camera)
+        if not all(isinstance(mobject, VMobject) and not mobject.get_background_image_file()
+                   for mobject in mobjects):
+            # only paths drawn by cairo are followed
+            self.frame = None
+            return self.draw_whole(camera, mobjects)
+
+        drawn = DrawnState([id(mobject) for mobject in mobjects],
+                           [fingerprint(mobject) for mobject in mobjects],
+                           pixel_bounds(mobjects, pixel_transform(camera)))
+        rects = None
+        if frame == self.frame:
+            rects = self.changed_regions(drawn)
+        self.frame = frame
+        self.drawn = drawn
+
+        if rects is None:
+            return self.draw_whole(camera, mobjects)
+        rects = [clip_bounds(rect, self.image) for rect in rects]
+        rects = [rect for rect in rects if rect is not None]
+        if not rects:
+            return self.image
+        area = sum((right - left) * (bottom - top) for left, top, right, bottom in rects)
+        if area > self.max_dirty_fraction * self.image.shape[0] * self.image.shape[1]:
+            return self.draw_whole(camera, mobjects)
+
+        # mobjects with pixels in the regions are all drawn, in order, and the regions copied
+        touched = np.zeros(len(mobjects), dtype=bool)
+        for rect in rects:
+            touched |= intersecting(drawn.bounds, rect)
+        camera.reset()
+        camera.capture_mobjects([mobject for mobject, is_touched in zip(mobjects, touched)
+                                 if is_touched], include_submobjects=False)
+        pixel_array = camera.get_pixel_array()
+        for left, top, right, bottom in rects:
+            self.image[top:bottom, left:right] = pixel_array[top:bottom, left:right]
+        self.partial_draws += 1
+        return self.image
+
+    def changed_regions(self, drawn):
+        '''
+        Returns the bounds of the mobjects added, removed or changed since the last raster,
+        before and after the change, None if the raster must be drawn whole
+        '''
+        old = self.drawn
+        old_indexes = {mobject_id: i for i, mobject_id in enumerate(old.ids)}
+        new_indexes = {mobject_id: i for i, mobject_id in enumerate(drawn.ids)}
+        kept = [mobject_id for mobject_id in drawn.ids if mobject_id in old_indexes]
+        if kept != [mobject_id for mobject_id in old.ids if mobject_id in new_indexes]:
+            # mobjects were brought to the front or back
+            return None
+
+        changed = [old.bounds[i] for i, mobject_id in enumerate(old.ids)
+                   if mobject_id not in new_indexes]
+        for i, mobject_id in enumerate(drawn.ids):
+            old_index = old_indexes.get(mobject_id)
+            if old_index is None:
+                changed.append(drawn.bounds[i])
+            elif old.fingerprints[old_index] != drawn.fingerprints[i] or \
+                    (old.bounds[old_index] != drawn.bounds[i]).any():
+                changed += [old.bounds[old_index], drawn.bounds[i]]
+        return [rect for rect in changed if rect[0] < rect[2] and rect[1] < rect[3]]
+
+    def draw_whole(self, camera, mobjects):
+        camera.reset()
+        camera.capture_mobjects(mobjects, include_submobjects=False)
+        self.image = camera.get_pixel_array().copy()
+        self.full_draws += 1
+        return self.image
+
+    def covers(self, camera, moving_mobjects, above_bounds):
+        '''
+        Returns if moving_mobjects, as they are now, have pixels in any of above_bounds, the
+        bounds of the still mobjects drawn over them
+        '''
+        if len(above_bounds) == 0:
+            return False
+        return any(intersecting(above_bounds, rect).any()
+                   for rect in pixel_bounds(moving_mobjects, pixel_transform(camera))
+                   if rect[0] < rect[2])
@@ -0,0 +1,341 @@
+import collections
+import contextlib
+import functools
+import hashlib
+import os
+import shutil
+import types
+import numpy as np
+from manimlib.imports import *
+
+
+DEFAULT_CACHE_DIR = './media/algomanim/block_cache'
+DEFAULT_MAX_SIZE = 1024 ** 3
+
+# Bumped whenever the way keys are computed changes, so that old entries are never reused
+CACHE_VERSION = b'algomanim-block-cache-3'
+
+# Attributes of a mobject that decide how it is drawn
+VISUAL_ATTRS = (
+    'points', 'fill_rgbas', 'stroke_rgbas', 'background_stroke_rgbas',
+    'stroke_width', 'background_stroke_width', 'sheen_factor', 'sheen_direction',
+    'rgbas', 'pixel_array',
+)
+
+# Attributes of a mobject left out of its state, the family is hashed member by member
+SKIPPED_ATTRS = ('submobjects', )
+
+# How far hash_value follows the attributes of plain objects
+MAX_DEPTH = 8
+
+
+def hash_mobject(digest, mobject, seen=None, depth=0):
+    '''
+    Feeds the state of mobject and its family into digest, every attribute of a member and
+    not only those in VISUAL_ATTRS, as updaters, colours kept for later animations and the
+    attributes of subclasses change the video too. Members of labels are hashed by
+    hash_label_member instead
+    '''
+    if seen is None:
+        seen = {}
+    family = mobject.get_family()
+    for member in family:
+        # members referencing each other are described by their place in the family
+        seen.setdefault(id(member), (len(seen), member))
+    label_keys = {}
+    for member in family:
+        state = vars(member)
+        if 'label_key' in state:
+            for label_member in member.get_family():
+                label_keys.setdefault(id(label_member), member.label_key)
+        if id(member) in label_keys:
+            hash_label_member(digest, member, label_keys[id(member)], seen, depth)
+            continue
+        digest.update(type(member).__qualname__.encode())
+        for attr in sorted(state):
+            if attr not in SKIPPED_ATTRS:
+                digest.update(attr.encode())
+                hash_value(digest, state[attr], seen, depth)
+
+
+def hash_label_member(digest, member, label_key, seen, depth):
+    '''
+    Feeds a member of a label of the LabelCache into digest by the key of the label and the
+    attributes it is drawn with, which are the same whether the label was made or loaded
+    as a VMobject
+    '''
+    digest.update(b'label')
+    hash_value(digest, label_key, seen, depth)
+    digest.update(str(len(member.submobjects)).encode())
+    for attr in VISUAL_ATTRS:
+        if hasattr(member, attr):
+            digest.update(attr.encode())
+            # loaded attributes are arrays, made ones may be numbers
+            hash_value(digest, np.asarray(getattr(member, attr)), seen, depth)
+    hash_value(digest, member.updaters, seen, depth)
+
+
+def hash_value(digest, value, seen=None, depth=0):
+    '''
+    Feeds a description of value into digest that only depends on its contents, so it is
+    the same in every run of a scene. Raises ValueError if value cannot be described
+    '''
+    if seen is None:
+        seen = {}
+    digest.update(type(value).__qualname__.encode())
+
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, np.ndarray):
+        digest.update(f'{value.dtype}{value.shape}'.encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, Scene):
+        # the state of the scene is hashed separately at the start of every block
+        pass
+    elif isinstance(value, type):
+        digest.update(f'{value.__module__}.{value.__qualname__}'.encode())
+    elif isinstance(value, types.ModuleType):
+        digest.update(value.__name__.encode())
+    elif id(value) in seen:
+        # objects referenced again are described by when they were first seen
+        digest.update(f'ref{seen[id(value)][0]}'.encode())
+    elif depth > MAX_DEPTH:
+        raise ValueError('value is nested too deeply to be hashed')
+    else:
+        # value is kept so that its id is not reused by another object while hashing
+        seen[id(value)] = (len(seen), value)
+        hash_object(digest, value, seen, depth + 1)
+
+
+def hash_object(digest, value, seen, depth):
+    ''' Feeds a description of a container, function or object into digest '''
+    if isinstance(value, Mobject):
+        hash_mobject(digest, value, seen, depth)
+    elif isinstance(value, (list, tuple)):
+        digest.update(str(len(value)).encode())
+        for item in value:
+            hash_value(digest, item, seen, depth)
+    elif isinstance(value, dict):
+        digest.update(str(len(value)).encode())
+        for key in sorted(value, key=repr):
+            hash_value(digest, key, seen, depth)
+            hash_value(digest, value[key], seen, depth)
+    elif isinstance(value, types.MethodType):
+        hash_value(digest, value.__func__, seen, depth)
+        hash_value(digest, value.__self__, seen, depth)
+    elif isinstance(value, types.FunctionType):
+        digest.update(f'{value.__module__}.{value.__qualname__}'.encode())
+        hash_code(digest, value.__code__)
+        hash_value(digest, value.__defaults__, seen, depth)
+        cells = value.__closure__ or ()
+        hash_value(digest, [cell.cell_contents for cell in cells], seen, depth)
+    elif isinstance(value, types.BuiltinMethodType):
+        digest.update(value.__qualname__.encode())
+        hash_value(digest, value.__self__, seen, depth)
+    elif hasattr(value, '__dict__'):
+        hash_value(digest, vars(value), seen, depth)
+    else:
+        description = repr(value)
+        if ' at 0x' in description:
+            # the repr only identifies the object, not its contents
+            raise ValueError(f'cannot hash {description}')
+        digest.update(description.encode())
+
+
+def hash_code(digest, code):
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            hash_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+@functools.lru_cache(maxsize=None)
+def source_hash():
+    '''
+    Hash of the source of algomanim, whose functions the transforms of blocks call without
+    their code being part of the keys
+    '''
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.py'):
+            digest.update(name.encode())
+            with open(os.path.join(directory, name), 'rb') as source_file:
+                digest.update(source_file.read())
+    return digest.hexdigest()
+
+
+def scene_state_hash(scene):
+    '''
+    Hash of everything drawn by scene, including mobjects saved by a fade out and those kept
+    in the foreground. Raises ValueError if the state cannot be hashed
+    '''
+    digest = hashlib.sha256()
+    seen = {}
+    for mobject in scene.mobjects:
+        hash_mobject(digest, mobject, seen)
+    digest.update(b'foreground')
+    for mobject in scene.foreground_mobjects:
+        hash_mobject(digest, mobject, seen)
+    digest.update(b'saved')
+    for mobject in scene.save_mobjects or []:
+        hash_mobject(digest, mobject, seen)
+    frame = getattr(scene.camera, 'frame', None)
+    if frame is not None:
+        hash_mobject(digest, frame, seen)
+    return digest.hexdigest()
+
+
+class BlockVideoCache:
+
+    '''
+    On-disk cache of the partial movie files of AnimationBlocks, so that blocks which did not
+    change since the last render are copied instead of rendered again
+    Each file is keyed by a hash of the block's actions, its runtime, the camera and the state
+    of the scene when the block starts. The least recently used files are removed when the
+    cache grows past max_size. The directory is only scanned when the cache is created, after
+    that the sizes of the files and the order they were used in are kept in memory
+
+    Args:
+        directory (str): Directory the movie files are stored in
+        max_size (int): Maximum total size of the stored files in bytes
+
+    Attributes:
+        hits (int): Number of blocks copied from the cache
+        misses (int): Number of blocks rendered and added to the cache
+        entries (OrderedDict): Size of each stored file by path, least recently used first
+        size (int): Total size of the stored files
+    '''
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.entries = collections.OrderedDict()
+        self.size = 0
+        os.makedirs(directory, exist_ok=True)
+        self.load_entries()
+
+    def load_entries(self):
+        ''' Adds the files stored by earlier renders to entries, in the order they were used '''
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.tmp'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # evicted by another render
+                continue
+            files.append((stat.st_mtime, entry.path, stat.st_size))
+        for _, path, size in sorted(files):
+            self.add_entry(path, size)
+
+    def add_entry(self, path, size):
+        self.remove_entry(path)
+        self.entries[path] = size
+        self.size += size
+
+    def remove_entry(self, path):
+        self.size -= self.entries.pop(path, 0)
+
+    def path(self, key, extension):
+        return os.path.join(self.directory, key + extension)
+
+    def get(self, key, extension):
+        ''' Returns the path of the file stored for key, None if there is none '''
+        path = self.path(key, extension)
+        try:
+            # mark as recently used, also for the caches of later renders
+            os.utime(path)
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            self.remove_entry(path)
+            return None
+        # files stored by renders running in parallel are added when first used
+        self.add_entry(path, size)
+        return path
+
+    def put(self, key, extension, movie_path):
+        ''' Stores a copy of movie_path under key and evicts old files if needed '''
+        path = self.path(key, extension)
+        # renders running in parallel may store the same block at once
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        shutil.copyfile(movie_path, temp_path)
+        os.replace(temp_path, path)
+        self.add_entry(path, os.path.getsize(path))
+        self.evict()
+
+    def evict(self):
+        ''' Removes the least recently used files until the cache fits in max_size '''
+        while self.size > self.max_size and self.entries:
+            path, size = self.entries.popitem(last=False)
+            self.size -= size
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+    @staticmethod
+    def block_key(scene, anim_block):
+        ''' Hash identifying the video of anim_block, computed before it is run '''
+        digest = hashlib.sha256(CACHE_VERSION)
+        camera = scene.camera
+        hash_value(digest, [type(camera), camera.pixel_width, camera.pixel_height,
+                            camera.frame_rate, camera.background_color,
+                            camera.background_opacity, scene.file_writer.movie_file_extension])
+        hash_value(digest, scene.camera_config)
+        digest.update(source_hash().encode())
+        digest.update(scene_state_hash(scene).encode())
+
+        first_pair = anim_block.first_pair()
+        hash_value(digest, first_pair.get_runtime())
+        seen = {}
+        for action_pair in anim_block.action_pairs:
+            action = action_pair.curr_action()
+            hash_value(digest, action.is_wait)
+            if action.transform is not None:
+                hash_value(digest, action.transform.transform, seen)
+                hash_value(digest, action.transform.args, seen)
+        return digest.hexdigest()
+
+    def run_block(self, scene, anim_block):
+        '''
+        Runs anim_block in scene, copying its movie file from the cache if possible
+        Returns the key of the movie file, None if the block was not cached
+        '''
+        act = anim_block.act()
+        writes_movie = act in (scene.play, scene.wait)
+        if scene.skip_animations or not scene.file_writer.write_to_movie or not writes_movie:
+            anim_block.run()
+            return None
+
+        try:
+            key = self.block_key(scene, anim_block)
+        except ValueError:
+            anim_block.run()
+            return None
+
+        file_writer = scene.file_writer
+        extension = file_writer.movie_file_extension
+        movie_path = file_writer.get_next_partial_movie_path()
+        cached_path = self.get(key, extension)
+
+        if cached_path is None:
+            self.misses += 1
+            anim_block.run()
+            if not os.path.exists(movie_path):
+                return None
+            self.put(key, extension, movie_path)
+            return key
+
+        # run the block without writing any frames to bring the scene to its end state
+        self.hits += 1
+        scene.skip_animations = True
+        try:
+            anim_block.run()
+        finally:
+            scene.skip_animations = False
+        shutil.copyfile(cached_path, movie_path)
+        return key
@@ -0,0 +1,47 @@
+from algomanim.fenwick_tree import FenwickTree
+
+
+class BlockTimings:
+
+    '''
+    Runtimes of a scene's AnimationBlocks in the order they are run, stored as prefix sums
+    so that start times can be read and a block's runtime changed in logarithmic time
+
+    Attributes:
+        runtimes (FenwickTree): Runtime of every block, indexed by block position
+    '''
+
+    def __init__(self):
+        self.runtimes = FenwickTree()
+
+    def __len__(self):
+        return len(self.runtimes)
+
+    def add_block(self, anim_block):
+        ''' Appends anim_block after all other blocks and returns its position '''
+        self.runtimes.append(anim_block.runtime_val())
+        return len(self.runtimes) - 1
+
+    def update_block(self, anim_block):
+        ''' Updates the stored runtime of anim_block, moving all later blocks '''
+        self.runtimes.set(anim_block.position, anim_block.runtime_val())
+
+    def start_time(self, position):
+        return self.runtimes.prefix_sum(position)
+
+    def end_time(self, position):
+        return self.runtimes.prefix_sum(position + 1)
+
+    def runtime(self, position):
+        return self.runtimes.get(position)
+
+    def total_time(self):
+        return self.runtimes.total()
+
+    def find_position(self, time, inclusive=False):
+        '''
+        Returns the position of the first block ending after time, or at time if inclusive,
+        len(self) if there is no such block
+        '''
+        position, _ = self.runtimes.search(time, inclusive)
+        return position
@@ -0,0 +1,106 @@
+from collections import namedtuple
+from manimlib.imports import *
+from .background_layer import DEFAULT_MAX_DIRTY_FRACTION
+from .frame_regions import frame_state, pixel_transform, pixel_bounds, intersecting, \
+    clip_bounds
+
+# frame: frame_state of the camera the frame was drawn with
+# ids, moving_ids: ids of the mobjects drawn and of those moving, in drawing order
+# moving: indexes of the moving mobjects in ids
+# bounds: pixel bounds of every mobject drawn
+DrawnFrame = namedtuple('DrawnFrame', ['frame', 'ids', 'moving_ids', 'moving', 'bounds'])
+
+
+class DirtyRectCamera(MovingCamera):
+
+    '''
+    MovingCamera drawing a frame of an animation over the previous one, by clearing the pixels
+    the moving mobjects were and are on, and drawing again only the mobjects on them, clipped to
+    those pixels. Frames are drawn so by capture_frame, the first frame of an animation, frames
+    after the camera frame moved, and frames where the moving mobjects cover a large share of the
+    frame are drawn whole
+
+    Attributes:
+        clip_rects (list): [left, top, right, bottom) pixels drawing is clipped to, None to draw
+            on the whole frame
+        drawn (DrawnFrame): Frame in pixel_array, None if it was not drawn by capture_frame
+        full_draws (int): Number of frames drawn whole by capture_frame
+        partial_draws (int): Number of frames drawn over the previous one
+    '''
+
+    CONFIG = {
+        'max_dirty_fraction': DEFAULT_MAX_DIRTY_FRACTION,
+    }
+
+    def __init__(self, frame=None, **kwargs):
+        self.clip_rects = None
+        self.drawn = None
+        self.full_draws = 0
+        self.partial_draws = 0
+        MovingCamera.__init__(self, frame, **kwargs)
+
+    def set_pixel_array(self, pixel_array, convert_from_floats=False):
+        # pixels set elsewhere are not a frame capture_frame can draw over
+        self.drawn = None
+        super().set_pixel_array(pixel_array, convert_from_floats)
+
+    def get_cairo_context(self, pixel_array):
+        ctx = super().get_cairo_context(pixel_array)
+        if self.clip_rects is not None:
+            matrix = ctx.get_matrix()
+            ctx.identity_matrix()
+            for left, top, right, bottom in self.clip_rects:
+                ctx.rectangle(left, top, right - left, bottom - top)
+            ctx.clip()
+            ctx.set_matrix(matrix)
+        return ctx
+
+    def capture_frame(self, mobjects, moving_mobjects):
+        '''
+        Draws the frame of mobjects, which are drawn in order and have points, where only
+        moving_mobjects changed since the last frame drawn by capture_frame
+        '''
+        frame = frame_state(self)
+        transform = pixel_transform(self)
+        drawn = self.drawn
+        if drawn is None or drawn.frame != frame or \
+                drawn.moving_ids != [id(mobject) for mobject in moving_mobjects] or \
+                drawn.ids != [id(mobject) for mobject in mobjects]:
+            self.draw_whole(mobjects, moving_mobjects, frame, transform)
+            return
+
+        moving_bounds = pixel_bounds([mobjects[i] for i in drawn.moving], transform)
+        rects = [clip_bounds(rect, self.pixel_array)
+                 for rect in np.concatenate([drawn.bounds[drawn.moving], moving_bounds])]
+        rects = [rect for rect in rects if rect is not None]
+        area = sum((right - left) * (bottom - top) for left, top, right, bottom in rects)
+        if area > self.max_dirty_fraction * self.get_pixel_width() * self.get_pixel_height():
+            self.draw_whole(mobjects, moving_mobjects, frame, transform)
+            return
+
+        drawn.bounds[drawn.moving] = moving_bounds
+        touched = np.zeros(len(mobjects), dtype=bool)
+        for left, top, right, bottom in rects:
+            touched |= intersecting(drawn.bounds, (left, top, right, bottom))
+            self.pixel_array[top:bottom, left:right] = self.background[top:bottom, left:right]
+        self.clip_rects = rects
+        try:
+            self.capture_mobjects([mobject for mobject, is_touched in zip(mobjects, touched)
+                                   if is_touched], include_submobjects=False)
+        finally:
+            self.clip_rects = None
+        self.partial_draws += 1
+
+    def draw_whole(self, mobjects, moving_mobjects, frame, transform):
+        self.reset()
+        self.capture_mobjects(mobjects, include_submobjects=False)
+        self.full_draws += 1
+        if all(isinstance(mobject, VMobject) and not mobject.get_background_image_file()
+               for mobject in mobjects):
+            # only the pixels of paths drawn by cairo are known
+            moving_ids = [id(mobject) for mobject in moving_mobjects]
+            moving = set(moving_ids)
+            ids = [id(mobject) for mobject in mobjects]
+            self.drawn = DrawnFrame(frame, ids, moving_ids,
+                                    [i for i, mobject_id in enumerate(ids) if mobject_id in moving],
+                                    pixel_bounds(mobjects, transform))
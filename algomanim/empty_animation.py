@@ -3,8 +3,12 @@ from algomanim.metadata_block import MetadataBlock
 
 
 class EmptyMetadataBlock(MetadataBlock):
+    # not part of the rendered scene, so its timing is fixed
+    start_time = -1
+    runtime = 0.5
+
     def __init__(self, index):
-        super().__init__(EmptyMetadata(), [], -1, 0.5)
+        super().__init__(EmptyMetadata(), [], None, None)
         self.index = index
 
 
@@ -0,0 +1,80 @@
+class FenwickTree:
+
+    '''
+    Binary indexed tree over a list of non-negative numbers, supporting point updates,
+    prefix sums and prefix-sum searches in logarithmic time
+
+    Args:
+        values ([]): Initial values, the tree is built from them in linear time
+
+    Attributes:
+        values ([]): Current value at each position
+        tree ([]): 1-indexed partial sums, tree[i] covers values (i - lowbit(i), i]
+    '''
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self.tree = [0] + self.values
+        size = len(self.tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                self.tree[parent] += self.tree[i]
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, index):
+        return self.values[index]
+
+    def add(self, index, delta):
+        ''' Adds delta to the value at index '''
+        self.values[index] += delta
+        i = index + 1
+        size = len(self.tree)
+        while i < size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def set(self, index, value):
+        ''' Replaces the value at index '''
+        self.add(index, value - self.values[index])
+
+    def append(self, value):
+        ''' Adds a new value at the end of the tree '''
+        i = len(self.tree)
+        lowbit = i & -i
+        self.values.append(value)
+        self.tree.append(value + self.prefix_sum(i - 1) - self.prefix_sum(i - lowbit))
+
+    def prefix_sum(self, index):
+        ''' Returns the sum of the first index values '''
+        total = 0
+        i = index
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def total(self):
+        return self.prefix_sum(len(self.values))
+
+    def search(self, target, inclusive=False):
+        '''
+        Returns (index, remainder) where index is the first position at which the running sum
+        exceeds target, and remainder is target minus the sum of all values before index
+        If inclusive, index is the first position at which the running sum reaches target
+        If the total does not exceed (or reach) target, index is len(self)
+        '''
+        position = 0
+        remainder = target
+        size = len(self.values)
+        step = 1 << size.bit_length()
+        while step:
+            next_position = position + step
+            if next_position <= size and (self.tree[next_position] < remainder or
+                                          not inclusive and self.tree[next_position] == remainder):
+                position = next_position
+                remainder -= self.tree[next_position]
+            step >>= 1
+        return position, remainder
@@ -0,0 +1,104 @@
+import collections
+import mmap
+import multiprocessing
+import os
+from manimlib.imports import *
+
+
+# Plays with fewer frames are not worth forking workers for
+DEFAULT_MIN_FRAMES = 120
+
+# Frames drawn by a worker for each task
+FRAMES_PER_CHUNK = 4
+
+# Tasks drawn or waiting to be written for each worker, which bounds the frames kept in memory
+CHUNKS_PER_WORKER = 2
+
+# Play being rendered, read by the pool workers forked from the rendering process
+FRAME_RENDER = {}
+
+
+def render_frames(slot, times):
+    '''
+    Draws the frames at times of the play in FRAME_RENDER, in a pool worker, into the frames
+    of the shared buffer from slot
+    '''
+    scene, animations, moving_mobjects, static_image, frames = FRAME_RENDER['play']
+    for i, t in enumerate(times):
+        for animation in animations:
+            animation.interpolate(t / animation.run_time)
+        scene.update_frame(moving_mobjects, static_image)
+        frames[slot + i] = scene.camera.get_pixel_array()
+    return slot
+
+
+class FramePool:
+
+    '''
+    Draws the frames of long plays in processes forked at the start of the play, which inherit
+    the scene and the animations as they are then. Without updaters, the frame at a time of a
+    play only depends on that time, so each worker draws its own frames from the start of the
+    play. Workers draw frames into memory shared with the scene, which writes them in order
+
+    Args:
+        workers (int): Number of processes drawing frames, the number of CPUs if None
+        min_frames (int): Plays with fewer frames are drawn by the scene
+
+    Attributes:
+        parallel_plays (int): Number of plays drawn by the workers
+    '''
+
+    def __init__(self, workers=None, min_frames=DEFAULT_MIN_FRAMES):
+        self.workers = workers or os.cpu_count()
+        self.min_frames = min_frames
+        self.parallel_plays = 0
+
+    def can_render(self, scene, animations):
+        ''' If the frames of animations only depend on their time, and are worth forking for '''
+        if self.workers <= 1 or scene.skip_animations or \
+                scene.get_run_time(animations) * scene.camera.frame_rate < self.min_frames:
+            return False
+        animated = [mobject for animation in animations for mobject in animation.get_all_mobjects()]
+        mobjects = scene.get_mobject_family_members() + \
+            scene.camera.extract_mobject_family_members(animated)
+        return not any(mobject.updaters for mobject in mobjects)
+
+    def render(self, scene, animations, time_progression, moving_mobjects, static_image):
+        '''
+        Draws the frames of animations at the times of time_progression, with moving_mobjects
+        drawn over static_image, and adds them to scene in order
+        '''
+        times = list(time_progression.iterable)
+        chunks = iter([times[i:i + FRAMES_PER_CHUNK]
+                       for i in range(0, len(times), FRAMES_PER_CHUNK)])
+        slots = range(0, self.workers * CHUNKS_PER_WORKER * FRAMES_PER_CHUNK, FRAMES_PER_CHUNK)
+        # an anonymous mapping is shared with the processes forked after it is made
+        frames = np.frombuffer(mmap.mmap(-1, len(slots) * FRAMES_PER_CHUNK * static_image.nbytes),
+                               dtype=static_image.dtype)
+        frames = frames.reshape((len(slots) * FRAMES_PER_CHUNK, ) + static_image.shape)
+        # forked workers inherit the play, animations cannot be pickled in general
+        FRAME_RENDER['play'] = (scene, animations, moving_mobjects, static_image, frames)
+        try:
+            with multiprocessing.get_context('fork').Pool(self.workers) as pool:
+                pending = collections.deque()
+
+                def draw_next_chunk(slot):
+                    chunk = next(chunks, None)
+                    if chunk is not None:
+                        pending.append((pool.apply_async(render_frames, (slot, chunk)),
+                                        len(chunk)))
+
+                for slot in slots:
+                    draw_next_chunk(slot)
+                progress = iter(time_progression)
+                while pending:
+                    result, length = pending.popleft()
+                    slot = result.get()
+                    for frame in frames[slot:slot + length]:
+                        next(progress, None)
+                        scene.add_frames(np.array(frame))
+                    draw_next_chunk(slot)
+                time_progression.close()
+        finally:
+            FRAME_RENDER.clear()
+        self.parallel_plays += 1
@@ -0,0 +1,115 @@
+from collections import namedtuple
+from manimlib.imports import *
+
+
+# Pixels around a path's points, besides its stroke, that antialiasing may draw on
+ANTIALIAS_PADDING = 1
+
+# Miter limit of the cairo contexts of manim's cameras, cairo's default: joins whose miter is
+# longer than this many stroke widths are bevelled
+MITER_LIMIT = 10
+
+# scale, offset: of the x and y pixel coordinates of points
+# line_scale: pixel width of a stroke of width 1
+PixelTransform = namedtuple('PixelTransform', ['scale', 'offset', 'line_scale'])
+
+
+def pixel_transform(camera):
+    ''' Returns the PixelTransform of camera's current frame, as set on its cairo contexts '''
+    pixel_width, pixel_height = camera.get_pixel_width(), camera.get_pixel_height()
+    frame_width = camera.get_frame_width()
+    scale = np.array([pixel_width / frame_width, -pixel_height / camera.get_frame_height()])
+    offset = np.array([pixel_width, pixel_height]) / 2 - camera.get_frame_center()[:2] * scale
+    line_scale = camera.cairo_line_width_multiple * frame_width / FRAME_WIDTH * scale[0]
+    return PixelTransform(scale, offset, line_scale)
+
+
+def frame_state(camera):
+    ''' Returns the position and size of camera's frame and pixels, and its background '''
+    return (tuple(camera.get_frame_center()), camera.get_frame_width(),
+            camera.get_frame_height(), camera.get_pixel_array().shape, id(camera.background))
+
+
+def miter_ratio(vmobject):
+    '''
+    Returns how many half stroke widths the joins of vmobject's path reach past its points,
+    as cairo draws them. A miter joining curves at an angle reaches 1 / sin(angle / 2) half
+    widths past the corner, a bevel and the sides of the stroke one half width
+    '''
+    nppcc = vmobject.n_points_per_cubic_curve
+    points = vmobject.points[:len(vmobject.points) // nppcc * nppcc, :2]
+    if len(points) == 0:
+        return 1
+    starts, handles1, handles2, ends = [points[i::nppcc] for i in range(nppcc)]
+
+    def is_close(points1, points2):
+        # like consider_points_equals_2d, which splits the path into subpaths
+        return np.isclose(points1, points2, atol=vmobject.tolerance_for_point_equality).all(axis=1)
+
+    # directions curves leave their start and reach their end in, from their first handle not
+    # on the anchor
+    leaving, reaching = ends - starts, ends - starts
+    for handle in [handles2, handles1]:
+        leaving = np.where(is_close(handle, starts)[:, None], leaving, handle - starts)
+    for handle in [handles1, handles2]:
+        reaching = np.where(is_close(handle, ends)[:, None], reaching, ends - handle)
+
+    # curves joined to the next one, and subpaths closed back to their start
+    joined = is_close(ends[:-1], starts[1:])
+    first_curves = np.concatenate([[0], np.flatnonzero(~joined) + 1])
+    last_curves = np.concatenate([np.flatnonzero(~joined), [len(starts) - 1]])
+    closed = is_close(ends[last_curves], starts[first_curves])
+    incoming = np.concatenate([reaching[:-1][joined], reaching[last_curves][closed]])
+    outgoing = np.concatenate([leaving[1:][joined], leaving[first_curves][closed]])
+
+    lengths = np.linalg.norm(incoming, axis=1) * np.linalg.norm(outgoing, axis=1)
+    turning = np.einsum('ij,ij->i', incoming, outgoing)[lengths > 0] / lengths[lengths > 0]
+    # sin(angle / 2) of the angle between the curves at each join, joins at angles too sharp
+    # for the miter limit are bevelled, borderline ones are taken as mitred
+    half_sines = np.sqrt(np.clip((1 + turning) / 2, 0, 1))
+    mitred = half_sines[half_sines * MITER_LIMIT >= 1 - 1e-6]
+    return 1 / min(mitred.min(initial=1), 1)
+
+
+def stroke_padding(vmobject, transform):
+    '''
+    Pixels around vmobject's points its strokes and their antialiasing may draw on, including
+    the mitred corners of sharp joins, as in arrow tips
+    '''
+    width = max(vmobject.get_stroke_width(background=True), vmobject.get_stroke_width())
+    if width == 0:
+        return ANTIALIAS_PADDING
+    half_width = width * transform.line_scale / 2
+    return int(np.ceil(half_width * miter_ratio(vmobject))) + ANTIALIAS_PADDING
+
+
+def pixel_bounds(vmobjects, transform):
+    '''
+    Returns the [left, top, right, bottom) pixels each of vmobjects may draw on, as an array
+    with a row per vmobject, vmobjects without points draw on no pixels
+    '''
+    bounds = np.zeros((len(vmobjects), 4), dtype=int)
+    for i, vmobject in enumerate(vmobjects):
+        if len(vmobject.points) == 0:
+            continue
+        padding = stroke_padding(vmobject, transform)
+        pixel_coords = vmobject.points[:, :2] * transform.scale + transform.offset
+        bounds[i, :2] = np.floor(pixel_coords.min(axis=0)) - padding
+        bounds[i, 2:] = np.ceil(pixel_coords.max(axis=0)) + padding
+    return bounds
+
+
+def intersecting(bounds, rect):
+    ''' Returns which of bounds have pixels in rect '''
+    return (bounds[:, 0] < rect[2]) & (bounds[:, 2] > rect[0]) & \
+        (bounds[:, 1] < rect[3]) & (bounds[:, 3] > rect[1])
+
+
+def clip_bounds(rect, pixel_array):
+    ''' Returns rect within pixel_array, None if no pixel of it is '''
+    height, width = pixel_array.shape[:2]
+    left, top = max(rect[0], 0), max(rect[1], 0)
+    right, bottom = min(rect[2], width), min(rect[3], height)
+    if left >= right or top >= bottom:
+        return None
+    return left, top, right, bottom
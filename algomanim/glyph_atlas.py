@@ -0,0 +1,98 @@
+from collections import namedtuple
+from manimlib.imports import *
+
+
+# node_font and text_font starting with this lay labels out from the glyphs of the font after it
+ATLAS_PREFIX = 'atlas:'
+
+# Character every glyph is made between, to measure how far it is set from its neighbours
+REFERENCE_CHAR = '0'
+
+# parts: copies of the glyph's paths, with the centre of its left side on the origin
+# lead, trail: space from the reference character before it, and to the one after it
+# offset: height of its centre above the centre of the reference character
+Glyph = namedtuple('Glyph', ['parts', 'width', 'height', 'lead', 'trail', 'offset'])
+
+
+class GlyphAtlas:
+
+    '''
+    Makes the text of every character once in one font and colour, and lays labels out by
+    copying the point arrays of their characters, instead of making a text mobject for every
+    label. Each character is made between two reference characters, which gives the spaces set
+    around it, so labels are spaced like the text mobject of the whole label without kerning
+
+    Args:
+        make_text (function): Returns the text mobject of a string in the font and colour
+
+    Attributes:
+        glyphs (dict): Glyph of every character made, by character
+        made (int): Number of text mobjects made
+    '''
+
+    def __init__(self, make_text):
+        self.make_text = make_text
+        self.glyphs = {}
+        self.made = 0
+
+    def glyph(self, char):
+        ''' Returns the Glyph of char, making it the first time it is used '''
+        glyph = self.glyphs.get(char)
+        if glyph is not None:
+            return glyph
+
+        self.made += 1
+        text = self.make_text(REFERENCE_CHAR + char + REFERENCE_CHAR)
+        paths = text.family_members_with_points()
+        first, last = paths[0], paths[-1]
+        if len(paths) == 2:
+            # characters with no outline are set with half of the space between two reference
+            # characters on each side
+            gap = self.glyph(REFERENCE_CHAR).lead
+            glyph = Glyph((), last.get_left()[0] - first.get_right()[0] - gap, 0,
+                          gap / 2, gap / 2, 0)
+        else:
+            group = VGroup(*[path.copy() for path in paths[1:-1]])
+            lead = group.get_left()[0] - first.get_right()[0]
+            trail = last.get_left()[0] - group.get_right()[0]
+            offset = group.get_center()[1] - first.get_center()[1]
+            width, height = group.get_width(), group.get_height()
+            group.shift(-group.get_left())
+            glyph = Glyph(tuple(group.submobjects), width, height, lead, trail, offset)
+        self.glyphs[char] = glyph
+        return glyph
+
+    def make_label(self, text_string, scale=1):
+        '''
+        Returns a VGroup of copies of the paths of text_string's glyphs, centred on the origin
+        and scaled by scale
+        '''
+        # spaces between two characters, less the space between two reference characters
+        gap = self.glyph(REFERENCE_CHAR).lead
+        placed = []
+        left = 0
+        prev = None
+        for char in text_string:
+            glyph = self.glyph(char)
+            if prev is not None:
+                left += prev.trail + glyph.lead - gap
+            if glyph.parts:
+                placed.append((glyph, left))
+            left += glyph.width
+            prev = glyph
+
+        label = VGroup()
+        if not placed:
+            return label
+        right = max(start + glyph.width for glyph, start in placed)
+        top = max(glyph.offset + glyph.height / 2 for glyph, _ in placed)
+        bottom = min(glyph.offset - glyph.height / 2 for glyph, _ in placed)
+        center = np.array([(placed[0][1] + right) / 2, (top + bottom) / 2, 0])
+
+        for glyph, start in placed:
+            shift = np.array([start, glyph.offset, 0]) - center
+            for part in glyph.parts:
+                part = part.copy()
+                part.points = (part.points + shift) * scale
+                label.add(part)
+        return label
@@ -0,0 +1,137 @@
+import hashlib
+import os
+from collections import OrderedDict
+import numpy as np
+from manimlib.imports import *
+from algomanim.block_cache import VISUAL_ATTRS, hash_value
+
+
+DEFAULT_CACHE_DIR = './media/algomanim/label_cache'
+DEFAULT_MAX_SIZE = 1024
+
+# Bumped whenever the way labels are keyed or stored changes, so that old files are never read
+CACHE_VERSION = b'algomanim-label-cache-2'
+
+
+def is_stored(attr, value):
+    ''' If save_mobject stores the attribute attr of a mobject '''
+    return attr in VISUAL_ATTRS or isinstance(value, (bool, int, float, str))
+
+
+def save_mobject(path, mobject):
+    '''
+    Stores the drawn attributes, the other attributes holding a single number or string, like
+    fill_opacity, and the structure of mobject's family in an .npz file
+    '''
+    family = mobject.get_family()
+    indexes = {id(member): i for i, member in enumerate(family)}
+    arrays = {'count': np.array(len(family))}
+    for i, member in enumerate(family):
+        for attr, value in vars(member).items():
+            if is_stored(attr, value):
+                arrays[f'{i}_{attr}'] = np.asarray(value)
+        arrays[f'{i}_submobjects'] = np.array([indexes[id(sub)] for sub in member.submobjects],
+                                              dtype=int)
+
+    # renders running in parallel may store the same label at once
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as npz_file:
+        np.savez(npz_file, **arrays)
+    os.replace(temp_path, path)
+
+
+def load_mobject(path):
+    '''
+    Returns a VMobject drawn like the mobject stored by save_mobject, with a VMobject for each
+    member of its family, so no SVG is parsed
+    '''
+    with np.load(path) as arrays:
+        family = [VMobject() for _ in range(int(arrays['count']))]
+        for name in arrays.files:
+            index, _, attr = name.partition('_')
+            if attr and attr != 'submobjects':
+                value = arrays[name]
+                setattr(family[int(index)], attr, value.item() if value.ndim == 0 else value)
+        for i, member in enumerate(family):
+            member.submobjects = [family[j] for j in arrays[f'{i}_submobjects']]
+    return family[0]
+
+
+class LabelCache:
+
+    '''
+    Memoizes the text mobjects of node labels and scene texts, returning a copy of the
+    mobject made the first time a label was asked for, so repeated labels are not parsed again
+    Labels are keyed by their string, font, colour and scale. The least recently used labels
+    are dropped once more than max_size are kept. With a directory, labels are also stored as
+    .npz files that later renders load instead of parsing their SVG. Loaded labels are
+    VMobjects, labels have the label_key attribute so that the BlockVideoCache hashes a label
+    made and a label loaded the same
+
+    Args:
+        max_size (int): Maximum number of labels kept in memory
+        directory (str): Directory the label files are stored in, None to keep them in memory
+
+    Attributes:
+        labels (OrderedDict): Label mobjects by key, from the least to the most recently used
+        hits (int): Number of labels copied from memory
+        disk_hits (int): Number of labels loaded from the directory
+        misses (int): Number of labels made
+    '''
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, directory=None):
+        self.max_size = max_size
+        self.directory = directory
+        self.labels = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        digest = hashlib.sha256(CACHE_VERSION)
+        hash_value(digest, key)
+        return os.path.join(self.directory, digest.hexdigest() + '.npz')
+
+    def load(self, key):
+        ''' Returns the label stored for key in the directory, None if there is none '''
+        if self.directory is None:
+            return None
+        try:
+            return load_mobject(self.path(key))
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def save(self, key, label):
+        ''' Stores label in the directory, if there is one '''
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        save_mobject(self.path(key), label)
+
+    def has(self, key):
+        ''' Returns if the label of key is kept in memory or stored in the directory '''
+        return key in self.labels or \
+            (self.directory is not None and os.path.exists(self.path(key)))
+
+    def get(self, key, make):
+        ''' Returns a copy of the label stored for key, calling make() to make it if needed '''
+        label = self.labels.get(key)
+        if label is not None:
+            self.hits += 1
+            self.labels.move_to_end(key)
+            return label.copy()
+
+        label = self.load(key)
+        if label is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            # the label made is kept as it is, only later renders use the stored one
+            label = make()
+            self.save(key, label)
+
+        label.label_key = key
+        self.labels[key] = label
+        if len(self.labels) > self.max_size:
+            self.labels.popitem(last=False)
+        return label.copy()
@@ -1,6 +1,25 @@
 # pylint: disable=R0903
-import inspect
-from collections import Counter
+import sys
+import threading
+from collections import Counter, defaultdict
+
+
+class MetadataCallStack(threading.local):
+
+    '''
+    Names of the functions decorated with attach_metadata that are currently running,
+    innermost last. Kept per thread so that scenes built on different threads do not mix
+
+    Attributes:
+        names (string[])
+    '''
+
+    def __init__(self):
+        super().__init__()
+        self.names = []
+
+
+metadata_calls = MetadataCallStack()
 
 
 def attach_metadata(func):
@@ -17,7 +36,12 @@ def attach_metadata(func):
             kwargs["metadata"] = meta
 
         # run function, get back result
-        result = func(*args, **kwargs)
+        # its name is recorded so that LowerMetadata.create can name its LowerMetadata
+        metadata_calls.names.append(func.__name__)
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            metadata_calls.names.pop()
 
         # if metadata was created, add it to the scene
         if metadata is None and len(meta.children) > 0:
@@ -41,8 +65,12 @@ class Metadata:
             to other operations with the same name
         children (LowerMetadata[]): Information corresponding to the lower level functions
             associated with this operation
+        lower_index (dict): Maps the meta_name of each child to its LowerMetadata[],
+            None until it is first needed by find_lower
     '''
 
+    __slots__ = ('meta_name', 'fid', 'animated', 'children', 'lower_index')
+
     counter = Counter()
 
     def __init__(self, meta_name, animated=True):
@@ -54,9 +82,20 @@ class Metadata:
         self.animated = animated
 
         self.children = []
+        self.lower_index = None
 
     def add_lower(self, lowermeta):
         self.children.append(lowermeta)
+        if self.lower_index is not None:
+            self.lower_index[lowermeta.meta_name].append(lowermeta)
+
+    def find_lower(self, meta_name):
+        ''' Returns the children with the given meta_name, in the order they were added '''
+        if self.lower_index is None:
+            self.lower_index = defaultdict(list)
+            for lowermeta in self.children:
+                self.lower_index[lowermeta.meta_name].append(lowermeta)
+        return self.lower_index.get(meta_name, [])
 
     def get_all_action_pairs(self):
         return list(map(lambda lower: lower.action_pair, self.children))
@@ -79,6 +118,33 @@ class Metadata:
         return ''.join(strings)
 
 
+class MetadataIndex:
+
+    '''
+    Lookup tables over the Metadata of a scene, updated as Metadata is added so that
+    finding the Metadata of an operation costs O(matches)
+    Lower level lookups go through Metadata.find_lower
+
+    Attributes:
+        by_name (dict): Maps meta_name to Metadata[]
+        by_occurence (dict): Maps (meta_name, fid) to Metadata[]
+    '''
+
+    def __init__(self):
+        self.by_name = defaultdict(list)
+        self.by_occurence = defaultdict(list)
+
+    def add(self, metadata):
+        self.by_name[metadata.meta_name].append(metadata)
+        self.by_occurence[(metadata.meta_name, metadata.fid)].append(metadata)
+
+    def find(self, meta_name, occurence=None):
+        ''' Returns the Metadata with the given meta_name (and fid), in the order they were added '''
+        if occurence is None:
+            return self.by_name.get(meta_name, [])
+        return self.by_occurence.get((meta_name, occurence), [])
+
+
 class LowerMetadata:
 
     '''
@@ -87,28 +153,46 @@ class LowerMetadata:
     Args:
         meta_name (string): Name of the Metadata that this is nested under
         action_pair (AlgoSceneActionPair): Animations corresponding to this operation
-        val ([]): List of values affected by function
+        val ([]): List of values affected by function, or a function returning it
         show_in_panel: Whether this operation is shown in the GUI side panel
+
+    Attributes:
+        val_source: val as given, it is only read the first time val is needed
+        captured_val ([]): val without None values, None until val is first needed
     '''
 
+    __slots__ = ('meta_name', 'action_pair', 'val_source', 'captured_val', 'show_in_panel')
+
     def __init__(self, meta_name, action_pair, val=None, show_in_panel=True):
-        if val is None:
-            # default to empty list
-            val = []
-        else:
-            val = list(filter(lambda v: v is not None, val))
         self.meta_name = meta_name
         self.action_pair = action_pair
-        self.val = val
+        self.val_source = val
+        self.captured_val = None
         self.show_in_panel = show_in_panel
 
+    @property
+    def val(self):
+        if self.captured_val is None:
+            val = self.val_source() if callable(self.val_source) else self.val_source
+            self.captured_val = [] if val is None else [v for v in val if v is not None]
+            self.val_source = None
+        return self.captured_val
+
     def __str__(self):
         return f'LowerMetadata(meta={self.meta_name}, val={self.val}' + \
             f', action_pair={self.action_pair})'
 
     @staticmethod
     def create(action_pair, val=None, show_in_panel=True):
-        ''' Returns LowerMetadata with the name of the function that called this '''
-        currframe = inspect.currentframe()
-        return LowerMetadata(inspect.getouterframes(currframe, 2)[1][3],
-                             action_pair, val, show_in_panel)
+        '''
+        Returns LowerMetadata with the name of the function that called this
+        The caller must be decorated with attach_metadata, other callers should name their
+        LowerMetadata explicitly
+        '''
+        names = metadata_calls.names
+        if names:
+            meta_name = names[-1]
+        else:
+            # not called within attach_metadata, read the name from the calling frame
+            meta_name = sys._getframe(1).f_code.co_name  # pylint: disable=W0212
+        return LowerMetadata(meta_name, action_pair, val, show_in_panel)
@@ -6,15 +6,29 @@ class MetadataBlock:
     Args:
         metadata (Metadata[]): List of Metadata corresponding to the animations of the block
         action_pairs (AlgoSceneActionPairs[])
-        start_time (float)
-        run_time (float): Total runtime of all the animations in the block
+        first_block (AnimationBlock): Earliest AnimationBlock of the action_pairs
+        last_block (AnimationBlock): Latest AnimationBlock of the action_pairs
+
+    Attributes:
+        start_time (float): Read from first_block, so it follows runtime changes
+        runtime (float): Total runtime of all the animations in the block
     '''
 
-    def __init__(self, metadata, action_pairs, start_time, runtime):
+    __slots__ = ('metadata', 'action_pairs', 'first_block', 'last_block')
+
+    def __init__(self, metadata, action_pairs, first_block, last_block):
         self.metadata = metadata
         self.action_pairs = action_pairs
-        self.start_time = start_time
-        self.runtime = runtime
+        self.first_block = first_block
+        self.last_block = last_block
+
+    @property
+    def start_time(self):
+        return self.first_block.start_time
+
+    @property
+    def runtime(self):
+        return self.last_block.end_time - self.first_block.start_time
 
     def desc(self, sep='\n'):
         ''' Get all relevant animation information stored in the action pair metadata '''
@@ -26,6 +40,13 @@ class MetadataBlock:
     def end_position(self):
         return (self.start_time + self.runtime) * 1000
 
+    def is_active_at(self, position):
+        ''' Whether the animations of this block are playing at position (ms) in the video '''
+        start_position = self.start_position()
+        end_position = self.end_position()
+        return start_position <= position < end_position or \
+            start_position == position == end_position
+
     def start_index(self):
         assert len(self.action_pairs) > 0
         return self.action_pairs[0].get_index()
@@ -0,0 +1,89 @@
+from bisect import bisect_right
+
+
+# Seconds the searched prefix sums may be off from the times blocks are checked with, which
+# are summed in another order and converted to ms. Far larger than their rounding errors
+TIME_TOLERANCE = 1e-6
+
+
+class MetadataBlockIndex:
+
+    '''
+    Interval index over the MetadataBlocks of a scene, finding the blocks active at a point
+    in the video in O(log n + k) and the index of a block in O(1)
+    Blocks are indexed by the positions of their first and last AnimationBlock, which do not
+    change when runtimes are edited, so the index stays valid as block_timings changes
+
+    Args:
+        metadata_blocks (MetadataBlock[]): Blocks in the order they are shown
+        block_timings (BlockTimings): Runtimes of the AnimationBlocks of the scene
+
+    Attributes:
+        indexes (dict): Maps each MetadataBlock to its index in metadata_blocks
+        order (int[]): Indexes of metadata_blocks sorted by their first AnimationBlock
+        starts (int[]): Position of the first AnimationBlock of each block in order
+        leaves (int): Number of leaves in max_ends, a power of two
+        max_ends (int[]): Segment tree over order, each node holds the latest last
+            AnimationBlock position of the blocks in its range
+    '''
+
+    def __init__(self, metadata_blocks, block_timings):
+        # copied as the GUI inserts its own blocks into the scene's list
+        self.metadata_blocks = list(metadata_blocks)
+        self.block_timings = block_timings
+        self.indexes = {block: i for i, block in enumerate(self.metadata_blocks)}
+        self.order = sorted(range(len(self.metadata_blocks)),
+                            key=lambda i: self.metadata_blocks[i].first_block.position)
+        self.starts = [self.metadata_blocks[i].first_block.position for i in self.order]
+
+        self.leaves = 1
+        while self.leaves < len(self.order):
+            self.leaves *= 2
+        self.max_ends = [-1] * (2 * self.leaves)
+        for leaf, i in enumerate(self.order):
+            self.max_ends[self.leaves + leaf] = self.metadata_blocks[i].last_block.position
+        for node in range(self.leaves - 1, 0, -1):
+            self.max_ends[node] = max(self.max_ends[2 * node], self.max_ends[2 * node + 1])
+
+    def __len__(self):
+        return len(self.metadata_blocks)
+
+    def index(self, metadata_block):
+        ''' Returns the index of metadata_block in metadata_blocks '''
+        if metadata_block not in self.indexes:
+            raise ValueError('metadata block is not in index')
+        return self.indexes[metadata_block]
+
+    def find_active(self, position):
+        ''' Returns the blocks active at position (ms), in the order of metadata_blocks '''
+        time = position / 1000
+        # widen the range of AnimationBlocks to every block ending within the tolerance of
+        # time, including whole runs of zero-length blocks, is_active_at gives the exact answer
+        first = self.block_timings.find_position(time - TIME_TOLERANCE, inclusive=True)
+        last = self.block_timings.find_position(time + TIME_TOLERANCE)
+
+        candidates = sorted(self.find_overlapping(first, last))
+        return [self.metadata_blocks[i] for i in candidates
+                if self.metadata_blocks[i].is_active_at(position)]
+
+    def find_overlapping(self, first, last):
+        '''
+        Returns the indexes of the blocks whose AnimationBlocks overlap the positions
+        first to last (inclusive)
+        '''
+        # only blocks starting at or before last can overlap
+        num_starting = bisect_right(self.starts, last)
+
+        found = []
+        stack = [(1, 0, self.leaves)]
+        while stack:
+            node, node_start, node_end = stack.pop()
+            if node_start >= num_starting or self.max_ends[node] < first:
+                continue
+            if node >= self.leaves:
+                found.append(self.order[node_start])
+                continue
+            node_mid = (node_start + node_end) // 2
+            stack.append((2 * node, node_start, node_mid))
+            stack.append((2 * node + 1, node_mid, node_end))
+        return found
@@ -0,0 +1,194 @@
+import types
+from collections import namedtuple
+import numpy as np
+from manimlib.imports import *
+from algomanim.algoaction import EMPTY_ACTION
+from algomanim.algoobject import AlgoObject
+from algomanim.animation_block import AnimationBlock
+
+
+# Methods giving the same result when called again with the same arguments
+IDEMPOTENT_METHODS = ('set_fill', 'set_stroke', 'move_to', 'next_to', 'regroup')
+
+# Methods placing a mobject regardless of where it was before
+PLACEMENT_METHODS = ('move_to', 'next_to')
+
+# Effect of an optimization pass: number of action pairs turned into static or empty actions,
+# of animated blocks no longer played and of frames no longer written
+PeepholeReport = namedtuple('PeepholeReport', ['pairs', 'blocks', 'frames'])
+
+
+def split_blocks(action_pairs):
+    ''' Splits action_pairs into the lists of pairs create_animation_blocks bundles together '''
+    blocks = []
+    for action_pair in action_pairs:
+        action = action_pair.curr_action()
+        if blocks and AnimationBlock.joins(blocks[-1][0].curr_action(), action):
+            blocks[-1].append(action_pair)
+        else:
+            blocks.append([action_pair])
+    return blocks
+
+
+def fill_calls(block):
+    '''
+    Returns the mobjects whose fill is animated by block with the arguments of their set_fill,
+    by id of the mobject, None if block animates anything else
+    '''
+    calls = {}
+    for action_pair in block:
+        action = action_pair.curr_action()
+        transform = action.transform
+        if action.is_static() or transform is None:
+            return None
+        if transform.transform is AlgoObject.fill_all:
+            # bulk fill of AlgoList, the color is followed by the mobjects
+            color, *mobjects = transform.args
+            calls.update((id(mobject), (mobject, [color])) for mobject in mobjects)
+            continue
+        if transform.transform is not ApplyMethod:
+            return None
+        method, *args = transform.args
+        if not isinstance(method, types.MethodType) or method.__name__ != 'set_fill':
+            return None
+        calls[id(method.__self__)] = (method.__self__, args)
+    return calls
+
+
+def is_repeated_fill(calls, prev_calls):
+    ''' If every fill of calls was set to the same value by prev_calls '''
+    for mobject_id, (_, args) in calls.items():
+        if mobject_id not in prev_calls:
+            return False
+        _, prev_args = prev_calls[mobject_id]
+        if len(args) != len(prev_args) or not all(map(same_value, args, prev_args)):
+            return False
+    return True
+
+
+def same_value(value1, value2):
+    if isinstance(value1, np.ndarray) or isinstance(value2, np.ndarray):
+        return isinstance(value1, np.ndarray) and isinstance(value2, np.ndarray) and \
+            np.array_equal(value1, value2)
+    if isinstance(value1, (int, float, str)) and type(value1) is type(value2):
+        return value1 == value2
+    return value1 is value2
+
+
+def static_call(action_pair):
+    ''' Returns the bound method and args run by a static action pair, None if it has none '''
+    action = action_pair.curr_action()
+    if not action.is_static() or action.transform is None:
+        return None
+    method = action.transform.transform
+    if not isinstance(method, types.MethodType):
+        return None
+    return method, action.transform.args
+
+
+def is_self_relative(mobject, args):
+    ''' If a placement of mobject with args is relative to mobject's own position '''
+    family = mobject.get_family()
+    for arg in args:
+        if isinstance(arg, AlgoObject):
+            arg = arg.grp
+        if isinstance(arg, Mobject) and any(member in family for member in arg.get_family()):
+            return True
+    return False
+
+
+def is_repeated_call(call, next_call):
+    ''' If next_call is an idempotent method called again with the same arguments '''
+    method, args = call
+    next_method, next_args = next_call
+    if next_method.__name__ not in IDEMPOTENT_METHODS or next_method != method or \
+            len(args) != len(next_args) or not all(map(same_value, args, next_args)):
+        return False
+    # placing a mobject next to itself shifts it again, like shift_scene
+    return next_method.__name__ not in PLACEMENT_METHODS or \
+        not is_self_relative(next_method.__self__, next_args)
+
+
+def is_overwritten_placement(call, next_call):
+    ''' If the position set by call is replaced by next_call without being used '''
+    method, _ = call
+    next_method, next_args = next_call
+    mobject = method.__self__
+    if method.__name__ not in PLACEMENT_METHODS or \
+            next_method.__name__ not in PLACEMENT_METHODS or next_method.__self__ is not mobject:
+        return False
+    # a new position relative to the mobject itself uses the one before
+    return not is_self_relative(mobject, next_args)
+
+
+def drop_repeated_fills(action_pairs, frame_rate):
+    '''
+    Makes fill animations static when the block before them animates the fill of the same
+    mobjects to the same values, like a highlight of nodes already highlighted, as every frame
+    of them shows the state the block before ended in. Blocks are only changed when all their
+    action pairs can be skipped and have their default runtime
+    Returns the number of pairs, blocks and frames eliminated
+    '''
+    pairs = blocks = frames = 0
+    split = split_blocks(action_pairs)
+    for prev_block, block in zip(split, split[1:]):
+        prev_calls = fill_calls(prev_block)
+        calls = fill_calls(block)
+        if prev_calls is None or calls is None or not is_repeated_fill(calls, prev_calls) or \
+                any(action_pair.get_runtime() is not None or
+                    action_pair.anim_action is action_pair.static_action
+                    for action_pair in block):
+            continue
+
+        block_frames = int(np.ceil(block[0].get_runtime_val() * frame_rate))
+        for action_pair in block:
+            # the static action still sets the fill, to the value it already has
+            action_pair.skip()
+        skipped = sum(action_pair.get_runtime() == 0 for action_pair in block)
+        pairs += skipped
+        if skipped == len(block):
+            blocks += 1
+            frames += block_frames
+    return pairs, blocks, frames
+
+
+def drop_dead_statics(action_pairs):
+    '''
+    Empties static actions repeating the one before them, and placements replaced by the next
+    static action before they are used
+    Returns the number of pairs eliminated
+    '''
+    pairs = 0
+    prev_pair, prev_call = None, None
+    for action_pair in action_pairs:
+        call = static_call(action_pair)
+        if prev_call is not None and call is not None:
+            if is_repeated_call(prev_call, call):
+                empty_static_action(action_pair)
+                pairs += 1
+                # the previous call stays in effect
+                continue
+            if is_overwritten_placement(prev_call, call):
+                empty_static_action(prev_pair)
+                pairs += 1
+        prev_pair, prev_call = action_pair, call
+    return pairs
+
+
+def empty_static_action(action_pair):
+    ''' Replaces the static action of action_pair, keeping it and its metadata in the scene '''
+    if action_pair.anim_action is action_pair.static_action:
+        action_pair.anim_action = EMPTY_ACTION
+    action_pair.static_action = EMPTY_ACTION
+
+
+def optimize_action_pairs(action_pairs, frame_rate):
+    '''
+    Peephole pass over action_pairs before they are bundled into blocks, removing animations
+    which show nothing new and static actions whose effect is overwritten before it is shown
+    Action pairs are never removed, so their metadata still shows every operation
+    Returns a PeepholeReport
+    '''
+    pairs, blocks, frames = drop_repeated_fills(action_pairs, frame_rate)
+    pairs += drop_dead_statics(action_pairs)
+    return PeepholeReport(pairs, blocks, frames)
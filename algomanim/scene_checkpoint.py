@@ -0,0 +1,312 @@
+import copyreg
+import hashlib
+import os
+import pickle
+import shutil
+import types
+import numpy as np
+from manimlib.imports import *
+from algomanim.algoobject import AlgoObject
+from algomanim.block_cache import CACHE_VERSION, VISUAL_ATTRS, hash_value, scene_state_hash
+
+
+DEFAULT_EVERY_BLOCKS = 50
+DEFAULT_EVERY_SECONDS = 10
+
+
+def collect_mobjects(value, found, depth=0):
+    ''' Appends the mobjects referenced by the arguments of an action to found '''
+    if depth > 3:
+        return
+    if isinstance(value, Mobject):
+        found.append(value)
+    elif isinstance(value, AlgoObject):
+        found.append(value.grp)
+    elif isinstance(value, Animation):
+        found.append(value.mobject)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            collect_mobjects(item, found, depth + 1)
+    elif isinstance(value, types.MethodType):
+        collect_mobjects(value.__self__, found, depth + 1)
+    elif isinstance(value, types.FunctionType):
+        for cell in value.__closure__ or ():
+            collect_mobjects(cell.cell_contents, found, depth + 1)
+
+
+def copy_value(value):
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, list):
+        return [copy_value(item) for item in value]
+    return value
+
+
+def is_plain(value):
+    ''' If value is data a checkpoint can keep, rather than a mobject or a function '''
+    if value is None or isinstance(value, (bool, int, float, str, np.ndarray, Color)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(is_plain(item) for item in value)
+    return False
+
+
+def prefix_hashes(scene):
+    '''
+    Returns a hash of the scene as planned before each AnimationBlock, and after the last
+    Equal hashes mean the blocks before it are the same, so the scene reaches the same state
+    Mobjects are described by their contents when first used and by reference afterwards,
+    hashes after a block that cannot be described are None
+    '''
+    digest = hashlib.sha256(CACHE_VERSION)
+    camera = scene.camera
+    hashes = []
+    try:
+        hash_value(digest, [type(scene).__qualname__, camera.pixel_width, camera.pixel_height,
+                            camera.frame_rate, scene.file_writer.movie_file_extension])
+        hash_value(digest, scene.camera_config)
+        digest.update(scene_state_hash(scene).encode())
+
+        seen = {}
+        hash_value(digest, [obj.grp for obj in scene.algo_objs], seen)
+        for anim_block in scene.anim_blocks:
+            hashes.append(digest.hexdigest())
+            hash_value(digest, anim_block.first_pair().get_runtime(), seen)
+            for action_pair in anim_block.action_pairs:
+                action = action_pair.curr_action()
+                hash_value(digest, [action.act, action.is_wait], seen)
+                if action.transform is not None:
+                    hash_value(digest, action.transform.transform, seen)
+                    hash_value(digest, action.transform.args, seen)
+        hashes.append(digest.hexdigest())
+    except ValueError:
+        pass
+    return hashes + [None] * (len(scene.anim_blocks) + 1 - len(hashes))
+
+
+class MobjectRegistry:
+
+    '''
+    Numbers the mobjects of a scene in the order the scene first uses them, which is the same
+    in every render of a scene as long as the blocks run so far are the same
+
+    Args:
+        scene (AlgoScene): Scene whose camera frame and algo_objs are registered first
+
+    Attributes:
+        members (Mobject[]): Registered mobjects and their families
+        indexes (dict): Maps the id of each member to its index in members
+    '''
+
+    def __init__(self, scene):
+        self.members = []
+        self.indexes = {}
+        frame = getattr(scene.camera, 'frame', None)
+        if frame is not None:
+            self.register(frame)
+        for algo_obj in scene.algo_objs:
+            self.register(algo_obj.grp)
+
+    def register(self, mobject):
+        for member in mobject.get_family():
+            if id(member) not in self.indexes:
+                self.indexes[id(member)] = len(self.members)
+                self.members.append(member)
+
+    def register_block(self, anim_block):
+        ''' Registers the mobjects used by the actions of anim_block '''
+        found = []
+        for action_pair in anim_block.action_pairs:
+            transform = action_pair.curr_action().transform
+            if transform is not None:
+                collect_mobjects(transform.transform, found)
+                collect_mobjects(transform.args, found)
+        for mobject in found:
+            self.register(mobject)
+
+    def index(self, mobject):
+        if id(mobject) not in self.indexes:
+            raise ValueError('mobject is not registered')
+        return self.indexes[id(mobject)]
+
+
+class SceneCheckpoint:
+
+    '''
+    State of a scene between two AnimationBlocks, stored by registry index so that it can
+    be restored into the mobjects of a later render of the same scene
+
+    Args:
+        position (int): Position of the next AnimationBlock to run
+        scene (AlgoScene): Scene to capture, raises ValueError if it shows a mobject
+            which is not in registry
+        registry (MobjectRegistry): Mobjects used by the blocks before position
+        movie_keys (str[]): BlockVideoCache keys of the partial movies written so far
+
+    Raises ValueError too if the scene has updaters or foreground mobjects, which the
+    checkpoint cannot restore
+
+    Attributes:
+        mobjects (int[]): Registry indexes of scene.mobjects
+        save_mobjects (int[]): Registry indexes of the mobjects saved by a fade out
+        types (type[]): Type of every registered mobject, a render whose registry differs
+            cannot resume from the checkpoint
+        states (dict[]): Plain attributes and submobject indexes of every registered mobject
+        time (float): Time of the scene
+    '''
+
+    def __init__(self, position, scene, registry, movie_keys):
+        if scene.foreground_mobjects or \
+                any(member.updaters for member in registry.members):
+            raise ValueError('updaters and foreground mobjects cannot be restored')
+        self.position = position
+        self.movie_keys = list(movie_keys)
+        self.mobjects = [registry.index(mobject) for mobject in scene.mobjects]
+        self.save_mobjects = [registry.index(mobject) for mobject in scene.save_mobjects or []]
+        self.types = [type(member) for member in registry.members]
+        self.states = [self.capture_mobject(member, registry) for member in registry.members]
+        self.time = scene.time
+
+    @staticmethod
+    def capture_mobject(mobject, registry):
+        state = {attr: copy_value(value) for attr, value in vars(mobject).items()
+                 if attr in VISUAL_ATTRS or is_plain(value)}
+        state['submobjects'] = [registry.index(sub) for sub in mobject.submobjects]
+        return state
+
+    def restore(self, scene, registry):
+        ''' Sets the registered mobjects of scene to the captured state '''
+        members = registry.members
+        for member, state in zip(members, self.states):
+            for attr, value in state.items():
+                if attr == 'submobjects':
+                    member.submobjects = [members[i] for i in value]
+                else:
+                    setattr(member, attr, copy_value(value))
+        scene.mobjects = [members[i] for i in self.mobjects]
+        scene.save_mobjects = [members[i] for i in self.save_mobjects]
+        scene.time = self.time
+        scene.num_plays = len(self.movie_keys)
+
+
+class SceneCheckpoints:
+
+    '''
+    Checkpoints of the last render of a scene, letting the next render start at the latest
+    checkpoint before its first changed block
+    The partial movies of the skipped blocks are copied from the scene's BlockVideoCache.
+    Checkpoints are stored with save, for renders by later processes to load
+
+    Args:
+        every_blocks (int): Number of blocks between checkpoints
+        every_seconds (float): Length of video between checkpoints,
+            a checkpoint is taken when either is reached
+
+    Attributes:
+        checkpoints (dict): Maps the prefix hash of a position to its SceneCheckpoint
+        resumed_at (int): Position the last render started at
+    '''
+
+    def __init__(self, every_blocks=DEFAULT_EVERY_BLOCKS, every_seconds=DEFAULT_EVERY_SECONDS):
+        self.every_blocks = every_blocks
+        self.every_seconds = every_seconds
+        self.checkpoints = {}
+        self.resumed_at = 0
+
+    def save(self, path):
+        ''' Stores the checkpoints in path, for renders of the scene by later processes '''
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # renders running in parallel may store the checkpoints of a scene at once
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as checkpoint_file:
+            pickler = pickle.Pickler(checkpoint_file)
+            # colours keep their equality function, which cannot be pickled
+            pickler.dispatch_table = {**copyreg.dispatch_table,
+                                      Color: lambda color: (Color, (color.hex_l, ))}
+            pickler.dump(self.checkpoints)
+        os.replace(temp_path, path)
+
+    def load(self, path):
+        '''
+        Adds the checkpoints stored in path, none if they cannot be read, like those of
+        a scene whose classes changed since
+        '''
+        try:
+            with open(path, 'rb') as checkpoint_file:
+                self.checkpoints.update(pickle.load(checkpoint_file))
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+                ValueError, TypeError):
+            pass
+
+    def find_resume(self, hashes, block_cache, extension):
+        ''' Returns the latest checkpoint matching hashes whose movies are all cached '''
+        for position in range(len(hashes) - 1, 0, -1):
+            checkpoint = self.checkpoints.get(hashes[position])
+            if checkpoint is not None and checkpoint.position == position and \
+                    all(block_cache.get(key, extension) for key in checkpoint.movie_keys):
+                return checkpoint
+        return None
+
+    def resume(self, scene, registry, hashes):
+        ''' Restores the latest usable checkpoint into scene and returns its position '''
+        file_writer = scene.file_writer
+        extension = file_writer.movie_file_extension
+        checkpoint = self.find_resume(hashes, scene.block_cache, extension)
+        if checkpoint is None:
+            return 0
+
+        for anim_block in scene.anim_blocks[:checkpoint.position]:
+            registry.register_block(anim_block)
+        if [type(member) for member in registry.members] != checkpoint.types:
+            # registering the same blocks again keeps the same order, unless the mobjects
+            # the blocks use are made differently, then the whole scene is rendered
+            return 0
+
+        for num_play, key in enumerate(checkpoint.movie_keys):
+            movie_path = os.path.join(file_writer.partial_movie_directory,
+                                      f'{num_play:05}{extension}')
+            shutil.copyfile(scene.block_cache.get(key, extension), movie_path)
+        checkpoint.restore(scene, registry)
+        return checkpoint.position
+
+    def is_due(self, anim_block, last_checkpoint):
+        if last_checkpoint is None:
+            return anim_block.position >= self.every_blocks or \
+                anim_block.start_time >= self.every_seconds
+        last_time = anim_block.timings.start_time(last_checkpoint.position)
+        return anim_block.position - last_checkpoint.position >= self.every_blocks or \
+            anim_block.start_time - last_time >= self.every_seconds
+
+    def run_blocks(self, scene):
+        ''' Runs the AnimationBlocks of scene through its block_cache, taking checkpoints '''
+        hashes = prefix_hashes(scene)
+        registry = MobjectRegistry(scene)
+        start = 0
+        if not scene.skip_animations and scene.file_writer.write_to_movie:
+            start = self.resume(scene, registry, hashes)
+        self.resumed_at = start
+
+        # checkpoints up to the resumed one belong to the same prefix and stay valid
+        checkpoints = {prefix: checkpoint for prefix, checkpoint in self.checkpoints.items()
+                       if checkpoint.position <= start and hashes[checkpoint.position] == prefix}
+        last_checkpoint = checkpoints.get(hashes[start])
+        movie_keys = list(last_checkpoint.movie_keys) if last_checkpoint else []
+
+        for anim_block in scene.anim_blocks[start:]:
+            position = anim_block.position
+            if position > start and hashes[position] is not None and \
+                    None not in movie_keys and self.is_due(anim_block, last_checkpoint):
+                try:
+                    last_checkpoint = SceneCheckpoint(position, scene, registry, movie_keys)
+                    checkpoints[hashes[position]] = last_checkpoint
+                except ValueError:
+                    # the scene shows a mobject no action refers to, try again later
+                    pass
+
+            registry.register_block(anim_block)
+            num_plays = scene.num_plays
+            key = scene.block_cache.run_block(scene, anim_block)
+            if scene.num_plays > num_plays:
+                movie_keys.append(key)
+
+        self.checkpoints = checkpoints
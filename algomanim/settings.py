@@ -3,6 +3,7 @@ from manimlib.imports import *
 
 DEFAULT_SETTINGS = {
     'show_code': False, # for parallel code animation
+    'optimize_actions': False, # skip animations and static actions showing nothing new
     'background_color': BLACK, # Changeable via GUI only
     'node_font': 'latex',
     'node_font_color': BLACK,
@@ -0,0 +1,167 @@
+import copy
+import sys
+from collections import OrderedDict, namedtuple
+import cairo
+from manimlib.imports import *
+from .frame_regions import pixel_transform, stroke_padding
+
+
+DEFAULT_SUBPIXEL_STEPS = 4
+DEFAULT_MIN_USES = 2
+DEFAULT_MAX_SPRITES = 4096
+
+# cairo's ARGB32 pixels are native endian 32 bit integers, with alpha in the most significant byte
+ALPHA_CHANNEL = 3 if sys.byteorder == 'little' else 0
+
+# pixels: premultiplied pixels as uint16
+# transparency: max value less the alpha of each pixel, repeated for every channel
+Sprite = namedtuple('Sprite', ['pixels', 'transparency'])
+
+
+class SpriteCamera(MovingCamera):
+
+    '''
+    MovingCamera drawing paths seen in earlier frames by compositing a raster of them, instead
+    of filling and stroking them again with cairo
+    Paths are keyed by their points in pixels from the corner of their sprite, rounded to
+    1 / sprite_subpixel_steps of a pixel, and their colours and stroke widths, so identical
+    node shapes and label glyphs at any position of the frame share a sprite. Sprites are
+    rasterized from the rounded points, so a path drawn from its sprite is at most
+    1 / (2 * sprite_subpixel_steps) of a pixel away from where cairo would draw it. A path is only
+    rasterized into a sprite once its key was seen sprite_min_uses times, moving and
+    transforming paths change every frame and are drawn with cairo
+
+    Attributes:
+        sprites (OrderedDict): Sprite of every key, least recently used first
+        seen (OrderedDict): Number of times each key without a sprite was drawn
+        sprite_hits (int): Number of paths drawn from a sprite
+        sprite_misses (int): Number of paths drawn with cairo
+    '''
+
+    CONFIG = {
+        'sprite_subpixel_steps': DEFAULT_SUBPIXEL_STEPS,
+        'sprite_min_uses': DEFAULT_MIN_USES,
+        'max_sprites': DEFAULT_MAX_SPRITES,
+    }
+
+    def __init__(self, frame=None, **kwargs):
+        self.sprites = OrderedDict()
+        self.seen = OrderedDict()
+        self.sprite_hits = 0
+        self.sprite_misses = 0
+        MovingCamera.__init__(self, frame, **kwargs)
+
+    def sprite_key(self, vmobject, transform):
+        '''
+        Returns the key of vmobject's sprite and the pixel its top left corner is drawn at,
+        None if vmobject has no points
+        '''
+        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        if len(points) == 0:
+            return None, None
+
+        widths = (vmobject.get_stroke_width(background=True), vmobject.get_stroke_width())
+        padding = stroke_padding(vmobject, transform)
+        pixel_coords = points[:, :2] * transform.scale + transform.offset
+        corner = np.floor(pixel_coords.min(axis=0)).astype(int) - padding
+        steps = np.rint((pixel_coords - corner) * self.sprite_subpixel_steps).astype(np.int32)
+
+        colors = (self.get_fill_rgbas(vmobject),
+                  self.get_stroke_rgbas(vmobject, background=True),
+                  self.get_stroke_rgbas(vmobject))
+        key = (transform.line_scale, padding, widths, steps.tobytes(),
+               tuple(rgbas.tobytes() for rgbas in colors))
+        if any(len(rgbas) > 1 for rgbas in colors):
+            # gradients are drawn along the sheen direction
+            key += (tuple(vmobject.get_sheen_direction()), vmobject.get_sheen_factor())
+        return key, corner
+
+    def make_sprite(self, vmobject, corner, transform):
+        '''
+        Rasterizes vmobject on transparent pixels, with corner at their top left, from its
+        points rounded like in its key so that the sprite is the same whichever path it is made of
+        '''
+        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        pixel_coords = points[:, :2] * transform.scale + transform.offset
+        steps = np.rint((pixel_coords - corner) * self.sprite_subpixel_steps)
+        pixel_coords = corner + steps / self.sprite_subpixel_steps
+        rounded = copy.copy(vmobject)
+        rounded.points = np.array(points)
+        rounded.points[:, :2] = (pixel_coords - transform.offset) / transform.scale
+        # the padding left of and above the points is also left right of and below them
+        padding = np.floor(pixel_coords.min(axis=0)).astype(int) - corner
+        width, height = np.ceil(pixel_coords.max(axis=0)).astype(int) + padding - corner + 1
+        pixels = np.zeros((height, width, self.n_channels), dtype=self.pixel_array_dtype)
+        surface = cairo.ImageSurface.create_for_data(pixels, cairo.FORMAT_ARGB32,
+                                                     width, height)
+        ctx = cairo.Context(surface)
+        scale, offset = transform.scale, transform.offset
+        ctx.set_matrix(cairo.Matrix(scale[0], 0, 0, scale[1],
+                                    offset[0] - corner[0], offset[1] - corner[1]))
+        self.display_vectorized(rounded, ctx)
+        surface.flush()
+        alpha = pixels[:, :, ALPHA_CHANNEL:ALPHA_CHANNEL + 1]
+        transparency = self.rgb_max_val - alpha.astype(np.uint16)
+        # compositing is a lot slower when transparency is broadcast to the channels
+        return Sprite(pixels.astype(np.uint16),
+                      np.repeat(transparency, self.n_channels, axis=2))
+
+    def get_sprite(self, vmobject, transform):
+        ''' Returns the Sprite of vmobject and the pixel of its corner, None to draw it '''
+        key, corner = self.sprite_key(vmobject, transform)
+        if key is None:
+            return None, None
+
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite, corner
+
+        uses = self.seen.pop(key, 0) + 1
+        if uses < self.sprite_min_uses:
+            self.seen[key] = uses
+            if len(self.seen) > self.max_sprites:
+                self.seen.popitem(last=False)
+            return None, None
+
+        sprite = self.make_sprite(vmobject, corner, transform)
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return sprite, corner
+
+    def composite_sprite(self, pixel_array, sprite, corner):
+        ''' Draws sprite over the 8 bit pixel_array with its top left at corner, like cairo '''
+        sprite_height, sprite_width = sprite.pixels.shape[:2]
+        height, width = pixel_array.shape[:2]
+        left, top = max(corner[0], 0), max(corner[1], 0)
+        right = min(corner[0] + sprite_width, width)
+        bottom = min(corner[1] + sprite_height, height)
+        if left >= right or top >= bottom:
+            return
+        rows = slice(top - corner[1], bottom - corner[1])
+        columns = slice(left - corner[0], right - corner[0])
+        target = pixel_array[top:bottom, left:right]
+        # target * transparency / 255 rounded, without dividing
+        kept = target * sprite.transparency[rows, columns]
+        kept += 128
+        kept += kept >> 8
+        kept >>= 8
+        kept += sprite.pixels[rows, columns]
+        target[:] = kept
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+        ctx = self.get_cairo_context(pixel_array)
+        surface = ctx.get_target()
+        transform = pixel_transform(self)
+        for vmobject in vmobjects:
+            sprite, corner = self.get_sprite(vmobject, transform)
+            if sprite is None:
+                self.sprite_misses += 1
+                self.display_vectorized(vmobject, ctx)
+            else:
+                self.sprite_hits += 1
+                # cairo draws straight into pixel_array, so its pending drawing is finished
+                surface.flush()
+                self.composite_sprite(pixel_array, sprite, corner)
+                surface.mark_dirty()
@@ -0,0 +1,161 @@
+import contextlib
+import glob
+import hashlib
+import os
+import re
+import subprocess
+from manimlib.imports import *
+from manimlib.constants import TEX_TEXT_TO_REPLACE
+from manimlib.utils.tex_file_writing import tex_hash
+import manimlib.constants as consts
+
+
+DEFAULT_MAX_PAGES = 500
+
+# Document class of manim's templates, and the one compiling every page of a batch separately
+TEMPLATE_DOCUMENT_CLASS = '\\documentclass[preview]{standalone}'
+BATCH_DOCUMENT_CLASS = '\\documentclass[preview,multi=true]{standalone}'
+
+
+def text_expressions(text_string):
+    '''
+    Returns the (expression, template_tex_file_body) of every LaTeX file compiled by
+    TextMobject(text_string): the whole text, and the text without alignment for its part
+    '''
+    expressions = []
+    for alignment in [TextMobject.CONFIG['alignment'], '']:
+        # only the attributes get_modified_expression reads are needed
+        tex_mobject = SingleStringTexMobject.__new__(SingleStringTexMobject)
+        tex_mobject.alignment = alignment
+        expressions.append((tex_mobject.get_modified_expression(text_string),
+                            TEMPLATE_TEXT_FILE_BODY))
+    return expressions
+
+
+def tex_file_path(expression, template_tex_file_body, extension):
+    ''' Path of a file manim writes when compiling expression, like generate_tex_file '''
+    return os.path.join(consts.TEX_DIR, tex_hash(expression, template_tex_file_body)) + \
+        extension
+
+
+def dvi_extension():
+    return '.xdv' if consts.TEX_USE_CTEX else '.dvi'
+
+
+def batch_page_paths(name):
+    return glob.glob(glob.escape(name) + '-*.svg')
+
+
+def remove_batch_files(name):
+    ''' Removes the files of the batch document name, and the pages not moved to manim's files '''
+    paths = [name + extension for extension in ['.tex', '.aux', '.log', dvi_extension()]]
+    for path in paths + batch_page_paths(name):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+class TexBatch:
+
+    '''
+    Compiles the LaTeX of many texts in a single LaTeX and dvisvgm run, instead of running
+    both for every text when its TextMobject is made
+    Texts are requested before they are made. The first one made compiles all pending texts as
+    the pages of one document, whose SVG pages are moved to the files manim reads for each
+    text. Texts that could not be compiled together are left to manim
+    Texts not requested before they are made, like the values set by change_value, are compiled
+    when they are made, as algo() places them by their size while the scene is constructed
+
+    Args:
+        max_pages (int): Maximum number of expressions compiled by one LaTeX run
+
+    Attributes:
+        pending (dict): (expression, template_tex_file_body) to compile, by SVG path
+        runs (int): Number of LaTeX runs
+        compiled (int): Number of expressions compiled by these runs
+    '''
+
+    def __init__(self, max_pages=DEFAULT_MAX_PAGES):
+        self.max_pages = max_pages
+        self.pending = {}
+        self.runs = 0
+        self.compiled = 0
+
+    def request_text(self, text_string):
+        ''' Adds the expressions of TextMobject(text_string) not compiled yet to pending '''
+        for expression, template in text_expressions(text_string):
+            svg_path = tex_file_path(expression, template, '.svg')
+            if svg_path in self.pending or os.path.exists(svg_path):
+                continue
+            dvi_path = tex_file_path(expression, template, dvi_extension())
+            if os.path.exists(dvi_path) and os.path.getsize(dvi_path) == 0:
+                # marker of a batch whose SVG was removed since, let manim compile it again
+                os.remove(dvi_path)
+            self.pending[svg_path] = (expression, template)
+
+    def compile_pending(self):
+        ''' Compiles every pending expression, a single one is left to manim '''
+        pending = list(self.pending.values())
+        self.pending = {}
+        if len(pending) < 2:
+            return
+
+        templates = {}
+        for expression, template in pending:
+            templates.setdefault(template, []).append(expression)
+        for template, expressions in templates.items():
+            for start in range(0, len(expressions), self.max_pages):
+                self.compile(expressions[start:start + self.max_pages], template)
+
+    def compile(self, expressions, template):
+        ''' Compiles expressions in one document, returns if the SVG of each was written '''
+        if TEMPLATE_DOCUMENT_CLASS not in template:
+            return False
+        preamble, body = template.split('\\begin{document}')
+        body = body.split('\\end{document}')[0]
+        pages = [f'\\begin{{standalone}}{body.replace(TEX_TEXT_TO_REPLACE, expression)}'
+                 f'\\end{{standalone}}\n' for expression in expressions]
+
+        digest = hashlib.sha256(template.encode())
+        for expression in expressions:
+            digest.update(expression.encode() + b'\0')
+        # renders running in parallel may compile the same batch at once
+        name = os.path.join(consts.TEX_DIR, f'batch_{digest.hexdigest()[:16]}_{os.getpid()}')
+        try:
+            with open(name + '.tex', 'w', encoding='utf-8') as tex_file:
+                tex_file.write(preamble.replace(TEMPLATE_DOCUMENT_CLASS, BATCH_DOCUMENT_CLASS))
+                tex_file.write('\\begin{document}\n' + ''.join(pages) + '\\end{document}\n')
+            return self.compile_file(name, expressions, template)
+        finally:
+            remove_batch_files(name)
+
+    def compile_file(self, name, expressions, template):
+        ''' Compiles the batch document name.tex and moves its page SVGs to manim's files '''
+        self.runs += 1
+        latex = ['xelatex', '-no-pdf'] if consts.TEX_USE_CTEX else ['latex']
+        try:
+            subprocess.run(latex + ['-interaction=batchmode', '-halt-on-error',
+                                    f'-output-directory={consts.TEX_DIR}', name + '.tex'],
+                           stdout=subprocess.DEVNULL, check=True)
+            subprocess.run(['dvisvgm', name + dvi_extension(), '-n', '-v', '0', '-p', '1-',
+                            '-o', name + '-%p.svg'],
+                           stdout=subprocess.DEVNULL, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            # manim compiles every text on its own, reporting the error of the failing one
+            return False
+
+        page_paths = {}
+        for path in batch_page_paths(name):
+            match = re.search(r'-(\d+)\.svg$', path)
+            if match:
+                page_paths[int(match.group(1))] = path
+        if sorted(page_paths) != list(range(1, len(expressions) + 1)):
+            return False
+
+        for page, expression in enumerate(expressions, start=1):
+            os.replace(page_paths[page], tex_file_path(expression, template, '.svg'))
+            dvi_path = tex_file_path(expression, template, dvi_extension())
+            if not os.path.exists(dvi_path):
+                # manim only converts the dvi of a text if its SVG does not exist
+                open(dvi_path, 'wb').close()
+        self.compiled += len(expressions)
+        return True
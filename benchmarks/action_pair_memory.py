@@ -0,0 +1,199 @@
+'''
+Measures the memory used per action pair when planning algomanim_examples/mergesort.py
+scaled up to a larger list. Only the scene is planned, nothing is rendered
+The planned scene is also copied into the baseline objects below, which store the same
+information as the action and metadata objects did before they were slotted, so that the
+sizes of both are reported
+
+Usage: python -m benchmarks.action_pair_memory [list size]
+'''
+import random
+import sys
+from collections import defaultdict
+from unittest.mock import patch, Mock
+from manimlib.imports import *
+from algomanim.algoscene import AlgoScene
+from algomanim.algolist import AlgoList
+from algomanim.algoaction import EMPTY_ACTION, do_nothing
+
+
+DEFAULT_SIZE = 1000
+
+
+def mergesort(algolist):
+    ''' Same as the helper in algomanim_examples/mergesort.py '''
+    if algolist.len() > 1:
+        mid_pt = algolist.len() // 2
+        left = algolist.slice(0, mid_pt, move=LEFT, shift=True)
+        right = algolist.slice(mid_pt, algolist.len(), move=RIGHT)
+        left = mergesort(left)
+        right = mergesort(right)
+        merged_list = algolist.merge(left, right, replace=True, shift=True, shift_vec=DOWN)
+        merged_list.replace(algolist)
+        return merged_list
+    return algolist
+
+
+def plan_mergesort(size):
+    scene = AlgoScene()
+    rng = random.Random(0)
+    mergesort(AlgoList(scene, [rng.randint(0, size) for _ in range(size)]))
+    return scene
+
+
+# pylint: disable=R0903,R0913
+class BaselineTransform:
+    ''' AlgoTransform without __slots__ '''
+
+    def __init__(self, args, transform=None, color_index=None):
+        self.transform = transform
+        self.args = args
+        self.color_index = color_index
+
+
+class BaselineAction:
+    ''' AlgoSceneAction without __slots__ '''
+
+    def __init__(self, act, transform=None, w_prev=False, can_set_runtime=False, is_wait=False):
+        self.act = act
+        self.transform = transform
+        self.w_prev = w_prev
+        self.can_set_runtime = can_set_runtime
+        self.is_wait = is_wait
+
+
+class BaselineActionPair:
+    ''' AlgoSceneActionPair without __slots__ '''
+
+    def __init__(self, anim_action, static_action, run_time, anim_block, timeline):
+        self.anim_action = anim_action
+        self.static_action = static_action
+        self.run_time = run_time
+        self.anim_block = anim_block
+        self.timeline = timeline
+
+
+class BaselineMetadata:
+    ''' Metadata without __slots__, indexing its children as they are added '''
+
+    def __init__(self, meta_name, fid, animated):
+        self.meta_name = meta_name
+        self.fid = fid
+        self.animated = animated
+        self.children = []
+        self.lower_index = defaultdict(list)
+
+    def add_lower(self, lowermeta):
+        self.children.append(lowermeta)
+        self.lower_index[lowermeta.meta_name].append(lowermeta)
+
+
+class BaselineLowerMetadata:
+    ''' LowerMetadata without __slots__, copying its values when it is created '''
+
+    def __init__(self, meta_name, action_pair, val, show_in_panel):
+        self.meta_name = meta_name
+        self.action_pair = action_pair
+        self.val = [] if val is None else list(filter(lambda v: v is not None, val))
+        self.show_in_panel = show_in_panel
+
+
+def baseline_scene(scene):
+    ''' Copies the action pairs and metadata of scene into the baseline objects '''
+    actions = {}
+
+    def baseline_action(action):
+        if action is EMPTY_ACTION:
+            # every empty action was a new static action
+            return BaselineAction(do_nothing, BaselineTransform([], transform=do_nothing),
+                                  w_prev=True)
+        if id(action) not in actions:
+            transform = action.transform
+            if transform is not None:
+                transform = BaselineTransform(transform.args, transform.transform,
+                                              transform.color_index)
+            actions[id(action)] = BaselineAction(action.act, transform, action.w_prev,
+                                                 action.can_set_runtime, action.is_wait)
+        return actions[id(action)]
+
+    action_pairs = {}
+    for action_pair in scene.action_pairs:
+        action_pairs[id(action_pair)] = BaselineActionPair(
+            baseline_action(action_pair.anim_action), baseline_action(action_pair.static_action),
+            action_pair.run_time, action_pair.anim_block, action_pair.timeline)
+
+    meta_trees = []
+    for meta_tree in scene.meta_trees:
+        baseline_meta = BaselineMetadata(meta_tree.meta_name, meta_tree.fid, meta_tree.animated)
+        for lower in meta_tree.children:
+            # reading lower.val would capture it, copy what is currently stored instead
+            val = lower.captured_val if lower.val_source is None else lower.val_source
+            val = val() if callable(val) else val
+            baseline_meta.add_lower(BaselineLowerMetadata(
+                lower.meta_name, action_pairs.get(id(lower.action_pair), lower.action_pair),
+                val, lower.show_in_panel))
+        meta_trees.append(baseline_meta)
+
+    return list(action_pairs.values()), meta_trees
+
+
+def object_size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def action_pair_bytes(action_pairs, meta_trees):
+    ''' Total size of the action, transform and metadata objects describing a scene '''
+    seen = set()
+    total = 0
+
+    def add(*objs):
+        nonlocal total
+        for obj in objs:
+            if obj is not None and id(obj) not in seen:
+                seen.add(id(obj))
+                total += object_size(obj)
+
+    for action_pair in action_pairs:
+        add(action_pair)
+        for action in (action_pair.anim_action, action_pair.static_action):
+            add(action, action.transform)
+            if action.transform is not None:
+                add(action.transform.args)
+
+    for meta_tree in meta_trees:
+        add(meta_tree, meta_tree.children, meta_tree.lower_index)
+        if meta_tree.lower_index is not None:
+            add(*meta_tree.lower_index.values())
+        for lower in meta_tree.children:
+            if isinstance(lower, BaselineLowerMetadata):
+                add(lower, lower.val)
+            else:
+                # reading lower.val would capture it, count what is currently stored instead
+                add(lower, lower.val_source, lower.captured_val)
+
+    return total
+
+
+@patch('algomanim.algolist.VGroup', Mock())
+@patch('algomanim.algonode.VGroup', Mock())
+@patch('algomanim.algoscene.TextMobject', Mock())
+@patch('algomanim.algoobject.TexMobject', Mock())
+def main(size):
+    scene = plan_mergesort(size)
+
+    num_pairs = len(scene.action_pairs)
+    print(f'mergesort of {size} elements: {num_pairs} action pairs, '
+          f'{len(scene.meta_trees)} metadata')
+    baseline_bytes = action_pair_bytes(*baseline_scene(scene))
+    slotted_bytes = action_pair_bytes(scene.action_pairs, scene.meta_trees)
+    print(f'baseline action and metadata objects: {baseline_bytes / num_pairs:.0f} '
+          f'bytes per action pair')
+    print(f'slotted action and metadata objects: {slotted_bytes / num_pairs:.0f} '
+          f'bytes per action pair')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE)
@@ -0,0 +1,45 @@
+'''
+Times making the nodes of an AlgoList of distinct integers with each node font, and counts the
+text mobjects made for their labels. Needs LaTeX, as rendering does
+Labels are made with a scene of their own for each font, without a label cache directory
+
+Usage: python -m benchmarks.glyph_labels [list size] [node fonts...]
+'''
+import random
+import sys
+import time
+from unittest.mock import patch
+from manimlib.imports import *
+from algomanim.algoscene import AlgoScene
+from algomanim.algolist import AlgoList
+
+
+DEFAULT_SIZE = 10000
+DEFAULT_FONTS = ['latex', 'atlas:latex']
+
+
+def make_nodes(size, font):
+    scene = AlgoScene()
+    scene.settings['node_font'] = font
+    values = random.Random(0).sample(range(-size, size), size)
+    algolist = AlgoList(scene, values)
+    for node in algolist.nodes:
+        node.build_mobjects()
+    return scene
+
+
+def main(size, fonts):
+    for font in fonts:
+        with patch('algomanim.algoscene.TextMobject', wraps=TextMobject) as text_mobject, \
+                patch('algomanim.algoscene.Text', wraps=Text) as text:
+            start = time.perf_counter()
+            make_nodes(size, font)
+            elapsed = time.perf_counter() - start
+
+        print(f'{size} nodes with node_font {font!r} made in {elapsed:.2f}s, '
+              f'text mobjects made: {text_mobject.call_count + text.call_count}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE,
+         sys.argv[2:] or DEFAULT_FONTS)
@@ -0,0 +1,55 @@
+'''
+Times planning a bubble sort with LowerMetadata named by attach_metadata, and with the stack
+inspection they were named with before. Only the scene is planned, nothing is rendered
+
+Usage: python -m benchmarks.lower_metadata [list size]
+'''
+import inspect
+import sys
+import time
+from unittest.mock import patch, Mock
+from algomanim.algolist import AlgoList
+from algomanim.algoscene import AlgoScene
+from algomanim.metadata import LowerMetadata
+
+
+DEFAULT_SIZE = 30
+
+
+def create_with_stack_inspection(action_pair, val=None, show_in_panel=True):
+    ''' LowerMetadata.create as it was before attach_metadata recorded function names '''
+    currframe = inspect.currentframe()
+    return LowerMetadata(inspect.getouterframes(currframe, 2)[1][3],
+                         action_pair, val, show_in_panel)
+
+
+def plan_bubble_sort(size):
+    ''' Builds the action pairs and metadata of a bubble sort, returning the scene and time '''
+    scene = AlgoScene()
+    start = time.perf_counter()
+    algolist = AlgoList(scene, list(range(size, 0, -1)))
+    for i in range(algolist.len() - 1):
+        for j in range(algolist.len() - 1 - i):
+            algolist.compare(j, j + 1, text=False)
+            if algolist.get_val(j) > algolist.get_val(j + 1):
+                algolist.swap(j, j + 1)
+    return scene, time.perf_counter() - start
+
+
+@patch('algomanim.algolist.VGroup', Mock())
+@patch('algomanim.algonode.VGroup', Mock())
+@patch('algomanim.algoscene.TextMobject', Mock())
+@patch('algomanim.algoobject.TexMobject', Mock())
+def main(size):
+    scene, elapsed = plan_bubble_sort(size)
+    with patch('algomanim.metadata.LowerMetadata.create', create_with_stack_inspection):
+        _, inspected_elapsed = plan_bubble_sort(size)
+
+    num_pairs = len(scene.action_pairs)
+    print(f'Planned {num_pairs} action pairs: '
+          f'{num_pairs / elapsed:.0f}/s with attach_metadata names, '
+          f'{num_pairs / inspected_elapsed:.0f}/s with stack inspection')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE)
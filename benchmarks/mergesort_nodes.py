@@ -0,0 +1,38 @@
+'''
+Counts the nodes and text mobjects created when planning algomanim_examples/mergesort.py
+scaled up to a larger list, and the time taken. Only the scene is planned, nothing is rendered
+Run it on two checkouts to compare the lists made by AlgoList.slice and AlgoList.merge
+
+Usage: python -m benchmarks.mergesort_nodes [list size]
+'''
+import sys
+import time
+from unittest.mock import patch, Mock
+from algomanim.algonode import AlgoNode
+from algomanim.algoscene import AlgoScene
+from benchmarks.action_pair_memory import plan_mergesort
+
+
+DEFAULT_SIZE = 1000
+
+
+@patch('algomanim.algolist.VGroup', Mock())
+@patch('algomanim.algonode.VGroup', Mock())
+@patch('algomanim.algoscene.TextMobject', Mock())
+@patch('algomanim.algoobject.TexMobject', Mock())
+def main(size):
+    with patch('algomanim.algolist.AlgoNode', wraps=AlgoNode) as algo_node, \
+            patch.object(AlgoScene, 'create_text', autospec=True,
+                         side_effect=AlgoScene.create_text) as create_text:
+        start = time.perf_counter()
+        scene = plan_mergesort(size)
+        elapsed = time.perf_counter() - start
+
+    print(f'mergesort of {size} elements: {len(scene.action_pairs)} action pairs '
+          f'planned in {elapsed:.2f}s')
+    print(f'nodes created: {algo_node.call_count}, text mobjects created: '
+          f'{create_text.call_count}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE)
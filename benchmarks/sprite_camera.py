@@ -0,0 +1,40 @@
+'''
+Times capturing frames of static nodes, laid out in a grid filling the frame, with manim's
+MovingCamera and with the SpriteCamera. Needs cairo and LaTeX, as rendering does
+
+Usage: python -m benchmarks.sprite_camera [number of nodes] [number of frames]
+'''
+import sys
+import time
+from manimlib.imports import *
+from algomanim.algoscene import AlgoScene
+from algomanim.algolist import AlgoList
+from algomanim.sprite_camera import SpriteCamera
+
+
+DEFAULT_NODES = 1000
+DEFAULT_FRAMES = 30
+
+
+def make_nodes(size):
+    algolist = AlgoList(AlgoScene(), [i % 10 for i in range(size)])
+    nodes = VGroup(*[node.grp for node in algolist.nodes])
+    nodes.arrange_in_grid(n_rows=int(np.sqrt(size / 2)))
+    return nodes.set_width(FRAME_WIDTH - 1)
+
+
+def main(size, frames):
+    nodes = make_nodes(size)
+    for camera_class in [MovingCamera, SpriteCamera]:
+        camera = camera_class()
+        start = time.perf_counter()
+        for _ in range(frames):
+            camera.reset()
+            camera.capture_mobjects([nodes])
+        elapsed = time.perf_counter() - start
+        print(f'{camera_class.__name__}: {frames} frames of {size} nodes in {elapsed:.2f}s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NODES,
+         int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_FRAMES)
@@ -17,6 +17,7 @@ from gui.animation_bar import AnimationBar, is_empty_anim
 from gui.panels.customise_panel import CustomisePanel
 from gui.panels.change_history_panel import ChangeHistoryPanel
 from gui.panels.preconfig_panel import PreconfigPanel
+from gui.panels.customisation_type import CustomisationType
 from gui.anim_change import AnimChange
 
 
@@ -188,6 +189,8 @@ class GuiWindow(QMainWindow):
         self.insertions = dict()
         self.post_customize_fns = []
         self.post_config_settings = dict()
+        # Runtimes of the rendered scene's action pairs before previewed runtime changes
+        self.previewed_runtimes = dict()
 
         # Panels for side menu
         self.customise_panel = CustomisePanel(changes=self.changes)
@@ -203,6 +206,7 @@ class GuiWindow(QMainWindow):
         self.scene_name = ""
         self.scene = None
         self.anims = None
+        self.anim_indexes = dict()
 
         # Side menu toggle button
         self.menu_toggle = QToolButton()
@@ -370,11 +374,14 @@ class GuiWindow(QMainWindow):
 
         # Render video programmatically
         # Create worker thread
+        # every render takes checkpoints, so that applying changes renders again from the
+        # first changed animation
         self.worker = VideoRenderThread(pyfile_relpath, self.scene_name,
                                         video_quality, self.post_customize_fns,
-                                        self.post_config_settings)
+                                        self.post_config_settings, checkpoints=True)
         self.worker.exceptioned.connect(self.render_failed)
         # pylint: disable=unnecessary-lambda
+        self.worker.plan_finished.connect(lambda scene: self.plan_finished(scene))
         self.worker.task_finished.connect(lambda scene: self.render_finished(scene))
 
         # Set progress bar to busy
@@ -405,16 +412,25 @@ class GuiWindow(QMainWindow):
         # Stop the progress bar
         self.on_render_finish()
 
+    @pyqtSlot(object)
+    def plan_finished(self, scene):
+        # Show the timeline while the video is rendered
+        self.scene = scene
+        self.previewed_runtimes = dict()
+        self.anims = self.scene.metadata_blocks
+        self.fill_animation_bar()
+
     @pyqtSlot(object)
     def render_finished(self, scene):
         self.on_render_finish()
 
         # Update the GUI
         self.scene = scene
+        self.previewed_runtimes = dict()
         self.anims = self.scene.metadata_blocks
 
         # Add animation boxes to scrollbar
-        self.animation_bar.fill_bar(self.anims)
+        self.fill_animation_bar()
 
         # Add preconfig settings to panel
         self.preconfig_panel.load_settings(self.scene.settings)
@@ -435,11 +451,11 @@ class GuiWindow(QMainWindow):
         self.open_sidemenu()
 
         if self.choose_mb_start:
-            self.mb_start_idx = self.anims.index(anim)
+            self.mb_start_idx = self.anim_indexes[anim]
             self.toggle_mb_start()
 
         if self.choose_mb_end:
-            self.mb_end_idx = self.anims.index(anim)
+            self.mb_end_idx = self.anim_indexes[anim]
             self.toggle_mb_end()
 
             self.multiblock_select(self.mb_start_idx, self.mb_end_idx)
@@ -465,11 +481,42 @@ class GuiWindow(QMainWindow):
             self.changes[change_key].update_value(change_value)
             self.change_history_panel.update_change(anim_change)
 
+        if change_type == CustomisationType.RUNTIME:
+            self.preview_runtime_change(action_pair_index, change_value)
+
+    def preview_runtime_change(self, action_pair_index, runtime):
+        '''
+        Applies a runtime change to the rendered scene so that the animation bar shows the new
+        timings straight away, the video itself is only updated by the next render
+        '''
+        if self.worker is not None and self.worker.isRunning():
+            # the planned scene is still rendering, changing it would change the video
+            return
+        action_pair = self.scene.action_pairs[action_pair_index]
+        run_time = action_pair.get_runtime()
+        try:
+            action_pair.set_runtime(runtime)
+        except ValueError:
+            # invalid runtimes are reported when changes are applied
+            return
+
+        self.previewed_runtimes.setdefault(action_pair_index, run_time)
+        self.animation_bar.update_anim_boxes()
+
+    def revert_runtime_previews(self):
+        ''' Restores the runtimes of the rendered scene changed by preview_runtime_change '''
+        if self.scene is not None and self.previewed_runtimes:
+            for action_pair_index, run_time in self.previewed_runtimes.items():
+                self.scene.action_pairs[action_pair_index].set_runtime(run_time)
+            self.animation_bar.update_anim_boxes()
+        self.previewed_runtimes = dict()
+
     def insert_animations(self, insertions):
         self.insertions.update(insertions)
         self.change_history_panel.add_insertions(insertions)
 
     def reset_changes(self):
+        self.revert_runtime_previews()
         self.changes = dict()
         self.insertions = dict()
         self.post_customize_fns = []
@@ -485,17 +532,19 @@ class GuiWindow(QMainWindow):
         self.post_customize_fns.append(customize_anims)
 
         def insert_anims(algoscene):
-            insertions = sorted(list(self.insertions.items()), reverse=True)
-            for index, insertion in insertions:
-                if text := insertion.get('slide'):
-                    algoscene.add_slide(text, index)
-                if wait_time_str := insertion.get('wait'):
-                    try:
-                        wait_time = float(wait_time_str)
-                        algoscene.add_wait(index, wait_time=wait_time)
-                    except ValueError:
-                        self.show_error(f"{wait_time_str} is an invalid float",
-                        info_text=f"Skipped insertion of wait at {index}")
+            # indexes refer to the original action pairs, a wait is placed before a slide
+            # inserted at the same index
+            with algoscene.batch():
+                for index, insertion in self.insertions.items():
+                    if wait_time_str := insertion.get('wait'):
+                        try:
+                            wait_time = float(wait_time_str)
+                            algoscene.add_wait(index, wait_time=wait_time)
+                        except ValueError:
+                            self.show_error(f"{wait_time_str} is an invalid float",
+                            info_text=f"Skipped insertion of wait at {index}")
+                    if text := insertion.get('slide'):
+                        algoscene.add_slide(text, index)
         self.post_customize_fns.append(insert_anims)
 
         self.render_video(keep_changes=True)
@@ -506,11 +555,15 @@ class GuiWindow(QMainWindow):
 
     def add_empty_anim(self, index, position):
         self.anims.insert(index, empty_animation(position))
-        self.animation_bar.fill_bar(self.anims)
+        self.fill_animation_bar()
 
     def delete_empty_anim(self, index):
         self.anims.pop(index)
-        self.animation_bar.fill_bar(self.anims)
+        self.fill_animation_bar()
+
+    def fill_animation_bar(self):
+        self.anim_indexes = {anim: i for i, anim in enumerate(self.anims)}
+        self.animation_bar.fill_bar(self.anims, self.scene.metadata_block_index)
 
     # ==========================
     #    Multiblock selection
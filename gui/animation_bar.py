@@ -30,6 +30,11 @@ class AnimationBar(QWidget):
         self.anim_box_list = QHBoxLayout()
         self.anim_box_list.setContentsMargins(0, 0, 0, 0)
 
+        # find the boxes to highlight as the video plays
+        self.block_index = None
+        self.box_indexes = dict()
+        self.active_boxes = []
+
         # multiblock edits
         self.curr_position = 0
 
@@ -49,18 +54,26 @@ class AnimationBar(QWidget):
     def link_gui_window(self, gui_window):
         self.gui_window = gui_window
 
-    def fill_bar(self, anims):
+    def fill_bar(self, anims, block_index):
+        '''
+        Creates a box for each animated block in anims
+        block_index (MetadataBlockIndex) finds the blocks of the rendered scene by position
+        '''
         # this may not be exactly anims if there are some hidden animations
         self.anims = []
         self.anim_boxes = []
         self.anim_box_list = QHBoxLayout()
         self.anim_box_list.setContentsMargins(0, 0, 0, 0)
+        self.block_index = block_index
+        self.box_indexes = dict()
+        self.active_boxes = []
 
         # track index separately
         index = 0
         for anim in anims:
             if anim.metadata.animated:
                 self.anims.append(anim)
+                self.box_indexes[anim] = index
                 # only display if animated or empty
                 anim_box = self.create_anim_box(index, anim)
                 self.anim_box_list.addWidget(anim_box)
@@ -136,6 +149,17 @@ class AnimationBar(QWidget):
 
         return anim_box
 
+    def update_anim_boxes(self):
+        '''
+        Resizes the anim boxes and the active box to follow runtime changes,
+        without filling the bar again
+        '''
+        for anim, anim_box in zip(self.anims, self.anim_boxes):
+            width, _ = AnimationBar.get_anim_box_size(anim.runtime)
+            anim_box.setFixedWidth(width)
+
+        self.media_position_changed(self.curr_position)
+
     def set_mouse_clicked(self, anim):
         mb_selected = self.gui_window.anim_clicked(anim)
         if not mb_selected and not is_empty_anim(anim):
@@ -150,34 +174,41 @@ class AnimationBar(QWidget):
 
     def media_position_changed(self, position):
         self.curr_position = position
-        for (i, anim) in enumerate(self.anims):
-            if is_empty_anim(anim):
-                continue
-            start_position = anim.start_position()
-            end_position = anim.end_position()
-            if (start_position <= position < end_position) or \
-                (start_position == position and start_position == end_position):
-                self.set_active_lbl(i)
-                self.gui_window.change_panel_anim(anim)
-            else:
+        if self.block_index is None:
+            return
+
+        # only the boxes that were or become active need restyling
+        active_boxes = [self.box_indexes[anim] for anim in self.block_index.find_active(position)
+                        if anim in self.box_indexes]
+        for i in self.active_boxes:
+            if i not in active_boxes:
                 self.set_inactive_lbl(i)
+        for i in active_boxes:
+            self.set_active_lbl(i)
+            self.gui_window.change_panel_anim(self.anims[i])
+        self.active_boxes = active_boxes
 
     def set_multiblock_selection_mode(self, selected):
         if selected:
             for anim_box in self.anim_boxes:
                 anim_box.setStyleSheet("background-color: gray; color: black")
         else:
+            for i in range(len(self.anim_boxes)):
+                self.set_inactive_lbl(i)
+            self.active_boxes = []
             self.media_position_changed(self.curr_position)
 
     def set_animation_group(self, start_anim, end_anim):
-        start_idx = self.anims.index(start_anim)
-        end_idx = self.anims.index(end_anim)
+        start_idx = self.box_indexes[start_anim]
+        end_idx = self.box_indexes[end_anim]
         for i in range(0, len(self.anims)):
             if start_idx <= i <= end_idx:
                 self.set_active_lbl(i)
             else:
                 self.set_inactive_lbl(i)
+        self.active_boxes = list(range(start_idx, end_idx + 1))
 
     def add_anim(self, index, position):
         self.gui_window.add_empty_anim(index, position)
         self.set_active_lbl(index)
+        self.active_boxes.append(index)
@@ -5,18 +5,51 @@ Interface to render default or customized manim animations
 created via the Algomanim API into videos
 """
 
-from argparse import Namespace
+import multiprocessing
+import os
+import subprocess
+from argparse import ArgumentParser, Namespace
 import manimlib.config
 import manimlib.constants
+from manimlib.camera.moving_camera import MovingCamera
 from manimlib.extract_scene import get_scene_classes_from_module, get_scenes_to_render
+from algomanim.background_layer import BackgroundLayer
+from algomanim.block_cache import BlockVideoCache
+from algomanim.dirty_rect_camera import DirtyRectCamera
+from algomanim.frame_pool import FramePool
+from algomanim.label_cache import LabelCache, DEFAULT_CACHE_DIR as LABEL_CACHE_DIR
+from algomanim.scene_checkpoint import SceneCheckpoints
+from algomanim.sprite_camera import SpriteCamera
+from algomanim.tex_batch import TexBatch
 from gui.video_quality import VideoQuality
 
+# Checkpoints of the last render of each scene, kept between renders and stored on disk so that
+# a render asking for them can start from a checkpoint of the previous one
+CHECKPOINTS = {}
+CHECKPOINT_DIR = './media/algomanim/checkpoints'
+
+# Kept between renders, and stored on disk so that labels are not parsed again by later renders
+LABEL_CACHE = LabelCache(directory=LABEL_CACHE_DIR)
+
+# Cameras a scene can be rendered with, the sprite camera draws repeated node shapes and
+# labels from rasters of them, the dirty camera draws frames of an animation over the previous
+# one where mobjects move
+CAMERAS = {
+    'cairo': MovingCamera,
+    'sprite': SpriteCamera,
+    'dirty': DirtyRectCamera
+}
+DEFAULT_CAMERA = 'cairo'
+
+# Arguments of a parallel render, read by the pool workers forked from the rendering process
+CHUNK_RENDER = {}
+
 # Modification of internal manim function using algomanim API
-def custom_renderer(file_path, scene_name, video_quality,
-                    post_customize_fns, post_config_settings):
+def create_scene(file_path, scene_name, video_quality, post_customize_fns,
+                 post_config_settings, file_name=None, camera=DEFAULT_CAMERA, **kwargs):
     args = Namespace(color=post_config_settings.get('background_color'),
                      file=file_path,
-                     file_name=None,
+                     file_name=file_name,
                      high_quality=video_quality == VideoQuality.high,
                      leave_progress_bars=False,
                      low_quality=video_quality == VideoQuality.low,
@@ -57,7 +90,169 @@ def custom_renderer(file_path, scene_name, video_quality,
 
     scene_kwargs.update({
         'post_customize_fns': post_customize_fns,
-        'post_config_settings': post_config_settings
+        'post_config_settings': post_config_settings,
+        'camera_class': CAMERAS[camera],
+        'label_cache': LABEL_CACHE,
+        # the LaTeX of node labels is compiled together instead of once per label
+        'tex_batch': TexBatch(),
+        # mobjects still during a play are not drawn again for the next plays
+        'background_layer': BackgroundLayer()
     })
+    scene_kwargs.update(kwargs)
 
     return scene_class(**scene_kwargs)
+
+
+def custom_renderer(file_path, scene_name, video_quality,
+                    post_customize_fns, post_config_settings, workers=1, camera=DEFAULT_CAMERA,
+                    frame_workers=1, checkpoints=False, block_cache=False, on_plan=None):
+    '''
+    Renders the scene, calling on_plan with the scene rendering the video, or its first chunk,
+    once its timeline is known
+    block_cache copies blocks unchanged since an earlier render from a BlockVideoCache, which
+    hashes the scene before every block, and is implied by checkpoints
+    '''
+    block_cache = block_cache or checkpoints
+    if workers <= 1:
+        # the frames of long plays are drawn in parallel instead of the chunks of the video,
+        # pool workers cannot start pools of their own
+        frame_pool = FramePool(frame_workers) if frame_workers > 1 else None
+        # resuming is opt-in, checkpoints only restore the state of the mobjects
+        # the blocks refer to
+        scene_checkpoints = scene_checkpoints_of(scene_name) if checkpoints else None
+        scene = create_scene(file_path, scene_name, video_quality, post_customize_fns,
+                             post_config_settings, camera=camera,
+                             block_cache=BlockVideoCache() if block_cache else None,
+                             checkpoints=scene_checkpoints,
+                             frame_pool=frame_pool, on_plan=on_plan)
+        if scene_checkpoints is not None:
+            scene_checkpoints.save(checkpoint_path(scene_name))
+        return scene
+
+    # forked workers inherit the arguments, the GUI customizations cannot be pickled
+    CHUNK_RENDER['args'] = (file_path, scene_name, video_quality,
+                            post_customize_fns, post_config_settings)
+    CHUNK_RENDER['workers'] = workers
+    CHUNK_RENDER['camera'] = camera
+    CHUNK_RENDER['block_cache'] = block_cache
+    with multiprocessing.get_context('fork').Pool(workers - 1) as pool:
+        # the first chunk is rendered by this process, giving the scene returned to the GUI
+        chunk_results = pool.map_async(render_chunk, range(1, workers))
+        scene = create_scene(file_path, scene_name, video_quality, post_customize_fns,
+                             post_config_settings, camera=camera, render_chunk=(0, workers),
+                             block_cache=BlockVideoCache() if block_cache else None,
+                             on_plan=on_plan)
+        movie_files = partial_movie_files(scene)
+        chunk_movies = []
+        for chunk_files, chunk_movie in chunk_results.get():
+            movie_files += chunk_files
+            chunk_movies.append(chunk_movie)
+
+    concat_movie_files(movie_files, scene.file_writer.get_movie_file_path())
+    # the videos of the other chunks were only written by their scenes, the whole video is made
+    # from their partial movie files
+    for chunk_movie in chunk_movies:
+        if os.path.exists(chunk_movie):
+            os.remove(chunk_movie)
+    return scene
+
+
+def checkpoint_path(scene_name):
+    return os.path.join(CHECKPOINT_DIR, f'{scene_name}.pickle')
+
+
+def scene_checkpoints_of(scene_name):
+    ''' Returns the SceneCheckpoints of scene_name, loaded from disk when first used '''
+    if scene_name not in CHECKPOINTS:
+        CHECKPOINTS[scene_name] = SceneCheckpoints()
+        CHECKPOINTS[scene_name].load(checkpoint_path(scene_name))
+    return CHECKPOINTS[scene_name]
+
+
+def plan_scene(file_path, scene_name, video_quality,
+               post_customize_fns, post_config_settings):
+    ''' Creates the blocks and metadata of a scene without rendering any frames '''
+    return create_scene(file_path, scene_name, video_quality, post_customize_fns,
+                        post_config_settings, plan_only=True)
+
+
+def render_chunk(index):
+    '''
+    Renders one chunk of a parallel render and returns its partial movie files, and the path of
+    the video of the chunk
+    '''
+    file_path, scene_name, video_quality, post_customize_fns, post_config_settings = \
+        CHUNK_RENDER['args']
+    scene = create_scene(file_path, scene_name, video_quality, post_customize_fns,
+                         post_config_settings, file_name=f'{scene_name}_chunk{index}',
+                         camera=CHUNK_RENDER['camera'],
+                         block_cache=BlockVideoCache() if CHUNK_RENDER['block_cache'] else None,
+                         render_chunk=(index, CHUNK_RENDER['workers']))
+    return partial_movie_files(scene), scene.file_writer.get_movie_file_path()
+
+
+def partial_movie_files(scene):
+    file_writer = scene.file_writer
+    return [os.path.join(file_writer.partial_movie_directory,
+                         f'{num_play:05}{file_writer.movie_file_extension}')
+            for num_play in scene.chunk_plays]
+
+
+def concat_movie_files(movie_files, movie_path):
+    ''' Joins movie_files into movie_path without re-encoding, like manim does for a scene '''
+    file_list = os.path.splitext(movie_path)[0] + '_chunk_list.txt'
+    with open(file_list, 'w') as list_file:
+        for movie_file in movie_files:
+            list_file.write(f"file 'file:{os.path.abspath(movie_file)}'\n")
+
+    subprocess.run([manimlib.constants.FFMPEG_BIN, '-y', '-f', 'concat', '-safe', '0',
+                    '-i', file_list, '-loglevel', 'error', '-c', 'copy', '-an', movie_path],
+                   check=True)
+    os.remove(file_list)
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Render a scene created with the Algomanim API')
+    parser.add_argument('file', help='Path to the python file containing the scene')
+    parser.add_argument('scene_name', help='Name of the scene to render')
+    parser.add_argument('--quality', choices=[quality.name for quality in VideoQuality],
+                        default=VideoQuality.med.name)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of processes rendering parts of the video in parallel')
+    parser.add_argument('--camera', choices=list(CAMERAS), default=DEFAULT_CAMERA,
+                        help='Camera drawing the frames, sprite reuses rasters of repeated shapes, '
+                             'dirty only draws again where mobjects move')
+    parser.add_argument('--frame-workers', type=int, default=1,
+                        help='Number of processes drawing the frames of long animations in '
+                             'parallel, when the video is rendered by one process')
+    parser.add_argument('--plan', action='store_true',
+                        help='Print the timeline of the scene without rendering it')
+    parser.add_argument('--block-cache', action='store_true',
+                        help='Copy the animations unchanged since an earlier render from a cache '
+                             'of their videos instead of rendering them again')
+    parser.add_argument('--checkpoints', action='store_true',
+                        help='Take checkpoints of the scene while rendering it, and start at the '
+                             'latest checkpoint of the previous render before the first changed '
+                             'animation, when the video is rendered by one process')
+    parser.add_argument('--optimize', action='store_true',
+                        help='Skip animations repeating the state before them and static actions '
+                             'overwritten before they are seen')
+    cmd_args = parser.parse_args()
+    settings = {'optimize_actions': True} if cmd_args.optimize else {}
+    if cmd_args.plan:
+        rendered_scene = plan_scene(cmd_args.file, cmd_args.scene_name,
+                                    VideoQuality[cmd_args.quality], [], settings)
+        for meta_block in rendered_scene.metadata_blocks:
+            print(f'{meta_block.start_position():>10.0f} {meta_block.end_position():>10.0f} '
+                  f"{meta_block.desc(sep=', ')}")
+    else:
+        rendered_scene = custom_renderer(cmd_args.file, cmd_args.scene_name,
+                                         VideoQuality[cmd_args.quality], [], settings,
+                                         workers=cmd_args.workers, camera=cmd_args.camera,
+                                         frame_workers=cmd_args.frame_workers,
+                                         checkpoints=cmd_args.checkpoints,
+                                         block_cache=cmd_args.block_cache)
+    report = rendered_scene.optimization_report
+    if report is not None:
+        print(f'Optimized {report.pairs} action pairs away, '
+              f'eliminating {report.blocks} blocks and {report.frames} frames')
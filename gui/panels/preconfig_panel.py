@@ -1,5 +1,6 @@
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import *
+from algomanim.glyph_atlas import ATLAS_PREFIX
 
 from gui.panels.base_changes_panel import BaseChangesPanel
 from gui.panels.widgets.input_check_box import InputCheckBox
@@ -25,6 +26,7 @@ FONTS = [
 
 SETTINGS = ([
     ('show_code', InputCheckBox, QCheckBox),
+    ('optimize_actions', InputCheckBox, QCheckBox),
     ('background_color', InputColorButton, QColorButton),
     ('node_color', InputColorButton, QColorButton),
     ('node_shape', InputDropdown, QComboBox),
@@ -76,7 +78,8 @@ class PreconfigPanel(BaseChangesPanel):
         self.add_dropdown_items('node_shape', SHAPES)
         # Initialise font dropdowns with CSS2 generic font families, and latex
         self.add_dropdown_items('text_font', FONTS)
-        self.add_dropdown_items('node_font', FONTS)
+        # Node labels can also be laid out from the glyphs of a font, for large data structures
+        self.add_dropdown_items('node_font', FONTS + [ATLAS_PREFIX + font for font in FONTS])
 
         self.form_frame.setLayout(form_layout)
 
@@ -34,13 +34,15 @@ class VideoRenderThread(QThread):
     # pylint: disable=too-many-arguments
     # pylint: disable=broad-except
 
+    plan_finished = pyqtSignal(object)
     task_finished = pyqtSignal(object)
     exceptioned = pyqtSignal(Exception)
 
     def __init__(self, file_path, scene_name, video_quality,
-                 post_customize_fns, post_config_settings):
+                 post_customize_fns, post_config_settings, checkpoints=False):
         super().__init__()
 
+        self.checkpoints = checkpoints
         self.post_config_settings = post_config_settings
         self.post_customize_fns = post_customize_fns
         self.video_quality = video_quality
@@ -49,8 +51,12 @@ class VideoRenderThread(QThread):
 
     def run(self):
         try:
+            # the timeline of the scene is known long before its video, it is taken from the
+            # rendering scene so that the scene is only created once
             scene = custom_renderer(self.file_path, self.scene_name, self.video_quality,
-                                    self.post_customize_fns, self.post_config_settings)
+                                    self.post_customize_fns, self.post_config_settings,
+                                    checkpoints=self.checkpoints,
+                                    on_plan=self.plan_finished.emit)
             self.task_finished.emit(scene)
         except Exception as exception:
             self.exceptioned.emit(exception)
@@ -0,0 +1,87 @@
+# pylint: disable=R0201
+import random
+from unittest.mock import Mock
+import pytest
+from algomanim.action_pair_timeline import ActionPairTimeline
+
+
+CHUNK_SIZE = 4
+
+
+def get_test_timeline(size):
+    pairs = [Mock() for _ in range(size)]
+    return ActionPairTimeline(pairs, chunk_size=CHUNK_SIZE), pairs
+
+
+class TestActionPairTimeline:
+
+    def test_behaves_like_list_after_appends(self):
+        timeline, pairs = get_test_timeline(10)
+        assert len(timeline) == len(pairs)
+        assert list(timeline) == pairs
+        assert list(reversed(timeline)) == pairs[::-1]
+        assert timeline[-1] is pairs[-1]
+        assert timeline[3:9] == pairs[3:9]
+        assert timeline[::2] == pairs[::2]
+
+    def test_index_of_appended_pairs(self):
+        timeline, pairs = get_test_timeline(10)
+        assert [timeline.index(pair) for pair in pairs] == list(range(len(pairs)))
+
+    def test_insert_matches_list_insert(self):
+        timeline, pairs = get_test_timeline(10)
+        rng = random.Random(0)
+        for _ in range(100):
+            index = rng.randint(-3, len(pairs) + 3)
+            pair = Mock()
+            timeline.insert(index, pair)
+            pairs.insert(index, pair)
+
+        assert list(timeline) == pairs
+        assert [timeline.index(pair) for pair in pairs] == list(range(len(pairs)))
+        assert [timeline[i] for i in range(len(pairs))] == pairs
+        assert timeline[17:61] == pairs[17:61]
+
+    def test_insert_many_matches_inserts_against_original_indexes(self):
+        for size in (3, 40):
+            timeline, pairs = get_test_timeline(size)
+            rng = random.Random(size)
+            insertions = [(rng.randint(-3, size + 3), Mock()) for _ in range(20)]
+            positions = sorted(((timeline.clamp_index(index), order, pair)
+                                for order, (index, pair) in enumerate(insertions)),
+                               key=lambda insertion: (insertion[0], insertion[1]))
+            timeline.insert_many(insertions)
+
+            expected = list(pairs)
+            for index, _, pair in reversed(positions):
+                expected.insert(index, pair)
+
+            assert list(timeline) == expected
+            assert [timeline.index(pair) for pair in expected] == list(range(len(expected)))
+
+    def test_insert_many_keeps_order_of_pairs_at_same_index(self):
+        timeline, pairs = get_test_timeline(10)
+        new_pairs = [Mock() for _ in range(5)]
+        timeline.insert_many([(4, pair) for pair in new_pairs])
+
+        assert list(timeline) == pairs[:4] + new_pairs + pairs[4:]
+
+    def test_insert_splits_large_chunks(self):
+        timeline, _ = get_test_timeline(CHUNK_SIZE)
+        for _ in range(3 * CHUNK_SIZE):
+            timeline.insert(1, Mock())
+
+        assert len(timeline.chunks) > 1
+        assert all(len(chunk.action_pairs) <= 2 * CHUNK_SIZE for chunk in timeline.chunks)
+        assert [chunk.position for chunk in timeline.chunks] == \
+            list(range(len(timeline.chunks)))
+
+    def test_index_of_missing_pair_throws_error(self):
+        timeline, _ = get_test_timeline(3)
+        with pytest.raises(ValueError):
+            timeline.index(Mock())
+
+    def test_getitem_out_of_range_throws_error(self):
+        timeline, _ = get_test_timeline(3)
+        with pytest.raises(IndexError):
+            timeline[3]  # pylint: disable=W0104
@@ -40,6 +40,15 @@ class TestAlgoSceneAction:
         assert sceneaction.transform.transform == mock_fn
         assert sceneaction.transform.color_index == mock_index
 
+    def test_create_empty_action_without_args_is_shared(self):
+        assert AlgoSceneAction.create_empty_action() is AlgoSceneAction.create_empty_action()
+        assert not AlgoSceneAction.create_empty_action().get_args()
+
+    def test_create_empty_action_with_args_is_not_shared(self):
+        sceneaction = AlgoSceneAction.create_empty_action(mock_args)
+        assert sceneaction is not AlgoSceneAction.create_empty_action()
+        assert sceneaction.get_args() == mock_args
+
 class TestAlgoTransform:
 
     def test_set_color_does_nothing_if_cannot_set_color(self):
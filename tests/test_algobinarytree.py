@@ -41,6 +41,19 @@ class TestAlgoTree:
         assert algoscene.add_action_pair.call_count == 4
 
     # --------------- Insertion tests --------------- #
+    @patch("algomanim.algobinarytree.Line")
+    @patch("algomanim.algonode.Square")
+    def test_recursive_insert_makes_no_mobjects(self, square, line):
+        algoscene.reset_mock()
+        root = AlgoBinaryTreeNode(algoscene, test_vals[0])
+        for val in test_vals[1:]:
+            root.recursive_insert(val)
+
+        assert root.recursive_size() == len(test_vals)
+        square.assert_not_called()
+        line.assert_not_called()
+        algoscene.create_text.assert_not_called()
+
     def test_insertion_according_to_val(self):
         algoscene.reset_mock()
         root = AlgoBinaryTreeNode(algoscene, test_vals[0])
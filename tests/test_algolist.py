@@ -1,6 +1,9 @@
 # pylint: disable=R0201
 from unittest.mock import patch, Mock
+from manimlib.imports import *
 from algomanim.algolist import AlgoList
+from algomanim.algonode import AlgoNode
+from algomanim.metadata import Metadata
 from algomanim.algoscene import AlgoScene
 from algomanim.settings import DEFAULT_SETTINGS
 
@@ -97,6 +100,43 @@ class TestAlgoList:
 
         assert action_pairs_len == sum_action_pairs
 
+    def test_compare_dehighlights_only_highlighted_nodes(self):
+        test_algoscene = AlgoScene()
+        algolist = AlgoList(test_algoscene, list(range(10)))
+
+        algolist.compare(0, 1, text=False)
+        algolist.compare(2, 3, text=False)
+
+        assert not test_algoscene.find_action_pairs(metadata_name='compare', occurence=1,
+                                                    lower_level='dehighlight')
+        dehighlight = test_algoscene.find_action_pairs(metadata_name='compare', occurence=2,
+                                                       lower_level='dehighlight')
+        # the dehighlight of both nodes is one action pair with their mobjects only
+        assert len(set(dehighlight)) == 1
+        args = dehighlight[0].curr_action().transform.args
+        assert args[1:] == [algolist.nodes[0].node, algolist.nodes[1].node]
+        assert algolist.highlighted_indexes() == [2, 3]
+
+    def test_compare_with_untracked_fills_dehighlights_nodes_filled_when_it_runs(self):
+        test_algoscene = AlgoScene()
+        algolist = AlgoList(test_algoscene, [1, 2, 3, 4])
+
+        algolist.compare(0, 1, text=False, untracked_fills=True)
+        algolist.compare(2, 3, text=False, untracked_fills=True)
+
+        # the metadata lists the nodes highlighted by the list
+        first_dehighlight = test_algoscene.find_action_pairs(metadata_name='compare', occurence=1,
+                                                             lower_level='dehighlight')
+        assert len(first_dehighlight) == 1
+        assert len(test_algoscene.find_action_pairs(metadata_name='compare', occurence=2,
+                                                    lower_level='dehighlight')) == 2
+
+        # like a fill added by customize(), only the filled node is animated
+        mobjects = [node.node for node in algolist.nodes]
+        mobjects[1].set_fill(RED)
+        animation = first_dehighlight[0].curr_action().transform.run()
+        assert animation.mobject.submobjects == [mobjects[1]]
+
     def test_find_action_pairs_2nd_compare_invalid_upper(self):
         test_algoscene = AlgoScene()
         algolist = AlgoList(test_algoscene, test_list)
@@ -124,12 +164,61 @@ class TestAlgoList:
 
         assert len(action_pairs) == 0
 
+    def test_align_nodes_adds_one_action_pair(self):
+        test_algoscene = AlgoScene()
+        algolist = AlgoList(test_algoscene, list(range(10)))
+        num_action_pairs = len(test_algoscene.action_pairs)
+
+        AlgoList.align_nodes_from_first_node(algolist, metadata=Metadata('align'))
+
+        assert len(test_algoscene.action_pairs) == num_action_pairs + 1
+
+    def test_place_in_row_matches_chained_next_to(self):
+        grps = [Square(side_length=1.5).shift(i * UP + i * LEFT) for i in range(4)]
+        chained = [grp.copy() for grp in grps]
+        for i in reversed(range(len(chained) - 1)):
+            chained[i].next_to(chained[i + 1], LEFT)
+
+        AlgoList.place_in_row(grps, len(grps) - 1)
+
+        for grp, chained_grp in zip(grps, chained):
+            assert np.allclose(grp.get_center(), chained_grp.get_center())
+
+    def test_place_in_row_spaces_labels_wider_than_their_node(self):
+        # a node whose label is three times as wide as the node itself
+        grps = [Square(side_length=1), Rectangle(width=3, height=0.5), Square(side_length=1)]
+        chained = [grp.copy() for grp in grps]
+        for i in range(1, len(chained)):
+            chained[i].next_to(chained[i - 1], RIGHT)
+
+        AlgoList.place_in_row(grps, 0)
+
+        for grp, chained_grp in zip(grps, chained):
+            assert np.allclose(grp.get_center(), chained_grp.get_center())
+        assert grps[1].get_right()[0] < grps[2].get_left()[0]
+
+    def test_list_is_laid_out_when_it_is_made(self):
+        test_algoscene = AlgoScene()
+        algolist = AlgoList(test_algoscene, [1, 2, 3], show=False)
+
+        transform = test_algoscene.action_pairs[-1].static_action.transform
+        assert transform.transform == AlgoList.place_in_row
+        assert transform.args[0] == [node.grp for node in algolist.nodes]
+
 # --------------- Slice Tests --------------- #
 #     def slice_set_up(self) -> None:
 #         algoscene.reset_mock()
 #         self.algolist = AlgoList(algoscene, test_list)
 
     # Check that the internal representation is represented accordingly
+    def test_group_metadata_keeps_values_as_planned(self):
+        algolist = AlgoList(algoscene, test_list)
+        metadata = Metadata('group')
+        algolist.group(metadata=metadata)
+        algolist.swap(0, 2)
+
+        assert metadata.children[-1].val == [1, 2, 3]
+
     def test_slice_internal_list_same_as_list_slicing(self):
         algoscene.reset_mock()
         algolist = AlgoList(algoscene, test_list)
@@ -145,7 +234,8 @@ class TestAlgoList:
         algolist = AlgoList(algoscene, test_list)
 
         _ = algolist.slice(0, len(test_list))
-        hide_list.assert_called_once()
+        # no hidden list is made to position the slice
+        hide_list.assert_not_called()
 
         _ = algolist.slice(0, len(test_list), shift=True)
         algoscene.shift_scene.assert_called_once()
@@ -186,11 +276,52 @@ class TestAlgoList:
         algolist2 = AlgoList(algoscene, test_list2)
 
         _ = algolist.merge(algolist, algolist2)
-        assert hide_list.call_count == 3
+        # only the copies of both lists are hidden
+        assert hide_list.call_count == 2
 
         _ = algolist.merge(algolist, algolist2, replace=True)
         replace.assert_called_once()
 
+    @patch("algomanim.algolist.AlgoNode", wraps=AlgoNode)
+    def test_merge_creates_no_hidden_nodes(self, algo_node):
+        algoscene.reset_mock()
+        test_list2 = [1, 2, 4]
+        algolist = AlgoList(algoscene, test_list)
+        algolist2 = AlgoList(algoscene, test_list2)
+        algo_node.reset_mock()
+
+        _ = algolist.merge(algolist, algolist2)
+
+        # copies of both lists and the merged list
+        assert algo_node.call_count == 2 * (len(test_list) + len(test_list2))
+
+    def test_row_center_pt_matches_chained_next_to(self):
+        anchor = Mock(grp=Square(side_length=1.5).shift(UP))
+        row = [Square(side_length=1.5), Rectangle(width=4, height=1), Square(side_length=1.5)]
+        pt_fn = AlgoList.row_center_pt([grp.copy() for grp in row], len(row) - 1, DOWN + LEFT)
+
+        row[-1].next_to(anchor.grp, DOWN + LEFT)
+        for i in reversed(range(len(row) - 1)):
+            row[i].next_to(row[i + 1], LEFT)
+
+        assert np.allclose(pt_fn(None, [anchor]), VGroup(*row).get_center())
+
+    def test_place_merge_slots_matches_chained_next_to(self):
+        left_list, right_list = Mock(), Mock()
+        left_list.nodes = [Mock(grp=Square(side_length=1).shift(2 * LEFT + UP))]
+        left_list.grp = left_list.nodes[0].grp
+        right_list.grp = Square(side_length=1).shift(2 * RIGHT + UP)
+        row = [Rectangle(width=3, height=1), Square(side_length=1)]
+        slots = [VectorizedPoint() for _ in row]
+
+        AlgoList.place_merge_slots(slots, [grp.copy() for grp in row], left_list, right_list)
+
+        row[0].next_to(left_list.grp, DOWN)
+        row[1].next_to(row[0], RIGHT)
+        VGroup(*row).set_x(0)
+        for slot, grp in zip(slots, row):
+            assert np.allclose(slot.get_center(), grp.get_center())
+
 # --------------- Concat Tests --------------- #
 #     def concat_set_up(self) -> None:
 #         self.algoscene.reset_mock()
@@ -121,3 +121,20 @@ class TestAlgoNode:
         algonode.dehighlight_line(targetnode)
 
         create_static_action.assert_not_called()
+
+    @patch('algomanim.algonode.Circle')
+    @patch('algomanim.algonode.Square')
+    @patch('algomanim.algoscene.AlgoScene.create_text')
+    def test_mobjects_are_made_when_first_used(self, create_text, square, circle):
+        algonode = AlgoNode(algoscene, DEFAULT_VAL)
+        algonode.place(RIGHT)
+        create_text.assert_not_called()
+        square.assert_not_called()
+
+        _ = algonode.grp
+
+        create_text.assert_called_once()
+        # only the configured shape is made
+        square.assert_called_once()
+        circle.assert_not_called()
+        algonode.grp.move_to.assert_called_once_with(RIGHT)
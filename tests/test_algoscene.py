@@ -1,9 +1,13 @@
 # pylint: disable=R0201, R0913, R0904
+import hashlib
 from unittest.mock import patch, Mock
+import pytest
 from manimlib.imports import *
-from algomanim.algoaction import AlgoTransform
+from algomanim.algoaction import AlgoTransform, AlgoSceneAction, do_nothing
 from algomanim.algoscene import AlgoScene
 from algomanim.algolist import AlgoList
+from algomanim.algoobject import AlgoObject
+from algomanim.metadata import Metadata
 from algomanim.settings import DEFAULT_SETTINGS
 
 
@@ -239,10 +243,97 @@ class TestAlgoScene:
         algoscene.add_slide(slide_text, index)
 
         add_fade_out_all.assert_called_once_with(index)
-        add_text.assert_called_once_with(slide_text, index+1, position=ORIGIN)
-        add_wait.assert_called_once_with(index + 2, wait_time=1)
+        add_text.assert_called_once_with(slide_text, index, position=ORIGIN)
+        add_wait.assert_called_once_with(index, wait_time=1)
         remove_text.assert_called_once()
-        add_fade_in_all.assert_called_once_with(index + 4)
+        add_fade_in_all.assert_called_once_with(index)
+
+    def test_add_slide_inserts_sequence_in_order_at_index(self):
+        algoscene = AlgoScene()
+        pairs = [Mock(), Mock()]
+        for pair in pairs:
+            algoscene.insert_action_pair(pair)
+
+        algoscene.add_slide('new slide!', 1)
+
+        names = [meta_tree.meta_name for meta_tree in algoscene.meta_trees]
+        assert names == ['fade_out', 'custom', 'wait', 'custom', 'fade_in']
+        slide_pairs = [meta_tree.children[0].action_pair for meta_tree in algoscene.meta_trees]
+        assert list(algoscene.action_pairs) == [pairs[0]] + slide_pairs + [pairs[1]]
+
+    def test_batch_inserts_against_original_indexes(self):
+        algoscene = AlgoScene()
+        pairs = [Mock() for _ in range(3)]
+        for pair in pairs:
+            algoscene.insert_action_pair(pair)
+        new_pairs = [Mock() for _ in range(4)]
+
+        with algoscene.batch():
+            algoscene.insert_action_pair(new_pairs[0], 2)
+            algoscene.insert_action_pair(new_pairs[1], 0)
+            algoscene.insert_action_pair(new_pairs[2], 2)
+            algoscene.insert_action_pair(new_pairs[3])
+            # nothing is inserted until the batch exits
+            assert list(algoscene.action_pairs) == pairs
+            assert algoscene.action_pairs.index(pairs[2]) == 2
+
+        assert list(algoscene.action_pairs) == [new_pairs[1], pairs[0], pairs[1],
+                                                new_pairs[0], new_pairs[2], pairs[2],
+                                                new_pairs[3]]
+        new_pairs[0].attach_timeline.assert_called_once_with(algoscene.action_pairs)
+
+    def test_batch_adds_metadata_on_exit(self):
+        algoscene = AlgoScene()
+        metadata = Mock()
+
+        with algoscene.batch():
+            algoscene.add_metadata(metadata)
+            assert not algoscene.meta_trees
+
+        assert algoscene.meta_trees == [metadata]
+
+    def test_batch_discards_insertions_on_error(self):
+        algoscene = AlgoScene()
+        pair = Mock()
+
+        with pytest.raises(ValueError):
+            with algoscene.batch():
+                algoscene.insert_action_pair(pair)
+                algoscene.add_metadata(Mock())
+                raise ValueError
+
+        assert not list(algoscene.action_pairs)
+        assert not algoscene.meta_trees
+        assert algoscene.batch_insertions is None
+
+    def test_nested_batch_is_committed_by_outer_batch(self):
+        algoscene = AlgoScene()
+        pairs = [Mock(), Mock()]
+
+        with algoscene.batch():
+            with algoscene.batch():
+                algoscene.insert_action_pair(pairs[0])
+            try:
+                with algoscene.batch():
+                    algoscene.insert_action_pair(pairs[1])
+                    raise ValueError
+            except ValueError:
+                pass
+            assert not list(algoscene.action_pairs)
+
+        assert list(algoscene.action_pairs) == [pairs[0]]
+
+    def test_insert_many_adds_custom_metadata_if_none_given(self):
+        algoscene = AlgoScene()
+        pairs = [Mock(), Mock()]
+        metadata = Mock()
+
+        algoscene.insert_many([(0, pairs[0], metadata), (0, pairs[1], None)])
+
+        assert list(algoscene.action_pairs) == pairs
+        assert algoscene.meta_trees[0] == metadata
+        assert algoscene.meta_trees[1].meta_name == 'custom'
+        assert algoscene.meta_trees[1].children[0].action_pair == pairs[1]
 
     @patch('algomanim.algoscene.AlgoScene.add_metadata')
     @patch('algomanim.algoscene.AlgoScene.insert_action_pair')
@@ -326,34 +417,29 @@ class TestAlgoScene:
         assert pair.static_action == mock_animation
         insert_action_pair.assert_called_once_with(pair, index)
 
-    @patch('algomanim.algoaction.AlgoSceneActionPair.attach_index')
-    def test_insert_action_pair_adds_to_back_if_index_not_given(self, attach_index):
+    def test_insert_action_pair_adds_to_back_if_index_not_given(self):
         algoscene = AlgoScene()
         initial_size = 3
         for _ in range(initial_size):
             algoscene.add_action_pair(mock_action_pair)
-        attach_index.reset_mock()
 
-        algoscene.add_action_pair(mock_action_pair)
+        pair = algoscene.add_action_pair(mock_action_pair)
 
-        attach_index.assert_called_once_with(initial_size)
+        assert pair.get_index() == initial_size
         assert len(algoscene.action_pairs) == initial_size + 1
 
-    @patch('algomanim.algoaction.AlgoSceneActionPair.attach_index')
-    @patch('algomanim.algoscene.AlgoScene.push_back_action_pair_indices')
-    def test_insert_action_pair_adds_to_given_index(self, push_back_action_pair_indices,
-                                                    attach_index):
+    def test_insert_action_pair_adds_to_given_index(self):
         algoscene = AlgoScene()
         initial_size = 3
-        for _ in range(initial_size):
-            algoscene.add_action_pair(mock_action_pair)
-        attach_index.reset_mock()
+        pairs = [algoscene.add_action_pair(mock_action_pair) for _ in range(initial_size)]
 
         index = 1
-        algoscene.add_action_pair(mock_action_pair, index=index)
+        pair = algoscene.add_action_pair(mock_action_pair, index=index)
 
-        push_back_action_pair_indices.assert_called_once_with(index)
-        attach_index.assert_called_once_with(index)
+        assert pair.get_index() == index
+        assert algoscene.action_pairs[index] is pair
+        # later action pairs are pushed back
+        assert [p.get_index() for p in pairs] == [0, 2, 3]
         assert len(algoscene.action_pairs) == initial_size + 1
 
     @patch('algomanim.algoscene.AlgoScene.add_metadata')
@@ -372,27 +458,68 @@ class TestAlgoScene:
     # ---------- test algoscene pipeline structure ----------
 
     @patch('algomanim.animation_block.AnimationBlock.run')
-    @patch('algomanim.algoaction.AlgoSceneActionPair.attach_index')
     @patch('algomanim.algoscene.AlgoScene.add_wait')
-    def test_execute_action_pairs_process_and_run_action_pairs(self, add_wait, attach_index, run):
+    def test_execute_action_pairs_process_and_run_action_pairs(self, add_wait, run):
         algoscene = AlgoScene()
         size = 3
         for _ in range(size):
             algoscene.add_action_pair(mock_action_pair)
             algoscene.post_customize_fns.append(mock_customisation)
-        attach_index.reset_mock()
 
         algoscene.execute_action_pairs(algoscene.action_pairs, algoscene.anim_blocks)
 
         # test that wait is added at the end
         add_wait.assert_called_once_with(size)
-        # test that indexes are attached
-        assert attach_index.call_count == size
+        # test that indexes match the position of each action pair
+        assert [pair.get_index() for pair in algoscene.action_pairs] == list(range(size))
         # test that post customisations are added
         assert mock_customisation.call_count == size
         # test that animations are run
         assert run.call_count == len(algoscene.anim_blocks)
 
+    def test_runtime_change_moves_later_blocks_and_metadata_blocks(self):
+        algoscene = AlgoScene()
+        pairs = []
+        for i in range(3):
+            pair = algoscene.add_action_pair(algoscene.create_play_action(AlgoTransform([])))
+            pairs.append(pair)
+            algoscene.add_metadata(Mock(get_all_action_pairs=Mock(return_value=[pair])))
+
+        algoscene.create_animation_blocks(algoscene.action_pairs, algoscene.anim_blocks)
+        algoscene.create_metadata_blocks()
+        assert [block.start_time for block in algoscene.metadata_blocks] == [0, 1, 2]
+
+        pairs[1].set_runtime(2.5)
+
+        assert [block.start_time for block in algoscene.anim_blocks] == [0, 1, 3.5]
+        assert [block.start_position() for block in algoscene.metadata_blocks] == \
+            [0, 1000, 3500]
+        assert algoscene.metadata_blocks[1].runtime == 2.5
+
+        pairs[1].set_runtime(None)
+
+        assert [block.start_time for block in algoscene.anim_blocks] == [0, 1, 2]
+
+    def test_runs_of_static_actions_are_fused_into_one_block(self):
+        algoscene = AlgoScene()
+        applied = []
+        for i in range(3):
+            static_action = AlgoSceneAction.create_static_action(applied.append, [i])
+            # skipped animated pair, its static action is run
+            algoscene.add_action_pair(algoscene.create_play_action(AlgoTransform([])),
+                                      static_action, animated=False)
+        # static action not run with the previous one
+        algoscene.add_action_pair(AlgoSceneAction(do_nothing, AlgoTransform([3], applied.append)))
+        algoscene.add_action_pair(algoscene.create_play_action(AlgoTransform([])))
+        algoscene.add_action_pair(AlgoSceneAction.create_static_action(applied.append, [4]))
+
+        algoscene.create_animation_blocks(algoscene.action_pairs, algoscene.anim_blocks)
+
+        assert [len(block.action_pairs) for block in algoscene.anim_blocks] == [4, 1, 1]
+        assert [block.is_static() for block in algoscene.anim_blocks] == [True, False, True]
+        algoscene.anim_blocks[0].run()
+        assert applied == [0, 1, 2, 3]
+
     @patch('algomanim.algoscene.AlgoScene.create_metadata_blocks')
     @patch('algomanim.algoscene.AlgoScene.execute_action_pairs')
     @patch('algomanim.algoscene.AlgoScene.customize_construct')
@@ -436,6 +563,31 @@ class TestAlgoScene:
         AlgoSceneTestDoubleNotTogether()
         assert play.call_count == 2
 
+    @patch('algomanim.algoscene.Scene.wait')
+    @patch('algomanim.algoscene.Scene.play')
+    def test_plan_only_creates_timeline_without_playing(self, play, wait):
+        algoscene = AlgoSceneTestDoubleNotTogether(plan_only=True)
+
+        play.assert_not_called()
+        wait.assert_not_called()
+        # two plays and the wait added at the end
+        assert len(algoscene.anim_blocks) == 3
+        assert algoscene.anim_blocks[1].start_position() == 1000
+        assert algoscene.metadata_blocks[-1].end_position() == \
+            algoscene.block_timings.total_time() * 1000
+
+    @patch('algomanim.algoscene.Scene.play')
+    def test_on_plan_gets_timeline_before_blocks_run(self, play):
+        plans = []
+        algoscene = AlgoSceneTestDoubleNotTogether(
+            on_plan=lambda scene: plans.append((play.call_count, scene.metadata_blocks)))
+
+        assert play.call_count == 2
+        # the timeline passed on is the one of the rendered scene
+        assert len(plans) == 1
+        assert plans[0][0] == 0
+        assert plans[0][1] is algoscene.metadata_blocks
+
     @patch('algomanim.algoscene.Scene.play')
     def test_set_color(self, play):
         AlgoSceneCustomColor()
@@ -525,7 +677,10 @@ class AlgoSceneMockList(AlgoScene):
     @patch('algomanim.algolist.AlgoList.center', Mock())
     @patch('algomanim.algolist.AlgoList.show_list', Mock())
     def algo(self):
-        AlgoList(self, self.test_list)
+        algolist = AlgoList(self, self.test_list)
+        # nodes only make their mobjects when first used
+        for node in algolist.nodes:
+            node.build_mobjects()
 
 class AlgoSceneNodeColorHex(AlgoSceneMockList):
     test_color = '#FFFF00'
@@ -556,3 +711,75 @@ class AlgoSceneTextFont(AlgoSceneMockList):
 
     def customize(self):
         self.add_text(self.test_text)
+
+
+class Box(AlgoObject):
+    ''' Square with a circle drawn over it, standing in for an AlgoNode and its text '''
+    def __init__(self, scene, val):
+        super().__init__(scene)
+        self.val = val
+        self.node = Square(side_length=1, fill_opacity=1).shift(2 * (val - 1) * RIGHT)
+        self.grp = VGroup(self.node, Circle(radius=0.3).move_to(self.node))
+
+
+class AlgoSceneBoxes(AlgoScene):
+    ''' Highlights and hides three boxes, one action pair per box or in bulk '''
+    def algo(self):
+        boxes = [Box(self, val) for val in range(3)]
+        grps = [box.grp for box in boxes]
+        nodes = [box.node for box in boxes]
+        self.add(*grps)
+        metadata = Metadata('boxes')
+        if self.kwargs.get('bulk'):
+            AlgoObject.bulk_fn_w_prev(boxes, AlgoObject.fill_all, AlgoObject.static_fill_all,
+                                      [YELLOW] + nodes, 'highlight', metadata=metadata,
+                                      animated=True, w_prev=False, color_index=0)
+            AlgoObject.bulk_fn_w_prev(boxes, AlgoObject.fade_out_all, self.remove, grps,
+                                      'hide', metadata=metadata, animated=True, w_prev=False)
+        else:
+            for i, node in enumerate(nodes):
+                self.add_action_pair(self.create_play_action(
+                    AlgoTransform([node.set_fill, YELLOW], transform=ApplyMethod), w_prev=i > 0))
+            for i, grp in enumerate(grps):
+                self.add_action_pair(self.create_play_action(
+                    AlgoTransform([grp], transform=FadeOut), w_prev=i > 0))
+        self.add_metadata(metadata)
+
+
+def render_frame_hashes(**kwargs):
+    ''' Renders AlgoSceneBoxes and returns a hash of every frame and of what it draws '''
+    frame_hashes = []
+    add_frames = Scene.add_frames
+
+    def record_frames(scene, *frames):
+        digest = hashlib.md5()
+        for mobject in scene.get_mobject_family_members():
+            digest.update(mobject.get_center().tobytes())
+            digest.update(mobject.get_fill_rgbas().tobytes())
+            digest.update(mobject.get_stroke_rgbas().tobytes())
+        frame_hashes.extend(digest.hexdigest() + hashlib.md5(frame.tobytes()).hexdigest()
+                            for frame in frames)
+        add_frames(scene, *frames)
+
+    with patch.object(Scene, 'add_frames', autospec=True, side_effect=record_frames):
+        scene = AlgoSceneBoxes(camera_config=LOW_QUALITY_CAMERA_CONFIG, **kwargs)
+    return scene, frame_hashes
+
+
+@patch('algomanim.algoobject.TexMobject', Mock())
+class TestBulkAnimations:
+
+    def test_bulk_animations_write_the_same_frames(self):
+        scene, frame_hashes = render_frame_hashes()
+        bulk_scene, bulk_frame_hashes = render_frame_hashes(bulk=True)
+
+        assert len(bulk_scene.action_pairs) == 2
+        assert len(scene.action_pairs) == 6
+        assert len(set(frame_hashes)) > 1
+        assert bulk_frame_hashes == frame_hashes
+
+    def test_bulk_hide_removes_members_from_scene(self):
+        scene, _ = render_frame_hashes(bulk=True)
+
+        assert scene.get_mobject_family_members() == []
+        assert [lower.val for lower in scene.meta_trees[0].children] == [[0], [1], [2]] * 2
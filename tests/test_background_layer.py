@@ -0,0 +1,83 @@
+# pylint: disable=R0201
+import hashlib
+from unittest.mock import patch
+from manimlib.imports import *
+from algomanim.algoscene import AlgoScene
+from algomanim.background_layer import BackgroundLayer
+from algomanim.frame_regions import pixel_transform, pixel_bounds, clip_bounds
+
+
+def paint(camera, vmobjects, pixel_array):
+    ''' Draws the bounds of vmobjects in a colour depending on how they are drawn '''
+    transform = pixel_transform(camera)
+    for vmobject, rect in zip(vmobjects, pixel_bounds(vmobjects, transform)):
+        rect = clip_bounds(rect, pixel_array)
+        if rect is not None:
+            left, top, right, bottom = rect
+            color = hashlib.md5(vmobject.fill_rgbas.tobytes()).digest()[:4]
+            pixel_array[top:bottom, left:right] = np.frombuffer(color, dtype=np.uint8)
+
+
+def make_squares():
+    return [Square(side_length=1).set_fill(BLUE, 1).shift(1.5 * i * RIGHT)
+            for i in range(-3, 4)]
+
+
+def render_whole(camera, mobjects):
+    return BackgroundLayer().render(camera, mobjects).copy()
+
+
+@patch.object(Camera, 'display_multiple_non_background_colored_vmobjects', paint)
+class TestBackgroundLayer:
+
+    def test_unchanged_mobjects_are_not_drawn_again(self):
+        camera = MovingCamera()
+        layer = BackgroundLayer()
+        squares = make_squares()
+        image = layer.render(camera, squares).copy()
+
+        with patch.object(camera, 'capture_mobjects') as capture_mobjects:
+            assert (layer.render(camera, squares) == image).all()
+
+        capture_mobjects.assert_not_called()
+
+    def test_changed_regions_are_drawn_like_the_whole_frame(self):
+        camera = MovingCamera()
+        layer = BackgroundLayer()
+        squares = make_squares()
+        layer.render(camera, squares)
+
+        squares[1].set_fill(RED, 1)
+        squares[4].shift(0.75 * RIGHT)
+        image = layer.render(camera, squares[:-1] + [Circle()])
+
+        assert (layer.full_draws, layer.partial_draws) == (1, 1)
+        assert (image == render_whole(camera, squares[:-1] + [Circle()])).all()
+
+    def test_reordered_mobjects_are_drawn_whole(self):
+        camera = MovingCamera()
+        layer = BackgroundLayer()
+        squares = make_squares()
+        layer.render(camera, squares)
+
+        layer.render(camera, squares[1:] + squares[:1])
+
+        assert layer.full_draws == 2
+
+    def test_moving_mobjects_are_drawn_like_the_whole_frame(self):
+        frames = []
+        for background_layer in [None, BackgroundLayer()]:
+            scene = AlgoScene(background_layer=background_layer)
+            squares = make_squares()
+            # a label over the first square, which the last square moves across
+            label = Square(side_length=0.5).set_fill(WHITE, 1).move_to(squares[0])
+            scene.add(*squares, label)
+            animations = [ApplyMethod(squares[0].set_fill, RED, run_time=0.2),
+                          ApplyMethod(squares[-1].shift, 6 * LEFT, run_time=0.2)]
+            scene.begin_animations(animations)
+            with patch.object(scene, 'add_frames') as add_frames:
+                scene.progress_through_animations(animations)
+            frames.append([call[0][0] for call in add_frames.call_args_list])
+
+        assert len(frames[0]) == len(frames[1]) > 1
+        assert all((frame == layer_frame).all() for frame, layer_frame in zip(*frames))
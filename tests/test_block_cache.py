@@ -0,0 +1,213 @@
+# pylint: disable=R0201
+import os
+import shutil
+from unittest.mock import Mock, patch
+import cairo
+import pytest
+from manimlib.imports import *
+from algomanim.algoaction import AlgoTransform, AlgoSceneActionPair
+from algomanim.algoscene import AlgoScene
+from algomanim.animation_block import AnimationBlock
+from algomanim.block_cache import BlockVideoCache, scene_state_hash
+from algomanim.block_timings import BlockTimings
+
+
+def get_highlight_block(scene, circle, color):
+    anim_action = scene.create_play_action(
+        AlgoTransform([circle.set_fill, color], transform=ApplyMethod, color_index=1))
+    return AnimationBlock([AlgoSceneActionPair(anim_action)], BlockTimings())
+
+def get_scene_with_circle(shift=ORIGIN):
+    scene = AlgoScene()
+    circle = Circle().shift(shift)
+    scene.add(circle)
+    return scene, circle
+
+def write_file(path, size):
+    with open(path, 'wb') as movie_file:
+        movie_file.write(b'0' * size)
+
+
+class IndicateScene(AlgoScene):
+    ''' Indicates three circles one after the other in the colours of indicate_colors '''
+
+    indicate_colors = [RED, GREEN, BLUE]
+
+    def algo(self):
+        circles = [Circle(radius=0.5).shift(2 * i * RIGHT) for i in range(-1, 2)]
+        self.add(*circles)
+        for circle, color in zip(circles, self.indicate_colors):
+            self.add_transform(custom_transform=lambda mobject, color=color:
+                               Indicate(mobject, color=color, run_time=0.2), args=[circle])
+
+def render_indicate_scene(tmp_path, cache, indicate_colors):
+    with patch.object(IndicateScene, 'indicate_colors', indicate_colors), \
+            patch('manimlib.constants.VIDEO_DIR', ''), \
+            patch('manimlib.constants.VIDEO_OUTPUT_DIR', str(tmp_path / 'videos')):
+        IndicateScene(block_cache=cache, camera_config=LOW_QUALITY_CAMERA_CONFIG,
+                      file_writer_config={'write_to_movie': True})
+
+
+class TestBlockVideoCache:
+
+    def test_get_returns_stored_copy(self, tmp_path):
+        cache = BlockVideoCache(str(tmp_path / 'cache'))
+        movie_path = str(tmp_path / '00000.mp4')
+        write_file(movie_path, 10)
+
+        assert cache.get('key', '.mp4') is None
+        cache.put('key', '.mp4', movie_path)
+        os.remove(movie_path)
+
+        with open(cache.get('key', '.mp4'), 'rb') as cached_file:
+            assert cached_file.read() == b'0' * 10
+
+    def test_evict_removes_least_recently_used(self, tmp_path):
+        cache = BlockVideoCache(str(tmp_path / 'cache'), max_size=25)
+        movie_path = str(tmp_path / '00000.mp4')
+        write_file(movie_path, 10)
+
+        cache.put('a', '.mp4', movie_path)
+        cache.put('b', '.mp4', movie_path)
+        # reading a makes b the least recently used
+        cache.get('a', '.mp4')
+        cache.put('c', '.mp4', movie_path)
+
+        assert cache.get('a', '.mp4') is not None
+        assert cache.get('b', '.mp4') is None
+        assert cache.get('c', '.mp4') is not None
+
+    def test_evict_does_not_scan_the_directory(self, tmp_path):
+        cache = BlockVideoCache(str(tmp_path / 'cache'), max_size=25)
+        movie_path = str(tmp_path / '00000.mp4')
+        write_file(movie_path, 10)
+
+        with patch('os.scandir') as scandir:
+            for key in 'abcd':
+                cache.put(key, '.mp4', movie_path)
+
+        scandir.assert_not_called()
+        assert cache.size == 20
+        assert list(cache.entries) == [cache.path('c', '.mp4'), cache.path('d', '.mp4')]
+        assert sorted(os.listdir(str(tmp_path / 'cache'))) == ['c.mp4', 'd.mp4']
+
+    def test_files_of_earlier_renders_are_loaded_in_order_of_use(self, tmp_path):
+        cache = BlockVideoCache(str(tmp_path / 'cache'))
+        movie_path = str(tmp_path / '00000.mp4')
+        write_file(movie_path, 10)
+        cache.put('a', '.mp4', movie_path)
+        cache.put('b', '.mp4', movie_path)
+        os.utime(cache.path('a', '.mp4'), (2, 2))
+        os.utime(cache.path('b', '.mp4'), (1, 1))
+
+        cache = BlockVideoCache(str(tmp_path / 'cache'), max_size=25)
+        cache.put('c', '.mp4', movie_path)
+
+        assert cache.get('a', '.mp4') is not None
+        assert cache.get('b', '.mp4') is None
+
+    def test_block_key_is_stable_across_scenes(self):
+        scene1, circle1 = get_scene_with_circle()
+        scene2, circle2 = get_scene_with_circle()
+
+        assert BlockVideoCache.block_key(scene1, get_highlight_block(scene1, circle1, RED)) == \
+            BlockVideoCache.block_key(scene2, get_highlight_block(scene2, circle2, RED))
+
+    def test_block_key_changes_with_color(self):
+        scene, circle = get_scene_with_circle()
+
+        assert BlockVideoCache.block_key(scene, get_highlight_block(scene, circle, RED)) != \
+            BlockVideoCache.block_key(scene, get_highlight_block(scene, circle, BLUE))
+
+    def test_block_key_changes_with_runtime(self):
+        scene, circle = get_scene_with_circle()
+        anim_block = get_highlight_block(scene, circle, RED)
+        key = BlockVideoCache.block_key(scene, anim_block)
+
+        anim_block.first_pair().set_runtime(3)
+
+        assert BlockVideoCache.block_key(scene, anim_block) != key
+
+    def test_block_key_changes_with_state_that_is_not_drawn_yet(self):
+        scene, circle = get_scene_with_circle()
+        anim_block = get_highlight_block(scene, circle, RED)
+        key = BlockVideoCache.block_key(scene, anim_block)
+
+        # updaters and foreground mobjects change the frames of the block
+        circle.add_updater(lambda mobject, dt: mobject.shift(dt * UP))
+        updated_key = BlockVideoCache.block_key(scene, anim_block)
+        scene.add_foreground_mobjects(Square())
+
+        assert len({key, updated_key, BlockVideoCache.block_key(scene, anim_block)}) == 3
+
+    def test_scene_state_hash_changes_with_mobjects(self):
+        scene1, _ = get_scene_with_circle()
+        scene2, _ = get_scene_with_circle()
+        scene3, _ = get_scene_with_circle(shift=LEFT)
+
+        assert scene_state_hash(scene1) == scene_state_hash(scene2)
+        assert scene_state_hash(scene1) != scene_state_hash(scene3)
+
+    def get_scene_and_block(self, tmp_path):
+        scene = Mock(skip_animations=False)
+        scene.file_writer.movie_file_extension = '.mp4'
+        scene.file_writer.get_next_partial_movie_path.return_value = str(tmp_path / '00000.mp4')
+        anim_block = Mock()
+        anim_block.act.return_value = scene.play
+        return scene, anim_block
+
+    def test_run_block_renders_and_stores_on_miss(self, tmp_path):
+        cache = BlockVideoCache(str(tmp_path / 'cache'))
+        cache.block_key = Mock(return_value='key')
+        scene, anim_block = self.get_scene_and_block(tmp_path)
+        anim_block.run.side_effect = lambda: write_file(str(tmp_path / '00000.mp4'), 10)
+
+        cache.run_block(scene, anim_block)
+
+        anim_block.run.assert_called_once()
+        assert cache.get('key', '.mp4') is not None
+        assert cache.misses == 1
+
+    def test_run_block_copies_movie_on_hit(self, tmp_path):
+        cache = BlockVideoCache(str(tmp_path / 'cache'))
+        cache.block_key = Mock(return_value='key')
+        write_file(str(tmp_path / 'cached.mp4'), 10)
+        cache.put('key', '.mp4', str(tmp_path / 'cached.mp4'))
+        scene, anim_block = self.get_scene_and_block(tmp_path)
+        skipped = []
+        anim_block.run.side_effect = lambda: skipped.append(scene.skip_animations)
+
+        cache.run_block(scene, anim_block)
+
+        # the block is still run to update the scene, without writing frames
+        assert skipped == [True]
+        assert not scene.skip_animations
+        assert os.path.exists(str(tmp_path / '00000.mp4'))
+        assert cache.hits == 1
+
+    def test_run_block_only_runs_static_blocks(self, tmp_path):
+        cache = BlockVideoCache(str(tmp_path / 'cache'))
+        cache.block_key = Mock()
+        scene, anim_block = self.get_scene_and_block(tmp_path)
+        anim_block.act.return_value = Mock()
+
+        cache.run_block(scene, anim_block)
+
+        anim_block.run.assert_called_once()
+        cache.block_key.assert_not_called()
+
+
+# the cached videos are real renders, drawn with pycairo and written with ffmpeg
+@pytest.mark.skipif(not hasattr(cairo, 'version_info') or shutil.which(FFMPEG_BIN) is None,
+                    reason='pycairo and ffmpeg are needed to render videos')
+class TestBlockVideoCacheRender:
+
+    def test_only_the_changed_block_is_rendered_again(self, tmp_path):
+        cache = BlockVideoCache(str(tmp_path / 'cache'))
+        render_indicate_scene(tmp_path, cache, [RED, GREEN, BLUE])
+        assert (cache.hits, cache.misses) == (0, 3)
+
+        render_indicate_scene(tmp_path, cache, [RED, YELLOW, BLUE])
+
+        # the circles are as before the second block once it ends
+        assert (cache.hits, cache.misses) == (2, 4)
@@ -0,0 +1,28 @@
+# pylint: disable=R0201
+from unittest.mock import Mock
+from algomanim.animation_block import AnimationBlock
+from algomanim.block_timings import BlockTimings
+
+
+def get_test_blocks(runtimes):
+    timings = BlockTimings()
+    pairs = [Mock(**{'get_runtime_val.return_value': runtime}) for runtime in runtimes]
+    return timings, [AnimationBlock([pair], timings) for pair in pairs]
+
+
+class TestBlockTimings:
+
+    def test_blocks_start_after_previous_blocks(self):
+        _, blocks = get_test_blocks([1, 0, 2, 0.5])
+        assert [block.position for block in blocks] == [0, 1, 2, 3]
+        assert [block.start_time for block in blocks] == [0, 1, 1, 3]
+        assert [block.end_time for block in blocks] == [1, 1, 3, 3.5]
+
+    def test_update_runtime_moves_later_blocks(self):
+        timings, blocks = get_test_blocks([1, 1, 1, 1])
+        blocks[1].first_pair().get_runtime_val.return_value = 3
+        blocks[1].update_runtime()
+
+        assert [block.start_time for block in blocks] == [0, 1, 4, 5]
+        assert timings.runtime(1) == 3
+        assert timings.total_time() == 6
@@ -0,0 +1,128 @@
+# pylint: disable=R0201
+import hashlib
+from unittest.mock import patch
+import cairo
+import pytest
+from manimlib.imports import *
+from algomanim.algoscene import AlgoScene
+from algomanim.dirty_rect_camera import DirtyRectCamera
+from algomanim.frame_regions import pixel_transform, pixel_bounds, clip_bounds, miter_ratio, \
+    stroke_padding, ANTIALIAS_PADDING
+
+
+def paint(camera, vmobjects, pixel_array):
+    ''' Draws the bounds of vmobjects within the clip of camera, like cairo would their paths '''
+    clip = np.ones(pixel_array.shape[:2], dtype=bool)
+    if getattr(camera, 'clip_rects', None) is not None:
+        clip[:] = False
+        for left, top, right, bottom in camera.clip_rects:
+            clip[top:bottom, left:right] = True
+    transform = pixel_transform(camera)
+    for vmobject, rect in zip(vmobjects, pixel_bounds(vmobjects, transform)):
+        rect = clip_bounds(rect, pixel_array)
+        if rect is not None:
+            left, top, right, bottom = rect
+            color = hashlib.md5(vmobject.fill_rgbas.tobytes()).digest()[:4]
+            pixels = pixel_array[top:bottom, left:right]
+            pixels[clip[top:bottom, left:right]] = np.frombuffer(color, dtype=np.uint8)
+
+
+def make_squares():
+    return [Square(side_length=1).set_fill(BLUE, 1).shift(1.5 * i * RIGHT)
+            for i in range(-3, 4)]
+
+
+def render_frames(camera_class, make_animations):
+    scene = AlgoScene(camera_class=camera_class)
+    squares = make_squares()
+    # a label over the first square, which the last square moves across
+    label = Square(side_length=0.5).set_fill(WHITE, 1).move_to(squares[0])
+    scene.add(*squares, label)
+    animations = make_animations(scene, squares)
+    scene.begin_animations(animations)
+    with patch.object(scene, 'add_frames') as add_frames:
+        scene.progress_through_animations(animations)
+    return scene.camera, [call[0][0] for call in add_frames.call_args_list]
+
+
+@patch.object(Camera, 'display_multiple_non_background_colored_vmobjects', paint)
+class TestDirtyRectCamera:
+
+    def test_frames_are_drawn_like_with_the_default_camera(self):
+        def make_animations(_, squares):
+            return [ApplyMethod(squares[0].set_fill, RED, run_time=0.2),
+                    ApplyMethod(squares[-1].shift, 9 * LEFT, run_time=0.2)]
+
+        _, frames = render_frames(MovingCamera, make_animations)
+        camera, dirty_frames = render_frames(DirtyRectCamera, make_animations)
+
+        assert camera.partial_draws == len(dirty_frames) - 1 > 0
+        assert len(frames) == len(dirty_frames)
+        assert all((frame == dirty_frame).all() for frame, dirty_frame in zip(frames, dirty_frames))
+
+    def test_moving_camera_frame_is_drawn_whole(self):
+        def make_animations(scene, _):
+            return [ApplyMethod(scene.camera_frame.shift, RIGHT, run_time=0.2)]
+
+        _, frames = render_frames(MovingCamera, make_animations)
+        camera, dirty_frames = render_frames(DirtyRectCamera, make_animations)
+
+        assert camera.partial_draws == 0
+        assert all((frame == dirty_frame).all() for frame, dirty_frame in zip(frames, dirty_frames))
+
+    def test_frames_set_elsewhere_are_drawn_whole(self):
+        camera = DirtyRectCamera()
+        squares = make_squares()
+
+        camera.capture_frame(squares, squares[:1])
+        camera.capture_frame(squares, squares[:1])
+        camera.reset()
+        camera.capture_frame(squares, squares[:1])
+
+        assert (camera.full_draws, camera.partial_draws) == (2, 1)
+
+
+# an arrow tip whose mitred point reaches past a stroke width from its points
+def make_arrow_tip():
+    return Polygon(ORIGIN, 0.6 * LEFT + 0.1 * UP, 0.6 * LEFT + 0.1 * DOWN) \
+        .set_stroke(YELLOW, 12).set_fill(YELLOW, 1)
+
+
+class TestStrokePadding:
+
+    def test_padding_reaches_the_mitred_corners(self):
+        camera = DirtyRectCamera()
+        transform = pixel_transform(camera)
+        tip = make_arrow_tip()
+        half_width = tip.get_stroke_width() * transform.line_scale / 2
+
+        assert np.isclose(miter_ratio(tip), 1 / np.sin(np.arctan(1 / 6)))
+        assert stroke_padding(tip, transform) == \
+            np.ceil(half_width * miter_ratio(tip)) + ANTIALIAS_PADDING
+
+    def test_corners_too_sharp_for_the_miter_limit_are_bevelled(self):
+        # the corner at the origin is bevelled, the sharpest mitred one is next to it
+        triangle = Polygon(ORIGIN, 20 * LEFT + UP, 20 * LEFT)
+        sharpest_mitred = PI / 2 - np.arctan(1 / 20)
+
+        assert np.isclose(miter_ratio(triangle), 1 / np.sin(sharpest_mitred / 2))
+        assert miter_ratio(Circle()) == 1
+
+
+# frames drawn by pycairo, with strokes mitred as manim's cameras draw them
+@pytest.mark.skipif(not hasattr(cairo, 'version_info'), reason='pycairo is not installed')
+class TestDirtyRectCameraDrawing:
+
+    def test_frames_are_drawn_like_with_the_default_camera(self):
+        def make_animations(scene, squares):
+            tip = make_arrow_tip().next_to(squares[-1], UP)
+            scene.add(tip)
+            return [ApplyMethod(tip.shift, 9 * LEFT, run_time=0.2),
+                    Rotate(squares[2], PI / 3, run_time=0.2)]
+
+        _, frames = render_frames(MovingCamera, make_animations)
+        camera, dirty_frames = render_frames(DirtyRectCamera, make_animations)
+
+        assert camera.partial_draws > 0
+        assert len(frames) == len(dirty_frames)
+        assert all((frame == dirty_frame).all() for frame, dirty_frame in zip(frames, dirty_frames))
@@ -0,0 +1,52 @@
+# pylint: disable=R0201
+from algomanim.fenwick_tree import FenwickTree
+
+
+test_values = [3, 0, 2, 5, 1, 4, 0, 7, 2]
+
+
+class TestFenwickTree:
+
+    def test_prefix_sum_matches_list_sums(self):
+        tree = FenwickTree(test_values)
+        for i in range(len(test_values) + 1):
+            assert tree.prefix_sum(i) == sum(test_values[:i])
+
+    def test_add_updates_later_prefix_sums(self):
+        tree = FenwickTree(test_values)
+        tree.add(2, 10)
+        assert tree.prefix_sum(2) == sum(test_values[:2])
+        assert tree.prefix_sum(3) == sum(test_values[:3]) + 10
+        assert tree.total() == sum(test_values) + 10
+
+    def test_set_replaces_value(self):
+        tree = FenwickTree(test_values)
+        tree.set(4, 9)
+        assert tree.get(4) == 9
+        assert tree.total() == sum(test_values) - test_values[4] + 9
+
+    def test_append_matches_tree_built_at_once(self):
+        tree = FenwickTree()
+        for value in test_values:
+            tree.append(value)
+        assert tree.tree == FenwickTree(test_values).tree
+
+    def test_search_returns_position_and_remainder(self):
+        tree = FenwickTree(test_values)
+        for target in range(sum(test_values)):
+            index, remainder = tree.search(target)
+            assert sum(test_values[:index]) <= target < sum(test_values[:index + 1])
+            assert remainder == target - sum(test_values[:index])
+
+    def test_search_past_total_returns_length(self):
+        tree = FenwickTree(test_values)
+        index, _ = tree.search(sum(test_values))
+        assert index == len(test_values)
+
+    def test_inclusive_search_returns_first_position_reaching_target(self):
+        values = [2, 0, 0, 3, 1]
+        tree = FenwickTree(values)
+        for target in range(1, sum(values) + 1):
+            index, _ = tree.search(target, inclusive=True)
+            assert sum(values[:index]) < target <= sum(values[:index + 1])
+        assert tree.search(0, inclusive=True)[0] == 0
@@ -0,0 +1,67 @@
+# pylint: disable=R0201
+import hashlib
+from unittest.mock import patch
+from manimlib.imports import *
+from algomanim.algoscene import AlgoScene
+from algomanim.frame_pool import FramePool
+from algomanim.frame_regions import pixel_transform, pixel_bounds, clip_bounds
+
+
+def paint(camera, vmobjects, pixel_array):
+    ''' Draws the bounds of vmobjects in a colour depending on how they are drawn '''
+    transform = pixel_transform(camera)
+    for vmobject, rect in zip(vmobjects, pixel_bounds(vmobjects, transform)):
+        rect = clip_bounds(rect, pixel_array)
+        if rect is not None:
+            left, top, right, bottom = rect
+            color = hashlib.md5(vmobject.fill_rgbas.tobytes()).digest()[:4]
+            pixel_array[top:bottom, left:right] = np.frombuffer(color, dtype=np.uint8)
+
+
+def make_scene(frame_pool):
+    scene = AlgoScene(frame_pool=frame_pool, camera_config=LOW_QUALITY_CAMERA_CONFIG)
+    squares = [Square(side_length=1).set_fill(BLUE, 1).shift(1.5 * i * RIGHT)
+               for i in range(-3, 4)]
+    scene.add(*squares)
+    return scene, squares
+
+
+def render_frames(scene, animations):
+    scene.begin_animations(animations)
+    with patch.object(scene, 'add_frames') as add_frames:
+        scene.progress_through_animations(animations)
+    return [call[0][0] for call in add_frames.call_args_list]
+
+
+@patch.object(Camera, 'display_multiple_non_background_colored_vmobjects', paint)
+class TestFramePool:
+
+    def test_frames_are_drawn_like_in_the_scene(self):
+        frames = []
+        for frame_pool in [None, FramePool(workers=2, min_frames=1)]:
+            scene, squares = make_scene(frame_pool)
+            frames.append(render_frames(scene, [
+                ApplyMethod(squares[0].set_fill, RED, run_time=0.5),
+                ApplyMethod(squares[-1].shift, 9 * LEFT, run_time=0.5)]))
+
+        assert frame_pool.parallel_plays == 1
+        assert len(frames[0]) == len(frames[1]) > 1
+        assert all((frame == pool_frame).all() for frame, pool_frame in zip(*frames))
+
+    def test_short_plays_are_drawn_by_the_scene(self):
+        frame_pool = FramePool(workers=2, min_frames=100)
+        scene, squares = make_scene(frame_pool)
+        short_play, long_play = [FadeIn(squares[0], run_time=1)], [FadeIn(squares[1], run_time=10)]
+        scene.begin_animations(short_play + long_play)
+
+        assert not frame_pool.can_render(scene, short_play)
+        assert frame_pool.can_render(scene, long_play)
+
+    def test_plays_with_updaters_are_drawn_by_the_scene(self):
+        frame_pool = FramePool(workers=2, min_frames=1)
+        scene, squares = make_scene(frame_pool)
+        squares[1].add_updater(lambda mobject, dt: mobject.shift(dt * UP))
+        animations = [FadeIn(squares[0])]
+        scene.begin_animations(animations)
+
+        assert not frame_pool.can_render(scene, animations)
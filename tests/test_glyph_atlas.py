@@ -0,0 +1,59 @@
+# pylint: disable=R0201
+from unittest.mock import patch
+from manimlib.imports import *
+from algomanim.algoscene import AlgoScene
+from algomanim.glyph_atlas import GlyphAtlas
+
+
+# (width, left side bearing, right side bearing, height above the baseline) of each character
+METRICS = {'0': (0.5, 0.05, 0.05, 0), '1': (0.3, 0.15, 0.1, 0), '-': (0.3, 0.05, 0.1, 0.25),
+           '.': (0.1, 0.1, 0.1, 0), ' ': (None, 0.15, 0.15, 0)}
+
+
+def make_text(text_string):
+    ''' Lays text_string out like a text mobject of a font without kerning, centred '''
+    text = VGroup()
+    left = 0
+    for char in text_string:
+        width, lead, trail, height = METRICS[char]
+        left += lead
+        if width is not None:
+            text.add(Rectangle(width=width, height=0.4).move_to(
+                [left + width / 2, height, 0]))
+            left += width
+        left += trail
+    return text.center()
+
+
+class TestGlyphAtlas:
+
+    def test_label_is_laid_out_like_its_text(self):
+        atlas = GlyphAtlas(make_text)
+
+        for text_string in ['10', '-1.01', '1 0', '0']:
+            label = atlas.make_label(text_string)
+            assert np.allclose(label.get_all_points(), make_text(text_string).get_all_points())
+
+    def test_glyphs_are_made_once(self):
+        calls = []
+        atlas = GlyphAtlas(lambda text_string: calls.append(text_string) or make_text(text_string))
+
+        for text_string in ['10', '01', '110', '-10']:
+            atlas.make_label(text_string)
+
+        assert sorted(calls) == ['0-0', '000', '010']
+        assert atlas.made == 3
+
+    @patch('algomanim.algoscene.TextMobject')
+    def test_create_text_with_atlas_font_makes_glyphs(self, text_mobject):
+        text_mobject.side_effect = lambda text_string, color: make_text(text_string)
+        scene = AlgoScene()
+        scene.settings['node_font'] = 'atlas:latex'
+
+        labels = [scene.create_text(text_string, for_node=True, scale=2)
+                  for text_string in ['0', '1', '10', '-11', '101', '1.1']]
+
+        # a text mobject for each character, none for each label
+        assert text_mobject.call_count == 4
+        assert np.allclose(labels[2].get_all_points(),
+                           make_text('10').scale(2).get_all_points())
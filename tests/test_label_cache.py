@@ -0,0 +1,95 @@
+# pylint: disable=R0201
+import hashlib
+from unittest.mock import patch, Mock
+from manimlib.imports import *
+from algomanim.algoscene import AlgoScene
+from algomanim.block_cache import hash_mobject
+from algomanim.label_cache import LabelCache
+
+
+class Label(VGroup):
+    CONFIG = {
+        'fill_opacity': 0.5,
+        'text': 'label',
+    }
+
+
+def make_label():
+    return Label(Square(), Circle().set_fill(RED, 1).shift(UP))
+
+
+class TestLabelCache:
+
+    def test_repeated_label_is_copied(self):
+        cache = LabelCache()
+        make = Mock(side_effect=make_label)
+
+        label1 = cache.get(('1', 'latex', BLACK, 1), make)
+        label2 = cache.get(('1', 'latex', BLACK, 1), make)
+
+        make.assert_called_once()
+        assert label1 is not label2
+        assert np.allclose(label1.get_all_points(), label2.get_all_points())
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_least_recently_used_label_is_evicted(self):
+        cache = LabelCache(max_size=2)
+        make = Mock(side_effect=make_label)
+
+        for text in ['a', 'b', 'a', 'c', 'a', 'b']:
+            cache.get((text, 'latex', BLACK, 1), make)
+
+        # b was evicted by c, a was used since
+        assert make.call_count == 4
+        assert list(cache.labels) == [('a', 'latex', BLACK, 1), ('b', 'latex', BLACK, 1)]
+
+    def test_stored_label_is_loaded_without_making_it(self, tmp_path):
+        key = ('1', 'latex', BLACK, 1.5)
+        label = LabelCache(directory=str(tmp_path)).get(key, make_label)
+        make = Mock(side_effect=make_label)
+
+        cache = LabelCache(directory=str(tmp_path))
+        loaded = cache.get(key, make)
+
+        make.assert_not_called()
+        assert (cache.disk_hits, cache.misses) == (1, 0)
+        assert len(loaded.get_family()) == len(label.get_family())
+        assert (loaded.fill_opacity, loaded.text) == (0.5, 'label')
+        for member, loaded_member in zip(make_label().get_family(), loaded.get_family()):
+            assert np.allclose(member.points, loaded_member.points)
+            assert np.allclose(member.get_fill_rgbas(), loaded_member.get_fill_rgbas())
+            assert np.allclose(member.get_stroke_rgbas(), loaded_member.get_stroke_rgbas())
+
+    def test_label_made_is_kept_as_it_is(self, tmp_path):
+        cache = LabelCache(directory=str(tmp_path))
+
+        labels = [cache.get(('1', 'latex', BLACK, 1), make_label) for _ in range(2)]
+
+        assert cache.hits == 1
+        assert all(isinstance(label, Label) for label in labels)
+        assert all(label.text == 'label' for label in labels)
+
+    def test_labels_made_and_loaded_are_hashed_the_same(self, tmp_path):
+        key = ('1', 'latex', BLACK, 1)
+        made = LabelCache(directory=str(tmp_path)).get(key, make_label)
+        loaded = LabelCache(directory=str(tmp_path)).get(key, make_label)
+        digests = []
+
+        for label in [made, loaded]:
+            digest = hashlib.sha256()
+            hash_mobject(digest, VGroup(Square(), label.shift(LEFT)))
+            digests.append(digest.hexdigest())
+
+        assert not isinstance(loaded, Label)
+        assert digests[0] == digests[1]
+
+    @patch('algomanim.algoscene.TextMobject')
+    def test_create_text_makes_repeated_text_once(self, text_mobject):
+        text_mobject.side_effect = lambda *args, **kwargs: Square()
+        scene = AlgoScene()
+
+        texts = [scene.create_text('1', for_node=True, scale=2) for _ in range(3)]
+
+        text_mobject.assert_called_once_with('1', color=scene.settings['node_font_color'])
+        assert scene.label_cache.hits == 2
+        assert np.allclose(texts[0].get_width(), 4)
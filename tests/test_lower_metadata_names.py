@@ -0,0 +1,46 @@
+# pylint: disable=R0201
+import inspect
+from unittest.mock import patch, Mock
+from algomanim.algolist import AlgoList
+from algomanim.algoscene import AlgoScene
+from algomanim.metadata import LowerMetadata
+
+
+BENCHMARK_LIST = list(range(10, 0, -1))
+
+
+def create_with_stack_inspection(action_pair, val=None, show_in_panel=True):
+    ''' LowerMetadata.create as it was before attach_metadata recorded function names '''
+    currframe = inspect.currentframe()
+    return LowerMetadata(inspect.getouterframes(currframe, 2)[1][3],
+                         action_pair, val, show_in_panel)
+
+
+def plan_bubble_sort():
+    ''' Builds the action pairs and metadata of a bubble sort '''
+    scene = AlgoScene()
+    algolist = AlgoList(scene, BENCHMARK_LIST)
+    for i in range(algolist.len() - 1):
+        for j in range(algolist.len() - 1 - i):
+            algolist.compare(j, j + 1, text=False)
+            if algolist.get_val(j) > algolist.get_val(j + 1):
+                algolist.swap(j, j + 1)
+    return scene
+
+
+def get_lower_names(scene):
+    return [[lower.meta_name for lower in meta_tree.children] for meta_tree in scene.meta_trees]
+
+
+@patch("algomanim.algolist.VGroup", Mock())
+@patch("algomanim.algonode.VGroup", Mock())
+@patch("algomanim.algoscene.TextMobject", Mock())
+@patch("algomanim.algoobject.TexMobject", Mock())
+class TestLowerMetadataNames:
+
+    def test_names_match_stack_inspection(self):
+        scene = plan_bubble_sort()
+        with patch('algomanim.metadata.LowerMetadata.create', create_with_stack_inspection):
+            inspected_scene = plan_bubble_sort()
+
+        assert get_lower_names(scene) == get_lower_names(inspected_scene)
@@ -0,0 +1,68 @@
+# pylint: disable=R0201
+from unittest.mock import Mock
+from algomanim.metadata import Metadata, LowerMetadata, MetadataIndex
+
+
+class TestMetadata:
+
+    def test_find_lower_returns_children_with_name_in_order(self):
+        metadata = Metadata('test')
+        lowers = [LowerMetadata(name, Mock()) for name in ['a', 'b', 'a']]
+        for lower in lowers:
+            metadata.add_lower(lower)
+
+        assert metadata.find_lower('a') == [lowers[0], lowers[2]]
+        assert metadata.find_lower('b') == [lowers[1]]
+        assert metadata.find_lower('c') == []
+
+    def test_find_lower_includes_children_added_after_lookup(self):
+        metadata = Metadata('test')
+        first = LowerMetadata('a', Mock())
+        metadata.add_lower(first)
+        assert metadata.find_lower('a') == [first]
+
+        second = LowerMetadata('a', Mock())
+        metadata.add_lower(second)
+        assert metadata.find_lower('a') == [first, second]
+
+
+class TestLowerMetadata:
+
+    def test_val_filters_none_values(self):
+        lower = LowerMetadata('test', Mock(), [1, None, 2])
+        assert lower.val == [1, 2]
+
+    def test_val_defaults_to_empty_list(self):
+        assert LowerMetadata('test', Mock()).val == []
+
+    def test_val_function_is_called_once_when_val_is_read(self):
+        val_fn = Mock(return_value=[3, None])
+        lower = LowerMetadata('test', Mock(), val_fn)
+        val_fn.assert_not_called()
+
+        assert lower.val == [3]
+        assert lower.val == [3]
+        val_fn.assert_called_once()
+
+
+class TestMetadataIndex:
+
+    def test_find_by_name_returns_metadata_in_order(self):
+        index = MetadataIndex()
+        metas = [Metadata('index_test') for _ in range(3)]
+        other = Metadata('other_index_test')
+        for meta in metas + [other]:
+            index.add(meta)
+
+        assert index.find('index_test') == metas
+        assert index.find('other_index_test') == [other]
+        assert index.find('missing') == []
+
+    def test_find_by_occurence_returns_matching_fid(self):
+        index = MetadataIndex()
+        metas = [Metadata('occurence_test') for _ in range(3)]
+        for meta in metas:
+            index.add(meta)
+
+        assert index.find('occurence_test', metas[1].fid) == [metas[1]]
+        assert index.find('occurence_test', metas[2].fid + 1) == []
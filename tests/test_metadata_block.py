@@ -10,10 +10,11 @@ mock_actpair2 = Mock()
 
 
 def get_empty_metablock():
-    return MetadataBlock('empty', [], 0, 0)
+    return MetadataBlock('empty', [], Mock(start_time=0), Mock(end_time=0))
 
 def get_test_metablock():
-    return MetadataBlock('test', [mock_actpair1, mock_actpair2], 2, 10)
+    return MetadataBlock('test', [mock_actpair1, mock_actpair2],
+                         Mock(start_time=2), Mock(end_time=12))
 
 
 class TestMetadataBlock:
@@ -55,3 +56,19 @@ class TestMetadataBlock:
     def test_end_position_returns_normalised_end_time(self):
         metablock = get_test_metablock()
         assert metablock.end_position() == (2 + 10) * 1000
+
+    def test_runtime_spans_first_to_last_block(self):
+        metablock = get_test_metablock()
+        assert metablock.runtime == 10
+
+    def test_is_active_at_positions_within_block(self):
+        metablock = get_test_metablock()
+        assert not metablock.is_active_at(1999)
+        assert metablock.is_active_at(2000)
+        assert metablock.is_active_at(11999)
+        assert not metablock.is_active_at(12000)
+
+    def test_zero_length_block_is_active_at_its_start(self):
+        metablock = MetadataBlock('test', [], Mock(start_time=2), Mock(end_time=2))
+        assert metablock.is_active_at(2000)
+        assert not metablock.is_active_at(2001)
@@ -0,0 +1,74 @@
+# pylint: disable=R0201
+import random
+from unittest.mock import Mock
+import pytest
+from algomanim.animation_block import AnimationBlock
+from algomanim.block_timings import BlockTimings
+from algomanim.metadata_block import MetadataBlock
+from algomanim.metadata_block_index import MetadataBlockIndex
+
+
+def get_test_index(num_blocks, num_metadata_blocks, seed=0, runtimes=(0, 0.5, 1, 1.5)):
+    rng = random.Random(seed)
+    timings = BlockTimings()
+    anim_blocks = []
+    for _ in range(num_blocks):
+        runtime = rng.choice(runtimes)
+        pair = Mock(**{'get_runtime_val.return_value': runtime})
+        anim_blocks.append(AnimationBlock([pair], timings))
+
+    metadata_blocks = []
+    for _ in range(num_metadata_blocks):
+        first = rng.randrange(num_blocks)
+        last = min(first + rng.choice([0, 0, 1, 3]), num_blocks - 1)
+        metadata_blocks.append(MetadataBlock(Mock(), [], anim_blocks[first], anim_blocks[last]))
+    metadata_blocks.sort(key=lambda block: block.start_time)
+
+    return MetadataBlockIndex(metadata_blocks, timings), metadata_blocks, anim_blocks
+
+
+class TestMetadataBlockIndex:
+
+    def test_find_active_matches_linear_scan(self):
+        index, metadata_blocks, _ = get_test_index(60, 40)
+        end_position = int(metadata_blocks[-1].end_position()) + 1000
+        for position in range(0, end_position, 250):
+            expected = [block for block in metadata_blocks if block.is_active_at(position)]
+            assert index.find_active(position) == expected
+
+    def test_find_active_at_block_boundaries_matches_linear_scan(self):
+        for seed in range(40):
+            # runtimes whose sums are rounded, with runs of zero-length blocks
+            index, metadata_blocks, anim_blocks = get_test_index(
+                80, 60, seed=seed, runtimes=(0, 0, 0, 0.1, 0.15, 1 / 3, 0.7, 1.05))
+            positions = set()
+            for anim_block in anim_blocks:
+                for position in (anim_block.start_time * 1000, anim_block.end_time * 1000):
+                    positions.update([position, round(position), round(position, 6)])
+
+            for position in positions:
+                expected = [block for block in metadata_blocks if block.is_active_at(position)]
+                assert index.find_active(position) == expected
+
+    def test_find_active_follows_runtime_changes(self):
+        index, metadata_blocks, anim_blocks = get_test_index(30, 20, seed=1)
+        anim_blocks[3].first_pair().get_runtime_val.return_value = 4
+        anim_blocks[3].update_runtime()
+
+        end_position = int(metadata_blocks[-1].end_position()) + 1000
+        for position in range(0, end_position, 250):
+            expected = [block for block in metadata_blocks if block.is_active_at(position)]
+            assert index.find_active(position) == expected
+
+    def test_index_returns_position_of_block(self):
+        index, metadata_blocks, _ = get_test_index(10, 10)
+        assert [index.index(block) for block in metadata_blocks] == list(range(10))
+
+    def test_index_of_missing_block_throws_error(self):
+        index, _, _ = get_test_index(10, 10)
+        with pytest.raises(ValueError):
+            index.index(Mock())
+
+    def test_empty_index_finds_nothing(self):
+        index = MetadataBlockIndex([], BlockTimings())
+        assert index.find_active(0) == []
@@ -0,0 +1,133 @@
+# pylint: disable=R0201
+import hashlib
+from unittest.mock import patch, Mock, MagicMock
+from manimlib.imports import *
+from algomanim.algoscene import AlgoScene
+from algomanim.scene_checkpoint import SceneCheckpoints
+from gui import custom_renderer
+from gui.video_quality import VideoQuality
+
+
+class CircleScene(AlgoScene):
+    def algo(self):
+        circle = Circle()
+        square = Square().shift(LEFT)
+        self.add_transform(custom_transform=FadeIn, args=[circle])
+        self.add_transform(custom_transform=FadeIn, args=[square])
+        for color in [RED, GREEN, BLUE]:
+            self.add_transform(custom_transform=ApplyMethod, args=[circle.set_fill, color, 1])
+            self.add_transform(custom_transform=ApplyMethod, args=[square.shift, RIGHT])
+        self.add_wait(len(self.action_pairs))
+        self.add_transform(custom_transform=FadeOut, args=[circle])
+
+
+def render_frame_hashes(**kwargs):
+    ''' Renders CircleScene and returns the hash of every frame written '''
+    frame_hashes = []
+    add_frames = Scene.add_frames
+
+    def record_frames(scene, *frames):
+        if not scene.skip_animations:
+            frame_hashes.extend(hashlib.md5(frame.tobytes()).hexdigest() for frame in frames)
+        add_frames(scene, *frames)
+
+    with patch.object(Scene, 'add_frames', autospec=True, side_effect=record_frames):
+        scene = CircleScene(camera_config=LOW_QUALITY_CAMERA_CONFIG, **kwargs)
+    return scene, frame_hashes
+
+
+class TestParallelRender:
+
+    def test_chunks_cover_every_play_once(self):
+        serial_scene, _ = render_frame_hashes()
+        chunk_plays = [render_frame_hashes(render_chunk=(index, 3))[0].chunk_plays
+                       for index in range(3)]
+
+        assert [play for plays in chunk_plays for play in plays] == \
+            list(range(serial_scene.num_plays))
+
+    def test_chunked_frames_match_serial_frames(self):
+        _, serial_hashes = render_frame_hashes()
+        chunked_hashes = []
+        for index in range(3):
+            chunked_hashes += render_frame_hashes(render_chunk=(index, 3))[1]
+
+        assert chunked_hashes == serial_hashes
+
+    def test_chunk_scene_has_metadata_of_whole_scene(self):
+        serial_scene, _ = render_frame_hashes()
+        chunk_scene, _ = render_frame_hashes(render_chunk=(0, 3))
+
+        assert len(chunk_scene.metadata_blocks) == len(serial_scene.metadata_blocks)
+
+
+@patch.object(custom_renderer, 'create_scene')
+class TestCustomRenderer:
+
+    def test_checkpoints_are_kept_for_the_next_render_of_the_scene(self, create_scene, tmp_path):
+        with patch.object(custom_renderer, 'CHECKPOINTS', {}), \
+                patch.object(custom_renderer, 'CHECKPOINT_DIR', str(tmp_path)):
+            for _ in range(2):
+                custom_renderer.custom_renderer('scene.py', 'Scene', VideoQuality.low, [], {},
+                                                checkpoints=True)
+            custom_renderer.custom_renderer('scene.py', 'Scene', VideoQuality.low, [], {})
+
+        checkpoints = [call[1]['checkpoints'] for call in create_scene.call_args_list]
+        assert isinstance(checkpoints[0], SceneCheckpoints)
+        assert checkpoints[1] is checkpoints[0]
+        assert checkpoints[2] is None
+        assert (tmp_path / 'Scene.pickle').exists()
+
+    @patch.object(custom_renderer, 'BlockVideoCache')
+    def test_block_cache_is_used_only_when_asked_for(self, block_video_cache, create_scene,
+                                                    tmp_path):
+        with patch.object(custom_renderer, 'CHECKPOINTS', {}), \
+                patch.object(custom_renderer, 'CHECKPOINT_DIR', str(tmp_path)):
+            custom_renderer.custom_renderer('scene.py', 'Scene', VideoQuality.low, [], {})
+            custom_renderer.custom_renderer('scene.py', 'Scene', VideoQuality.low, [], {},
+                                            block_cache=True)
+            custom_renderer.custom_renderer('scene.py', 'Scene', VideoQuality.low, [], {},
+                                            checkpoints=True)
+            custom_renderer.plan_scene('scene.py', 'Scene', VideoQuality.low, [], {})
+
+        block_caches = [call[1].get('block_cache') for call in create_scene.call_args_list]
+        assert block_caches == [None, block_video_cache.return_value,
+                                block_video_cache.return_value, None]
+
+    def test_chunks_are_joined_in_play_order_and_removed(self, create_scene, tmp_path):
+        plays = 5
+
+        def chunk_scene(*_args, file_name=None, render_chunk=None, **_kwargs):
+            index, count = render_chunk
+            name = file_name or 'Scene'
+            scene = Mock()
+            scene.file_writer.partial_movie_directory = str(tmp_path / name)
+            scene.file_writer.movie_file_extension = '.mp4'
+            scene.file_writer.get_movie_file_path.return_value = str(tmp_path / f'{name}.mp4')
+            scene.chunk_plays = range(index * plays // count, (index + 1) * plays // count)
+            (tmp_path / f'{name}.mp4').write_bytes(b'')
+            return scene
+
+        listed_files = []
+
+        def concat(command, **_kwargs):
+            with open(command[command.index('-i') + 1]) as list_file:
+                listed_files.extend(line.strip() for line in list_file)
+
+        create_scene.side_effect = chunk_scene
+        context = MagicMock()
+        pool = context.Pool.return_value.__enter__.return_value
+        pool.map_async.side_effect = \
+            lambda render, indexes: Mock(get=Mock(return_value=[render(i) for i in indexes]))
+        with patch.object(custom_renderer.multiprocessing, 'get_context', return_value=context), \
+                patch.object(custom_renderer.subprocess, 'run', side_effect=concat) as run:
+            custom_renderer.custom_renderer('scene.py', 'Scene', VideoQuality.low, [], {},
+                                            workers=3)
+
+        assert run.call_args[0][0][-1] == str(tmp_path / 'Scene.mp4')
+        assert listed_files == [
+            f"file 'file:{tmp_path / name / f'{play:05}.mp4'}'"
+            for name, chunk_plays in [('Scene', [0]), ('Scene_chunk1', [1, 2]),
+                                      ('Scene_chunk2', [3, 4])]
+            for play in chunk_plays]
+        assert sorted(path.name for path in tmp_path.iterdir()) == ['Scene.mp4']
@@ -0,0 +1,157 @@
+# pylint: disable=R0201
+from types import SimpleNamespace
+from unittest.mock import patch
+from manimlib.imports import *
+from algomanim.algoaction import AlgoTransform, AlgoSceneAction, AlgoSceneActionPair, \
+    EMPTY_ACTION
+from algomanim.algoscene import AlgoScene
+from algomanim.algolist import AlgoList
+from algomanim.algoobject import AlgoObject
+from algomanim.metadata import Metadata, LowerMetadata
+from algomanim.peephole import optimize_action_pairs
+
+
+def add_fill(scene, square, color, w_prev=False):
+    ''' Adds an action pair animating the fill of square like AlgoNode.highlight '''
+    anim_action = scene.create_play_action(
+        AlgoTransform([square.set_fill, color], transform=ApplyMethod, color_index=1),
+        w_prev=w_prev)
+    static_action = AlgoSceneAction.create_static_action(square.set_fill, [color])
+    return scene.add_action_pair(anim_action, static_action)
+
+def add_static(scene, function, args):
+    static_action = AlgoSceneAction.create_static_action(function, args)
+    return scene.add_action_pair(static_action, static_action, animated=False)
+
+
+class TestPeephole:
+
+    def test_fill_repeating_previous_block_is_skipped(self):
+        scene = AlgoScene()
+        squares = [Square(), Square()]
+        for i, square in enumerate(squares):
+            add_fill(scene, square, YELLOW, w_prev=i > 0)
+        repeats = [add_fill(scene, square, YELLOW, w_prev=i > 0)
+                   for i, square in enumerate(squares)]
+
+        report = optimize_action_pairs(scene.action_pairs, frame_rate=15)
+        scene.create_animation_blocks(scene.action_pairs, scene.anim_blocks)
+
+        assert report == (2, 1, 15)
+        assert [block.is_static() for block in scene.anim_blocks] == [False, True]
+        assert all(action_pair.get_runtime() == 0 for action_pair in repeats)
+        scene.anim_blocks[1].run()
+        assert squares[1].get_fill_color() == Color(YELLOW)
+
+    def test_bulk_fill_repeating_previous_block_is_skipped(self):
+        scene = AlgoScene()
+        squares = [Square(), Square()]
+        objs = [SimpleNamespace(scene=scene, val=i) for i in range(2)]
+        for _ in range(2):
+            AlgoObject.bulk_fn_w_prev(objs, AlgoObject.fill_all, AlgoObject.static_fill_all,
+                                      [YELLOW] + squares, 'fill', metadata=Metadata('fill'),
+                                      animated=True, w_prev=False, color_index=0)
+
+        report = optimize_action_pairs(scene.action_pairs, frame_rate=15)
+
+        assert report == (1, 1, 15)
+        assert scene.action_pairs[0].get_runtime() is None
+        assert scene.action_pairs[1].get_runtime() == 0
+
+    def test_highlight_and_dehighlight_are_kept(self):
+        scene = AlgoScene()
+        squares = [Square(), Square()]
+        for color in [YELLOW, WHITE, YELLOW]:
+            for i, square in enumerate(squares):
+                add_fill(scene, square, color, w_prev=i > 0)
+
+        report = optimize_action_pairs(scene.action_pairs, frame_rate=15)
+
+        assert report == (0, 0, 0)
+        assert all(action_pair.get_runtime() is None for action_pair in scene.action_pairs)
+
+    def test_fill_not_repeated_is_kept(self):
+        scene = AlgoScene()
+        squares = [Square(), Square(), Square()]
+        add_fill(scene, squares[0], YELLOW)
+        add_fill(scene, squares[1], YELLOW, w_prev=True)
+        add_fill(scene, squares[0], YELLOW)
+        add_fill(scene, squares[1], WHITE, w_prev=True)
+        add_fill(scene, squares[0], WHITE)
+        add_fill(scene, squares[2], WHITE, w_prev=True)
+
+        report = optimize_action_pairs(scene.action_pairs, frame_rate=15)
+
+        assert report == (0, 0, 0)
+        assert all(action_pair.get_runtime() is None for action_pair in scene.action_pairs)
+
+    def test_customized_runtime_is_kept(self):
+        scene = AlgoScene()
+        square = Square()
+        add_fill(scene, square, YELLOW)
+        add_fill(scene, square, YELLOW).set_runtime(2)
+
+        assert optimize_action_pairs(scene.action_pairs, frame_rate=15) == (0, 0, 0)
+        assert scene.action_pairs[1].get_runtime() == 2
+
+    def test_pair_that_cannot_be_skipped_is_kept(self):
+        scene = AlgoScene()
+        square = Square()
+        add_fill(scene, square, YELLOW)
+        # like add_transform, the animation is also the static action
+        anim_action = scene.create_play_action(
+            AlgoTransform([square.set_fill, YELLOW], transform=ApplyMethod))
+        scene.insert_action_pair(AlgoSceneActionPair(anim_action, anim_action))
+
+        assert optimize_action_pairs(scene.action_pairs, frame_rate=15) == (0, 0, 0)
+        assert scene.action_pairs[1].get_runtime() is None
+
+    def test_repeated_idempotent_call_is_emptied(self):
+        scene = AlgoScene()
+        square = Square()
+        add_static(scene, square.set_fill, [RED])
+        repeated = add_static(scene, square.set_fill, [RED])
+        metadata = Metadata('fill')
+        metadata.add_lower(LowerMetadata('set_fill', repeated))
+
+        report = optimize_action_pairs(scene.action_pairs, frame_rate=15)
+
+        assert report == (1, 0, 0)
+        assert repeated.curr_action() is EMPTY_ACTION
+        assert scene.action_pairs[0].curr_action() is not EMPTY_ACTION
+        assert metadata.get_all_action_pairs() == [repeated]
+
+    def test_overwritten_placement_is_emptied(self):
+        scene = AlgoScene()
+        square, circle = Square(), Circle()
+        add_static(scene, square.move_to, [LEFT])
+        add_static(scene, square.next_to, [circle, RIGHT])
+        # relative to the square, so the placement before it is used
+        add_static(scene, square.next_to, [square, RIGHT])
+
+        report = optimize_action_pairs(scene.action_pairs, frame_rate=15)
+
+        assert report == (1, 0, 0)
+        assert [action_pair.curr_action() is EMPTY_ACTION
+                for action_pair in scene.action_pairs] == [True, False, False]
+
+    @patch('algomanim.algoscene.TextMobject', lambda *args, **kwargs: Square(side_length=0.1))
+    def test_repeated_shifts_are_kept(self):
+        centers = []
+        for optimize in [False, True]:
+            scene = AlgoScene()
+            algolist = AlgoList(scene, [1, 2])
+            start = len(scene.action_pairs)
+            # each shift places the list next to itself
+            for _ in range(2):
+                scene.shift_scene(UP)
+            scene.skip(start)
+            if optimize:
+                optimize_action_pairs(scene.action_pairs, frame_rate=15)
+            for action_pair in scene.action_pairs:
+                action_pair.run()
+            centers.append(algolist.grp.get_center())
+
+        shift = algolist.grp.get_height() + DEFAULT_MOBJECT_TO_MOBJECT_BUFFER
+        assert np.allclose(centers[0], 2 * shift * UP)
+        assert np.allclose(centers[1], centers[0])
@@ -0,0 +1,210 @@
+# pylint: disable=R0201
+import hashlib
+from unittest.mock import Mock, patch
+import pytest
+from manimlib.imports import *
+from algomanim.algoaction import AlgoTransform, AlgoSceneAction
+from algomanim.algoscene import AlgoScene
+from algomanim.frame_regions import pixel_transform, pixel_bounds, clip_bounds
+from algomanim.scene_checkpoint import MobjectRegistry, SceneCheckpoint, SceneCheckpoints, \
+    prefix_hashes
+
+
+def apply_shift(*_):
+    ''' Act of the test blocks, unlike static actions they are not fused into one block '''
+
+
+def get_planned_scene(directions, tmp_path):
+    ''' Scene with a circle and one block shifting it for each direction '''
+    scene = AlgoScene()
+    circle = Circle()
+    scene.add(circle)
+    for direction in directions:
+        action = AlgoSceneAction(apply_shift, AlgoTransform([direction], transform=circle.shift))
+        scene.add_action_pair(action, action, animated=False)
+    scene.create_animation_blocks(scene.action_pairs, scene.anim_blocks)
+
+    scene.file_writer = Mock(write_to_movie=True, movie_file_extension='.mp4',
+                             partial_movie_directory=str(tmp_path))
+    scene.skip_animations = False
+    scene.num_plays = 0
+    scene.block_cache = get_block_cache(tmp_path)
+    return scene, circle
+
+def get_played_scene(directions, tmp_path):
+    ''' Scene with a circle and one play moving it for each direction, collecting its frames '''
+    scene = AlgoScene(camera_config=LOW_QUALITY_CAMERA_CONFIG)
+    circle = Circle(radius=0.5).set_fill(BLUE, 1)
+    scene.add(circle)
+    for direction in directions:
+        action = scene.create_play_action(
+            AlgoTransform([circle.shift, direction], transform=ApplyMethod))
+        scene.add_action_pair(action, action)
+    scene.create_animation_blocks(scene.action_pairs, scene.anim_blocks)
+    for anim_block in scene.anim_blocks:
+        anim_block.first_pair().set_runtime(0.2)
+
+    scene.file_writer = Mock(write_to_movie=True, movie_file_extension='.mp4',
+                             partial_movie_directory=str(tmp_path))
+    scene.skip_animations = False
+    scene.num_plays = 0
+    scene.block_cache = get_block_cache(tmp_path)
+    # plays count themselves
+    scene.block_cache.run_block.side_effect = lambda scene, anim_block: \
+        anim_block.run() or f'key{anim_block.position}'
+    frames = []
+    scene.add_frames = lambda *new_frames: frames.extend(np.array(f) for f in new_frames)
+    return scene, circle, frames
+
+def render_frames(checkpoints, directions, tmp_path):
+    scene, circle, frames = get_played_scene(directions, tmp_path)
+    checkpoints.run_blocks(scene)
+    return scene, circle, frames
+
+def paint(camera, vmobjects, pixel_array):
+    ''' Draws the bounds of vmobjects in a colour depending on how they are drawn '''
+    transform = pixel_transform(camera)
+    for vmobject, rect in zip(vmobjects, pixel_bounds(vmobjects, transform)):
+        rect = clip_bounds(rect, pixel_array)
+        if rect is not None:
+            left, top, right, bottom = rect
+            color = hashlib.md5(vmobject.fill_rgbas.tobytes()).digest()[:4]
+            pixel_array[top:bottom, left:right] = np.frombuffer(color, dtype=np.uint8)
+
+def get_block_cache(tmp_path):
+    movie_path = tmp_path / 'cached.mp4'
+    movie_path.write_bytes(b'0')
+
+    def run_block(scene, anim_block):
+        anim_block.run()
+        scene.num_plays += 1
+        return f'key{anim_block.position}'
+
+    return Mock(run_block=Mock(side_effect=run_block),
+                get=Mock(return_value=str(movie_path)))
+
+
+class TestSceneCheckpoints:
+
+    def test_prefix_hashes_change_after_changed_block(self, tmp_path):
+        scene1, _ = get_planned_scene([RIGHT, RIGHT, RIGHT], tmp_path)
+        scene2, _ = get_planned_scene([RIGHT, UP, RIGHT], tmp_path)
+
+        hashes1 = prefix_hashes(scene1)
+        hashes2 = prefix_hashes(scene2)
+
+        assert len(hashes1) == 4
+        assert hashes1[:2] == hashes2[:2]
+        assert hashes1[2] != hashes2[2]
+        assert hashes1[3] != hashes2[3]
+
+    def test_checkpoint_restores_captured_state(self, tmp_path):
+        scene, circle = get_planned_scene([], tmp_path)
+        registry = MobjectRegistry(scene)
+        registry.register(circle)
+        circle.set_fill(RED)
+        points = circle.points.copy()
+        checkpoint = SceneCheckpoint(0, scene, registry, ['key'])
+
+        circle.shift(LEFT)
+        circle.set_fill(BLUE)
+        scene.remove(circle)
+        checkpoint.restore(scene, registry)
+
+        assert np.array_equal(circle.points, points)
+        assert circle.get_fill_color() == Color(RED)
+        assert scene.mobjects == [circle]
+        assert scene.num_plays == 1
+
+    def test_checkpoint_of_unregistered_mobject_raises_error(self, tmp_path):
+        scene, _ = get_planned_scene([], tmp_path)
+        with pytest.raises(ValueError):
+            SceneCheckpoint(0, scene, MobjectRegistry(scene), [])
+
+    def test_run_blocks_resumes_from_last_unchanged_checkpoint(self, tmp_path):
+        checkpoints = SceneCheckpoints(every_blocks=2)
+        scene1, _ = get_planned_scene([RIGHT] * 6, tmp_path)
+        checkpoints.run_blocks(scene1)
+        assert sorted(c.position for c in checkpoints.checkpoints.values()) == [2, 4]
+
+        scene2, circle2 = get_planned_scene([RIGHT] * 5 + [UP], tmp_path)
+        checkpoints.run_blocks(scene2)
+
+        assert checkpoints.resumed_at == 4
+        assert scene2.block_cache.run_block.call_count == 2
+        assert scene2.num_plays == 6
+        assert np.allclose(circle2.get_center(), 5 * RIGHT + UP)
+
+    def test_checkpoints_stored_on_disk_resume_a_later_render(self, tmp_path):
+        checkpoints = SceneCheckpoints(every_blocks=2)
+        scene1, _ = get_planned_scene([RIGHT] * 6, tmp_path)
+        checkpoints.run_blocks(scene1)
+        checkpoints.save(str(tmp_path / 'checkpoints' / 'scene.pickle'))
+
+        loaded = SceneCheckpoints(every_blocks=2)
+        loaded.load(str(tmp_path / 'checkpoints' / 'scene.pickle'))
+        scene2, circle2 = get_planned_scene([RIGHT] * 5 + [UP], tmp_path)
+        loaded.run_blocks(scene2)
+
+        assert loaded.resumed_at == 4
+        assert np.allclose(circle2.get_center(), 5 * RIGHT + UP)
+
+    def test_unreadable_checkpoints_are_not_loaded(self, tmp_path):
+        path = tmp_path / 'scene.pickle'
+        path.write_bytes(b'not a pickle')
+        checkpoints = SceneCheckpoints()
+
+        checkpoints.load(str(path))
+        checkpoints.load(str(tmp_path / 'missing.pickle'))
+
+        assert not checkpoints.checkpoints
+
+    def test_run_blocks_without_checkpoint_runs_all_blocks(self, tmp_path):
+        checkpoints = SceneCheckpoints(every_blocks=2)
+        scene1, _ = get_planned_scene([RIGHT] * 4, tmp_path)
+        checkpoints.run_blocks(scene1)
+
+        scene2, circle2 = get_planned_scene([LEFT] + [RIGHT] * 3, tmp_path)
+        checkpoints.run_blocks(scene2)
+
+        assert checkpoints.resumed_at == 0
+        assert scene2.block_cache.run_block.call_count == 4
+        assert np.allclose(circle2.get_center(), 2 * RIGHT)
+
+
+@patch.object(Camera, 'display_multiple_non_background_colored_vmobjects', paint)
+class TestSceneCheckpointsFrames:
+
+    def test_resumed_render_draws_the_frames_of_a_full_render(self, tmp_path):
+        directions = [RIGHT, UP, RIGHT, DOWN]
+        checkpoints = SceneCheckpoints(every_blocks=2)
+        render_frames(checkpoints, directions + [LEFT], tmp_path)
+
+        _, _, resumed_frames = render_frames(checkpoints, directions + [UP], tmp_path)
+        _, _, full_frames = render_frames(SceneCheckpoints(every_blocks=2),
+                                          directions + [UP], tmp_path)
+
+        assert checkpoints.resumed_at == 4
+        assert 0 < len(resumed_frames) < len(full_frames)
+        assert all((frame == full_frame).all() for frame, full_frame
+                   in zip(resumed_frames, full_frames[-len(resumed_frames):]))
+
+    def test_scene_with_updaters_is_rendered_whole(self, tmp_path):
+        checkpoints = SceneCheckpoints(every_blocks=2)
+        scene, circle, _ = get_played_scene([RIGHT] * 4, tmp_path)
+        circle.add_updater(lambda mobject, dt: mobject.rotate(dt))
+        checkpoints.run_blocks(scene)
+
+        assert not checkpoints.checkpoints
+
+    def test_registry_of_other_types_is_rendered_whole(self, tmp_path):
+        checkpoints = SceneCheckpoints(every_blocks=2)
+        render_frames(checkpoints, [RIGHT] * 4, tmp_path)
+        for checkpoint in checkpoints.checkpoints.values():
+            checkpoint.types = [Square if member_type is Circle else member_type
+                                for member_type in checkpoint.types]
+
+        _, circle, _ = render_frames(checkpoints, [RIGHT] * 3 + [UP], tmp_path)
+
+        assert checkpoints.resumed_at == 0
+        assert np.allclose(circle.get_center(), 3 * RIGHT + UP)
@@ -0,0 +1,89 @@
+# pylint: disable=R0201
+import cairo
+import pytest
+from manimlib.imports import *
+from algomanim.frame_regions import pixel_transform
+from algomanim.sprite_camera import SpriteCamera, Sprite
+
+
+# sprites are rasterized and shapes drawn by pycairo
+needs_cairo = pytest.mark.skipif(not hasattr(cairo, 'version_info'),
+                                 reason='pycairo is not installed')
+
+
+def make_camera(camera_class=SpriteCamera):
+    return camera_class(pixel_width=192, pixel_height=108)
+
+
+class TestSpriteCamera:
+
+    @needs_cairo
+    def test_identical_shapes_share_a_sprite(self):
+        camera = make_camera()
+        squares = VGroup(*[Square(side_length=1).set_fill(BLUE, 1).shift(2 * i * RIGHT)
+                           for i in range(-2, 3)])
+
+        for _ in range(2):
+            camera.capture_mobjects([squares])
+
+        # the first square is drawn with cairo, then its sprite is made and reused
+        assert len(camera.sprites) == 1
+        assert (camera.sprite_misses, camera.sprite_hits) == (1, 9)
+
+    @needs_cairo
+    def test_frames_are_drawn_like_with_the_default_camera(self):
+        # shapes at sub-pixel offsets sharing sprites, with strokes and labels
+        shapes = VGroup(*[
+            VGroup(Square(side_length=0.6).set_fill(BLUE, 1),
+                   Circle(radius=0.15).set_fill(RED, 0.5).set_stroke(WHITE, 2))
+            .shift(0.83 * i * RIGHT + 0.37 * (i % 3) * UP) for i in range(-5, 6)])
+        frames = []
+        for camera_class in [MovingCamera, SpriteCamera]:
+            camera = make_camera(camera_class)
+            for _ in range(3):
+                camera.reset()
+                camera.capture_mobjects([shapes])
+            frames.append(camera.pixel_array.astype(int))
+
+        difference = np.abs(frames[0] - frames[1])
+        # an edge moved by at most half a sub-pixel step in x and y covers a pixel that much more
+        max_shift = np.sqrt(2) / (2 * camera.sprite_subpixel_steps)
+        assert camera.sprite_hits > 0
+        assert difference.max() <= np.ceil(2 * np.sqrt(2) * max_shift * 255)
+        # only pixels on the edges of shapes drawn from sprites differ
+        assert (difference == 0).all(axis=2).mean() > 0.9
+
+    def test_colour_and_size_are_part_of_the_sprite(self):
+        camera = make_camera()
+        transform = pixel_transform(camera)
+        square = Square(side_length=1).set_fill(BLUE, 1)
+        key, _ = camera.sprite_key(square, transform)
+
+        assert camera.sprite_key(square.copy().shift(2 * UP), transform)[0] == key
+        assert camera.sprite_key(square.copy().set_fill(RED, 1), transform)[0] != key
+        assert camera.sprite_key(square.copy().scale(1.5), transform)[0] != key
+
+    @needs_cairo
+    def test_rotating_shape_is_drawn_with_cairo(self):
+        camera = make_camera()
+        square = Square(side_length=1)
+
+        for _ in range(5):
+            camera.capture_mobjects([square])
+            square.rotate(PI / 20)
+
+        assert not camera.sprites
+        assert camera.sprite_misses == 5
+
+    def test_sprite_is_composited_over_the_frame(self):
+        camera = make_camera()
+        pixel_array = np.full((4, 4, 4), 200, dtype='uint8')
+        # premultiplied half transparent pixels
+        pixels = np.full((3, 3, 4), 64, dtype='uint16')
+        pixels[:, :, 3] = 128
+
+        camera.composite_sprite(pixel_array, Sprite(pixels, np.repeat(255 - pixels[:, :, 3:], 4, axis=2)),
+                                np.array([2, -1]))
+
+        assert (pixel_array[:2, 2:] == [164, 164, 164, 228]).all()
+        assert (pixel_array[2:, :] == 200).all() and (pixel_array[:, :2] == 200).all()
@@ -0,0 +1,171 @@
+# pylint: disable=R0201
+import os
+import shutil
+from unittest.mock import patch, Mock
+import pytest
+from manimlib.imports import *
+from manimlib.utils.tex_file_writing import tex_to_svg_file
+import manimlib.constants as consts
+from algomanim.algonode import AlgoNode
+from algomanim.algoscene import AlgoScene
+from algomanim.tex_batch import TexBatch, BATCH_DOCUMENT_CLASS, text_expressions, \
+    tex_file_path
+
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg"><path d="M 0 0 L 1 0 L 1 1 Z"/></svg>'
+
+
+def fake_run(args, extra_pages=0, **_):
+    ''' Stands in for latex and dvisvgm, writing their files and one SVG per page of the batch '''
+    if args[0] == 'latex':
+        name = args[-1].replace('.tex', '')
+        for extension in ['.aux', '.log', '.dvi']:
+            open(name + extension, 'w').close()
+    if args[0] == 'dvisvgm':
+        name = args[-1].replace('-%p.svg', '')
+        with open(name + '.tex') as tex_file:
+            num_pages = tex_file.read().count('\\begin{standalone}')
+        for page in range(1, num_pages + extra_pages + 1):
+            with open(f'{name}-{page}.svg', 'w') as svg_file:
+                svg_file.write(f'{SVG}<!--{page}-->')
+    return Mock(returncode=0)
+
+
+def batch_files(directory):
+    return [path for path in directory.iterdir() if path.name.startswith('batch_')]
+
+
+class TestTexBatch:
+
+    def test_text_expressions_are_compiled_by_text_mobject(self, tmp_path):
+        svg_path = tmp_path / 'text.svg'
+        svg_path.write_text(SVG)
+        compiled = []
+
+        def tex_to_svg_file(expression, template):
+            compiled.append((expression, template))
+            return str(svg_path)
+
+        with patch('manimlib.mobject.svg.tex_mobject.tex_to_svg_file', tex_to_svg_file):
+            TextMobject('42')
+
+        assert compiled == text_expressions('42')
+
+    @patch('algomanim.tex_batch.subprocess.run')
+    def test_pending_texts_are_compiled_in_one_run(self, run, tmp_path):
+        batch = TexBatch()
+        sources = []
+
+        def read_source_and_run(args, **kwargs):
+            if args[0] == 'latex':
+                with open(args[-1]) as tex_file:
+                    sources.append(tex_file.read())
+            return fake_run(args, **kwargs)
+
+        run.side_effect = read_source_and_run
+        with patch.object(consts, 'TEX_DIR', str(tmp_path)):
+            for text in ['1', '2', '3']:
+                batch.request_text(text)
+            batch.compile_pending()
+
+            expressions = [expression for text in ['1', '2', '3']
+                           for expression in text_expressions(text)]
+            for page, (expression, template) in enumerate(expressions, start=1):
+                with open(tex_file_path(expression, template, '.svg')) as svg_file:
+                    assert svg_file.read().endswith(f'<!--{page}-->')
+                assert os.path.exists(tex_file_path(expression, template, '.dvi'))
+
+        assert run.call_count == 2
+        assert (batch.runs, batch.compiled) == (1, len(expressions))
+        assert not batch.pending
+        assert BATCH_DOCUMENT_CLASS in sources[0]
+        assert not batch_files(tmp_path)
+
+    @patch('algomanim.tex_batch.subprocess.run',
+           side_effect=lambda args, **kwargs: fake_run(args, extra_pages=1, **kwargs))
+    def test_files_of_a_batch_left_to_manim_are_removed(self, run, tmp_path):
+        batch = TexBatch()
+        with patch.object(consts, 'TEX_DIR', str(tmp_path)):
+            batch.request_text('1')
+            batch.compile_pending()
+
+        assert batch.compiled == 0
+        assert run.call_count == 2
+        assert not list(tmp_path.iterdir())
+
+    @patch('algomanim.tex_batch.subprocess.run', side_effect=fake_run)
+    def test_compiled_texts_are_not_requested_again(self, run, tmp_path):
+        batch = TexBatch()
+        with patch.object(consts, 'TEX_DIR', str(tmp_path)):
+            batch.request_text('1')
+            batch.compile_pending()
+            batch.request_text('1')
+
+        assert not batch.pending
+
+    @patch('algomanim.tex_batch.subprocess.run',
+           side_effect=FileNotFoundError('latex is not installed'))
+    def test_failed_batch_is_left_to_manim(self, run, tmp_path):
+        batch = TexBatch()
+        with patch.object(consts, 'TEX_DIR', str(tmp_path)):
+            batch.request_text('1')
+            batch.request_text('2')
+            batch.compile_pending()
+
+        run.assert_called_once()
+        assert (batch.runs, batch.compiled) == (1, 0)
+        assert not any(path.suffix == '.svg' for path in tmp_path.iterdir())
+
+    @pytest.mark.skipif(not (shutil.which('latex') and shutil.which('dvisvgm')),
+                        reason='latex and dvisvgm are not installed')
+    def test_pages_are_drawn_like_texts_compiled_by_manim(self, tmp_path):
+        texts = ['1', '42', 'a + b', '$x^2$']
+        expressions = [expression for text in texts for expression in text_expressions(text)]
+        (tmp_path / 'manim').mkdir()
+        (tmp_path / 'batch').mkdir()
+
+        with patch.object(consts, 'TEX_DIR', str(tmp_path / 'manim')):
+            manim_paths = [tex_to_svg_file(expression, template)
+                           for expression, template in expressions]
+        with patch.object(consts, 'TEX_DIR', str(tmp_path / 'batch')):
+            batch = TexBatch()
+            for text in texts:
+                batch.request_text(text)
+            batch.compile_pending()
+            batch_paths = [tex_file_path(expression, template, '.svg')
+                           for expression, template in expressions]
+
+        assert batch.compiled == len(expressions)
+        assert not batch_files(tmp_path / 'batch')
+        for manim_path, batch_path in zip(manim_paths, batch_paths):
+            manim_svg, batch_svg = SVGMobject(manim_path), SVGMobject(batch_path)
+            assert len(manim_svg.get_family()) == len(batch_svg.get_family())
+            assert np.allclose(manim_svg.get_all_points(), batch_svg.get_all_points(),
+                               atol=1e-3)
+
+    @patch('algomanim.algonode.VGroup', Mock())
+    def test_nodes_request_their_text_when_created(self):
+        tex_batch = Mock()
+        scene = AlgoScene(tex_batch=tex_batch)
+
+        AlgoNode(scene, 5)
+
+        tex_batch.request_text.assert_called_once_with('5')
+        tex_batch.compile_pending.assert_not_called()
+
+    @patch('algomanim.tex_batch.subprocess.run', side_effect=fake_run)
+    def test_values_set_by_change_value_are_compiled_once_each(self, run, tmp_path):
+        with patch.object(consts, 'TEX_DIR', str(tmp_path)):
+            tex_batch = TexBatch()
+            scene = AlgoScene(tex_batch=tex_batch)
+            nodes = [AlgoNode(scene, val) for val in [1, 2, 3, 4]]
+            for node, val in [(0, 5), (1, 5), (2, 1), (3, 6), (0, 7), (3, 5)]:
+                nodes[node].change_value(val)
+
+        # the labels of the nodes are compiled together when the first is made, every value
+        # not made before is compiled when change_value makes it
+        assert tex_batch.runs == 4
+        assert tex_batch.compiled == sum(len(text_expressions(str(val)))
+                                         for val in [1, 2, 3, 4, 5, 6, 7])
+        assert run.call_count == 2 * tex_batch.runs
+        assert [node.txt.get_tex_string() for node in nodes] == ['7', '5', '1', '5']